@@ -0,0 +1,87 @@
+"""
+Compares dict backed ``jet.ordered_set.OrderedSet`` with the previous linked list implementation.
+
+Run from repository root::
+
+    python benchmarks/ordered_set.py
+"""
+
+import os
+import sys
+import timeit
+from collections.abc import MutableSet
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from jet.ordered_set import OrderedSet  # noqa: E402
+
+
+class LinkedOrderedSet(MutableSet):
+    def __init__(self, iterable=None):
+        self.end = end = []
+        end += [None, end, end]  # sentinel node for doubly linked list
+        self.map = {}  # key --> [key, prev, next]
+        if iterable is not None:
+            self |= iterable
+
+    def __len__(self):
+        return len(self.map)
+
+    def __contains__(self, key):
+        return key in self.map
+
+    def add(self, key):
+        if key not in self.map:
+            end = self.end
+            curr = end[1]
+            curr[2] = end[1] = self.map[key] = [key, curr, end]
+
+    def discard(self, key):
+        if key in self.map:
+            key, prev, next = self.map.pop(key)
+            prev[2] = next
+            next[1] = prev
+
+    def __iter__(self):
+        end = self.end
+        curr = end[2]
+        while curr is not end:
+            yield curr[0]
+            curr = curr[2]
+
+    def pop(self, last=True):
+        if not self:
+            raise KeyError("set is empty")
+        key = self.end[1][0] if last else self.end[2][0]
+        self.discard(key)
+        return key
+
+
+# roughly what Dashboard.media merges: a few dozen static files with many duplicates
+FILES = ["jet.dashboard/vendor/file%d.js" % (i % 40) for i in range(200)]
+
+
+def merge(cls):
+    unique = cls()
+    for name in FILES:
+        unique.add(name)
+    return list(unique)
+
+
+def construct_and_drain(cls):
+    unique = cls(FILES)
+    while unique:
+        unique.pop()
+
+
+def main():
+    number = 2000
+
+    for name, func in (("merge", merge), ("construct and pop", construct_and_drain)):
+        for cls in (LinkedOrderedSet, OrderedSet):
+            duration = timeit.timeit(lambda: func(cls), number=number)
+            sys.stdout.write("%-18s %-17s %8.2f us/op\n" % (name, cls.__name__, duration / number * 1e6))
+
+
+if __name__ == "__main__":
+    main()
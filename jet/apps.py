@@ -0,0 +1,12 @@
+from django.apps import AppConfig
+from django.db.models.signals import post_delete, post_save
+
+
+class JetConfig(AppConfig):
+    name = "jet"
+
+    def ready(self):
+        from jet.utils import invalidate_sibling_pks_cache
+
+        post_save.connect(invalidate_sibling_pks_cache, dispatch_uid="jet_invalidate_sibling_pks_cache_save")
+        post_delete.connect(invalidate_sibling_pks_cache, dispatch_uid="jet_invalidate_sibling_pks_cache_delete")
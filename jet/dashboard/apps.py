@@ -0,0 +1,26 @@
+from django.apps import AppConfig
+from django.db.models.signals import post_save
+from django.utils.autoreload import file_changed
+
+
+class DashboardConfig(AppConfig):
+    name = "jet.dashboard"
+
+    def ready(self):
+        from django.contrib.admin.models import LogEntry, LogEntryManager
+
+        from jet.dashboard.models import store_bulk_logged_actions, update_recent_actions
+        from jet.dashboard.utils import clear_class_registry, get_dashboard_path, resolve_class
+
+        file_changed.connect(clear_class_registry, dispatch_uid="jet_dashboard_clear_class_registry")
+        post_save.connect(update_recent_actions, sender=LogEntry, dispatch_uid="jet_dashboard_update_recent_actions")
+
+        # Django 5.1+ logs actions on several objects with a single bulk insert
+        log_actions = getattr(LogEntryManager, "log_actions", None)
+
+        if log_actions is not None and not getattr(log_actions, "stores_recent_actions", False):
+            LogEntryManager.log_actions = store_bulk_logged_actions(log_actions)
+
+        # failed imports are not remembered here as dashboards may depend on apps which are not ready yet
+        for location in ("index", "app_index"):
+            resolve_class(get_dashboard_path(location), remember_missing=False)
@@ -1,12 +1,17 @@
-from importlib import import_module
+from concurrent.futures import wait
+from functools import lru_cache, partial
 
+from asgiref.sync import sync_to_async
 from django.template.context_processors import csrf
 from django.template.loader import render_to_string
 from django.urls import reverse
 from django.utils.translation import gettext_lazy as _
 
-from jet.dashboard import modules
+from jet.dashboard import modules, settings
 from jet.dashboard.models import UserDashboardModule
+from jet.dashboard.storage import get_storage
+from jet.dashboard.streaming import get_dashboard_stream
+from jet.dashboard.utils import arun_concurrently, resolve_class, run_concurrently, start_concurrently
 from jet.ordered_set import OrderedSet
 from jet.utils import context_to_dict, get_admin_site_name
 
@@ -29,6 +34,24 @@ class Dashboard:
     #:
     #: List of dashboard module **classes**
     available_children = None
+
+    #: Number of threads used to initialize widgets concurrently before dashboard is rendered, useful when
+    #: widgets wait for network (feeds, analytics). ``0`` initializes widgets one by one while rendering.
+    #: Widgets loaded via AJAX are not affected.
+    modules_workers = settings.JET_DASHBOARD_MODULES_WORKERS
+
+    #: Number of seconds to wait for concurrently initialized widgets.
+    #: Widgets not initialized in time are loaded via AJAX instead.
+    modules_timeout = settings.JET_DASHBOARD_MODULES_TIMEOUT
+
+    #: Number of seconds to wait for widgets before the page is sent when ``DashboardStreamingMiddleware`` is used.
+    #: Widgets not initialized in time are streamed into the sent page as they complete. Streamed widgets are
+    #: initialized in ``modules_workers`` threads, or each in its own thread when ``modules_workers`` is ``0``.
+    stream_timeout = settings.JET_DASHBOARD_STREAM_TIMEOUT
+
+    #: Only declare widgets (``children`` and ``available_children``) without loading or creating user widgets.
+    #: Used where widget declarations are needed but the dashboard is not rendered.
+    spec = False
     app_label = None
     context = None
     modules = None
@@ -48,7 +71,9 @@ class Dashboard:
     def set_context(self, context):
         self.context = context
         self.init_with_context(context)
-        self.load_modules()
+
+        if not self.spec:
+            self.load_modules()
 
     def init_with_context(self, context):
         """
@@ -96,23 +121,17 @@ class Dashboard:
         pass
 
     def load_module(self, module_fullname):
-        package, module_name = module_fullname.rsplit(".", 1)
-        package = import_module(package)
-        module = getattr(package, module_name)
-
-        return module
+        return resolve_class(module_fullname)
 
-    def create_initial_module_models(self, user):
+    def get_initial_module_models(self, user):
         module_models = []
 
-        i = 0
-
-        for module in self.children:
+        for i, module in enumerate(self.children):
             column = module.column if module.column is not None else i % self.columns
             order = module.order if module.order is not None else int(i / self.columns)
 
             module_models.append(
-                UserDashboardModule.objects.create(
+                UserDashboardModule(
                     title=module.title,
                     app_label=self.app_label,
                     user=user.pk,
@@ -123,17 +142,33 @@ class Dashboard:
                     children=module.dump_children(),
                 )
             )
-            i += 1
+
+        return module_models
+
+    def create_initial_module_models(self, user):
+        return get_storage().create_modules(user.pk, self.app_label, self.get_initial_module_models(user))
+
+    def get_template_module_models(self, user):
+        """
+        Returns unsaved widgets of shared template dashboard shown to users who have not changed their
+        dashboard yet. Template widgets have negative ids.
+        """
+        module_models = self.get_initial_module_models(user)
+
+        for i, module_model in enumerate(module_models):
+            module_model.pk = -(i + 1)
 
         return module_models
 
     def load_modules(self):
-        module_models = UserDashboardModule.objects.filter(
-            app_label=self.app_label, user=self.context["request"].user.pk
-        ).all()
+        user = self.context["request"].user
+        module_models = get_storage().get_modules(user.pk, self.app_label)
 
         if len(module_models) == 0:
-            module_models = self.create_initial_module_models(self.context["request"].user)
+            if settings.JET_DASHBOARD_SHARED_TEMPLATES:
+                module_models = self.get_template_module_models(user)
+            else:
+                module_models = self.create_initial_module_models(user)
 
         loaded_modules = []
 
@@ -145,13 +180,99 @@ class Dashboard:
 
         self.modules = loaded_modules
 
+    def get_modules_to_init(self):
+        return [
+            module
+            for module in self.modules
+            if not module.ajax_load and not module.context_initialized and not module.is_cache_fresh()
+        ]
+
+    def init_modules_with_context(self):
+        modules = self.get_modules_to_init()
+
+        if self.modules_workers < 1 or len(modules) < 2:
+            return
+
+        calls = {module: partial(module.init_with_context, module.context) for module in modules}
+        initialized = run_concurrently(calls, self.modules_workers, self.modules_timeout)
+
+        for module in modules:
+            if module in initialized:
+                module.context_initialized = True
+            else:
+                module.ajax_load = True
+
+    def start_modules_stream(self, stream):
+        modules = self.get_modules_to_init()
+
+        if len(modules) == 0:
+            return
+
+        # template context is unbound once the page is rendered, streamed widgets keep their own copy
+        for module in modules:
+            module.context = dict(context_to_dict(module.context))
+
+        calls = {module: partial(module.init_with_context, module.context) for module in modules}
+        futures = start_concurrently(calls, self.modules_workers or len(modules))
+        wait(futures.values(), timeout=self.stream_timeout)
+
+        for module, future in futures.items():
+            if future.done():
+                try:
+                    future.result()
+                    module.context_initialized = True
+                except Exception:
+                    # failed widgets are loaded via AJAX instead, which reports the error
+                    module.ajax_load = True
+            else:
+                stream.add(module, future)
+
+        stream.timeout = self.modules_timeout
+
+    async def ainit_modules_with_context(self):
+        """
+        Awaits ``ainit_with_context`` of all modules concurrently, modules not initialized within
+        ``modules_timeout`` seconds are loaded via AJAX.
+        """
+        modules = await sync_to_async(self.get_modules_to_init)()
+        calls = {module: module.ainit_with_context(module.context) for module in modules}
+        initialized = await arun_concurrently(calls, self.modules_timeout)
+
+        for module in modules:
+            if module in initialized:
+                module.context_initialized = True
+            else:
+                module.ajax_load = True
+
+    async def arender(self):
+        await self.ainit_modules_with_context()
+        return await sync_to_async(self.render)()
+
     def render(self):
+        stream = get_dashboard_stream(self.context["request"])
+
+        if stream is not None:
+            self.start_modules_stream(stream)
+        else:
+            self.init_modules_with_context()
+
+        poll_interval = settings.JET_DASHBOARD_POLL_INTERVAL
+
+        if poll_interval:
+            for module in self.modules:
+                # cached content is rendered first, so that version of content cached by this render is shown
+                if not module.ajax_load and not module.stream_load and module.get_cache_key() is not None:
+                    module.render()
+
+                module.data_version = module.get_data_version()
+
         context = context_to_dict(self.context)
         context.update(
             {
                 "columns": range(self.columns),
                 "modules": self.modules,
                 "app_label": self.app_label,
+                "poll_interval": poll_interval,
             }
         )
         context.update(csrf(context["request"]))
@@ -168,25 +289,29 @@ class Dashboard:
         return render_to_string("jet.dashboard/dashboard_tools.html", context)
 
     def media(self):
-        unique_css = OrderedSet()
-        unique_js = OrderedSet()
+        return get_media(self.__class__, tuple(module.__class__ for module in self.modules))
+
 
-        for js in getattr(self.Media, "js", ()):
+@lru_cache(maxsize=1024)
+def get_media(dashboard_cls, module_classes):
+    """
+    Returns ``Media`` class merging unique CSS/JS of dashboard and its modules, computed once per combination
+    of dashboard and module classes.
+    """
+    unique_css = OrderedSet()
+    unique_js = OrderedSet()
+
+    for cls in (dashboard_cls,) + module_classes:
+        for js in getattr(cls.Media, "js", ()):
             unique_js.add(js)
-        for css in getattr(self.Media, "css", ()):
+        for css in getattr(cls.Media, "css", ()):
             unique_css.add(css)
 
-        for module in self.modules:
-            for js in getattr(module.Media, "js", ()):
-                unique_js.add(js)
-            for css in getattr(module.Media, "css", ()):
-                unique_css.add(css)
-
-        class Media:
-            css = list(unique_css)
-            js = list(unique_js)
+    class Media:
+        css = list(unique_css)
+        js = list(unique_js)
 
-        return Media
+    return Media
 
 
 class AppIndexDashboard(Dashboard):
@@ -1,6 +1,6 @@
 # encoding: utf-8
 import datetime
-import json
+from urllib.parse import urlencode
 
 import httplib2
 from django import forms
@@ -47,10 +47,9 @@ class ModuleCredentialStorage(Storage):
 
     def get(self):
         try:
-            settings = json.loads(self.module.settings)
-            credential = settings['credential']
+            credential = self.module.settings['credential']
             return OAuth2Credentials.from_json(credential)
-        except (ValueError, KeyError):
+        except (ValueError, KeyError, TypeError):
             return None
 
     def put(self, credentials):
@@ -138,15 +137,20 @@ class GoogleAnalyticsClient:
 class CredentialWidget(Widget):
     module = None
 
+    def get_url(self, name):
+        # shared template widgets are looked up in the dashboard of their app
+        query = urlencode({'app_label': self.module.model.app_label or ''})
+        return '%s?%s' % (reverse(name, kwargs={'pk': self.module.model.pk}), query)
+
     def render(self, name, value, attrs=None):
         if value and len(value) > 0:
             link = '<a href="%s">%s</a>' % (
-                reverse('jet-dashboard:google-analytics-revoke', kwargs={'pk': self.module.model.pk}),
+                self.get_url('jet-dashboard:google-analytics-revoke'),
                 force_str(_('Revoke access'))
             )
         else:
             link = '<a href="%s">%s</a>' % (
-                reverse('jet-dashboard:google-analytics-grant', kwargs={'pk': self.module.model.pk}),
+                self.get_url('jet-dashboard:google-analytics-grant'),
                 force_str(_('Grant access'))
             )
 
@@ -12,17 +12,24 @@ from jet.dashboard.dashboard_modules.google_analytics import (
     ModuleCredentialStorage,
 )
 from jet.dashboard.models import UserDashboardModule
+from jet.dashboard.storage import get_request_app_label, get_storage, get_user_module
 
 
 def google_analytics_grant_view(request, pk):
+    try:
+        # shared template widget is copied first, credential is stored to the copy once access is granted
+        module = get_user_module(request, pk, get_request_app_label(request.GET), materialize=True)
+    except UserDashboardModule.DoesNotExist:
+        return HttpResponse(_('Module not found'))
+
     redirect_uri = request.build_absolute_uri(reverse('jet-dashboard:google-analytics-callback'))
     client = GoogleAnalyticsClient(redirect_uri=redirect_uri)
-    return redirect(client.get_oauth_authorize_url(pk))
+    return redirect(client.get_oauth_authorize_url(module.pk))
 
 
 def google_analytics_revoke_view(request, pk):
     try:
-        module = UserDashboardModule.objects.get(pk=pk)
+        module = get_user_module(request, pk, get_request_app_label(request.GET), materialize=True)
         ModuleCredentialStorage(module).delete()
         return redirect(reverse('jet-dashboard:update_module', kwargs={'pk': module.pk}))
     except UserDashboardModule.DoesNotExist:
@@ -34,7 +41,7 @@ def google_analytics_callback_view(request):
 
     try:
         state = request.GET['state']
-        module = UserDashboardModule.objects.get(pk=state)
+        module = get_storage().get_module(request.user.pk, state)
 
         redirect_uri = request.build_absolute_uri(reverse('jet-dashboard:google-analytics-callback'))
         client = GoogleAnalyticsClient(redirect_uri=redirect_uri)
@@ -51,7 +58,7 @@ def google_analytics_callback_view(request):
     return redirect(reverse('jet-dashboard:update_module', kwargs={'pk': module.pk}))
 
 dashboard.urls.register_urls([
-    re_path(r'^google-analytics/grant/(?P<pk>\d+)/$', google_analytics_grant_view, name='google-analytics-grant'),
-    re_path(r'^google-analytics/revoke/(?P<pk>\d+)/$', google_analytics_revoke_view, name='google-analytics-revoke'),
+    re_path(r'^google-analytics/grant/(?P<pk>-?\d+)/$', google_analytics_grant_view, name='google-analytics-grant'),
+    re_path(r'^google-analytics/revoke/(?P<pk>-?\d+)/$', google_analytics_revoke_view, name='google-analytics-revoke'),
     re_path(r'^google-analytics/callback/', google_analytics_callback_view, name='google-analytics-callback'),
 ])
@@ -92,15 +92,20 @@ class YandexMetrikaClient:
 class AccessTokenWidget(Widget):
     module = None
 
+    def get_url(self, name):
+        # shared template widgets are looked up in the dashboard of their app
+        query = urlencode({'app_label': self.module.model.app_label or ''})
+        return '%s?%s' % (reverse(name, kwargs={'pk': self.module.model.pk}), query)
+
     def render(self, name, value, attrs=None):
         if value and len(value) > 0:
             link = '<a href="%s">%s</a>' % (
-                reverse('jet-dashboard:yandex-metrika-revoke', kwargs={'pk': self.module.model.pk}),
+                self.get_url('jet-dashboard:yandex-metrika-revoke'),
                 force_str(_('Revoke access'))
             )
         else:
             link = '<a href="%s">%s</a>' % (
-                reverse('jet-dashboard:yandex-metrika-grant', kwargs={'pk': self.module.model.pk}),
+                self.get_url('jet-dashboard:yandex-metrika-grant'),
                 force_str(_('Grant access'))
             )
 
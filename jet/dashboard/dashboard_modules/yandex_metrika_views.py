@@ -7,16 +7,23 @@ from django.utils.translation import gettext_lazy as _
 from jet.dashboard import dashboard
 from jet.dashboard.dashboard_modules.yandex_metrika import YandexMetrikaClient
 from jet.dashboard.models import UserDashboardModule
+from jet.dashboard.storage import get_request_app_label, get_storage, get_user_module
 
 
 def yandex_metrika_grant_view(request, pk):
+    try:
+        # shared template widget is copied first, access token is stored to the copy once access is granted
+        module = get_user_module(request, pk, get_request_app_label(request.GET), materialize=True)
+    except UserDashboardModule.DoesNotExist:
+        return HttpResponse(_('Module not found'))
+
     client = YandexMetrikaClient()
-    return redirect(client.get_oauth_authorize_url(pk))
+    return redirect(client.get_oauth_authorize_url(module.pk))
 
 
 def yandex_metrika_revoke_view(request, pk):
     try:
-        module = UserDashboardModule.objects.get(pk=pk)
+        module = get_user_module(request, pk, get_request_app_label(request.GET), materialize=True)
         module.pop_settings(('access_token', 'expires_in', 'token_type', 'counter'))
         return redirect(reverse('jet-dashboard:update_module', kwargs={'pk': module.pk}))
     except UserDashboardModule.DoesNotExist:
@@ -28,7 +35,7 @@ def yandex_metrika_callback_view(request):
         state = request.GET['state']
         code = request.GET['code']
 
-        module = UserDashboardModule.objects.get(pk=state)
+        module = get_storage().get_module(request.user.pk, state)
 
         client = YandexMetrikaClient()
         result, exception = client.oath_token_request(code)
@@ -47,12 +54,12 @@ def yandex_metrika_callback_view(request):
 
 dashboard.urls.register_urls([
     re_path(
-        r'^yandex-metrika/grant/(?P<pk>\d+)/$',
+        r'^yandex-metrika/grant/(?P<pk>-?\d+)/$',
         yandex_metrika_grant_view,
         name='yandex-metrika-grant'
     ),
     re_path(
-        r'^yandex-metrika/revoke/(?P<pk>\d+)/$',
+        r'^yandex-metrika/revoke/(?P<pk>-?\d+)/$',
         yandex_metrika_revoke_view,
         name='yandex-metrika-revoke'
     ),
@@ -0,0 +1,197 @@
+import datetime
+import email.utils
+import hashlib
+import time
+import urllib.error
+import urllib.request
+from xml.etree import ElementTree
+
+from django.core.cache import cache
+
+from jet import VERSION
+from jet.dashboard import settings
+
+FEED_CHUNK_SIZE = 16 * 1024
+
+
+def get_feed_cache_key(url):
+    return "jet.dashboard.feed.%s" % hashlib.md5(url.encode("utf-8")).hexdigest()
+
+
+def fetch_feed(url, etag=None, modified=None, limit=None):
+    """
+    Requests feed document conditionally. Returns ``(entries, etag, modified)`` tuple
+    or ``None`` if feed was not modified.
+    """
+    headers = {"User-Agent": "django-jet/%s" % VERSION}
+
+    if etag:
+        headers["If-None-Match"] = etag
+    if modified:
+        headers["If-Modified-Since"] = modified
+
+    request = urllib.request.Request(url, headers=headers)
+
+    try:
+        response = urllib.request.urlopen(request, timeout=settings.JET_MODULE_FEED_TIMEOUT)
+    except urllib.error.HTTPError as e:
+        if e.code == 304:
+            return None
+        raise
+
+    with response:
+        entries = parse_feed_entries(response, limit)
+        return entries, response.headers.get("ETag"), response.headers.get("Last-Modified")
+
+
+def get_local_name(tag):
+    return tag.rsplit("}", 1)[-1] if isinstance(tag, str) else ""
+
+
+def parse_feed_date(value):
+    value = (value or "").strip()
+
+    try:
+        date = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        try:
+            date = datetime.datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+
+    if date.tzinfo is not None:
+        date = date.astimezone(datetime.timezone.utc)
+
+    return date.date()
+
+
+def parse_feed_element(element):
+    item = {"title": "", "link": ""}
+    dates = {}
+
+    for child in element:
+        name = get_local_name(child.tag)
+
+        if name == "title":
+            item["title"] = (child.text or "").strip()
+        elif name == "link":
+            href = child.get("href")
+
+            if href is None:
+                item["link"] = (child.text or "").strip()
+            elif child.get("rel", "alternate") == "alternate":
+                item["link"] = href
+        elif name in ("pubDate", "published", "date", "updated"):
+            dates[name] = child.text
+
+    for name in ("pubDate", "published", "date", "updated"):
+        date = parse_feed_date(dates.get(name))
+
+        if date is not None:
+            item["date"] = date
+            break
+
+    return item
+
+
+def parse_feed_entries(stream, limit=None):
+    """
+    Incrementally parses RSS or Atom entries from file-like ``stream``. Reading stops as soon as ``limit`` entries
+    are parsed or ``JET_MODULE_FEED_MAX_BYTES`` bytes are read. Only fields used by widget template are kept.
+    """
+    parser = ElementTree.XMLPullParser(events=("end",))
+    max_bytes = settings.JET_MODULE_FEED_MAX_BYTES
+    chunks = []
+    read = 0
+    entries = []
+
+    try:
+        while read < max_bytes and (limit is None or len(entries) < limit):
+            chunk = stream.read(min(FEED_CHUNK_SIZE, max_bytes - read))
+
+            if not chunk:
+                break
+
+            read += len(chunk)
+            chunks.append(chunk)
+            parser.feed(chunk)
+
+            for event, element in parser.read_events():
+                if get_local_name(element.tag) in ("item", "entry"):
+                    entries.append(parse_feed_element(element))
+                    element.clear()
+    except ElementTree.ParseError:
+        # Malformed feeds (e.g. with HTML entities) are parsed with tolerant parser from the bytes allowed to read
+        chunks.append(stream.read(max_bytes - read))
+        return parse_feed_entries_fallback(b"".join(chunks), limit)
+
+    return entries[:limit] if limit is not None else entries
+
+
+def parse_feed_entries_fallback(content, limit=None):
+    import feedparser
+
+    entries = feedparser.parse(content)["entries"]
+
+    if limit is not None:
+        entries = entries[:limit]
+
+    result = []
+
+    for entry in entries:
+        item = {"title": entry.get("title"), "link": entry.get("link")}
+
+        try:
+            item["date"] = datetime.date(*entry.published_parsed[0:3])
+        except Exception:
+            pass
+
+        result.append(item)
+
+    return result
+
+
+def get_feed_entries(url, limit=None):
+    """
+    Returns at least ``limit`` first entries (if the feed has them) of the feed shared by all users.
+    Stored feed is revalidated with conditional request no more often than
+    ``JET_MODULE_FEED_REFRESH_INTERVAL`` seconds.
+    """
+    cache_key = get_feed_cache_key(url)
+    stored = cache.get(cache_key)
+
+    # stored feed was read only partially and doesn't have enough entries
+    if stored is not None and stored["limit"] is not None and (limit is None or limit > stored["limit"]):
+        stored = None
+
+    if stored is not None and stored["checked"] + settings.JET_MODULE_FEED_REFRESH_INTERVAL > time.time():
+        return stored["entries"]
+
+    lock_key = cache_key + ".lock"
+    locked = False
+
+    if stored is not None:
+        # only one request revalidates the feed, others are served stored entries meanwhile
+        locked = cache.add(lock_key, True, settings.JET_MODULE_FEED_TIMEOUT * 2)
+
+        if not locked:
+            return stored["entries"]
+    else:
+        stored = {"entries": [], "etag": None, "modified": None, "limit": limit}
+
+    try:
+        result = fetch_feed(url, stored["etag"], stored["modified"], stored["limit"])
+
+        if result is not None:
+            entries, etag, modified = result
+            stored = {"entries": entries, "etag": etag, "modified": modified, "limit": stored["limit"]}
+    except (OSError, ValueError):
+        pass
+    finally:
+        if locked:
+            cache.delete(lock_key)
+
+    stored["checked"] = time.time()
+    cache.set(cache_key, stored, settings.JET_MODULE_FEED_STORE_TIMEOUT)
+
+    return stored["entries"]
@@ -3,7 +3,9 @@ import json
 from django import forms
 from django.core.exceptions import ValidationError
 
+from jet.dashboard import settings as dashboard_settings
 from jet.dashboard.models import UserDashboardModule
+from jet.dashboard.storage import get_storage, get_user_modules, materialize_template
 from jet.dashboard.utils import get_current_dashboard
 from jet.utils import user_is_authenticated
 
@@ -11,10 +13,12 @@ from jet.utils import user_is_authenticated
 class UpdateDashboardModulesForm(forms.Form):
     app_label = forms.CharField(required=False)
     modules = forms.CharField()
-    modules_objects = []
 
     def __init__(self, request, *args, **kwargs):
         self.request = request
+        self.modules_objects = []
+        self.template_values = {}
+        self.materialized = False
         super(UpdateDashboardModulesForm, self).__init__(*args, **kwargs)
 
     def clean(self):
@@ -24,31 +28,84 @@ class UpdateDashboardModulesForm(forms.Form):
             raise ValidationError("error")
 
         try:
-            modules = json.loads(data["modules"])
+            values = self.parse_modules(json.loads(data["modules"]))
+            app_label = data["app_label"] if data["app_label"] else None
+            template_pks = {pk for pk in values if pk < 0}
 
-            for module in modules:
-                db_module = UserDashboardModule.objects.get(
-                    user=self.request.user.pk,
-                    app_label=data["app_label"] if data["app_label"] else None,
-                    pk=module["id"],
-                )
+            db_modules = get_storage().get_modules_in(self.request.user.pk, [pk for pk in values if pk > 0], app_label)
 
-                column = module["column"]
-                order = module["order"]
+            if dashboard_settings.JET_DASHBOARD_SHARED_TEMPLATES and template_pks:
+                # template widgets are only validated here, template is copied to user when form is saved
+                db_modules += [
+                    module_model
+                    for module_model in get_user_modules(self.request, app_label)
+                    if module_model.pk in template_pks
+                ]
 
-                if db_module.column != column or db_module.order != order:
-                    db_module.column = column
-                    db_module.order = order
+            db_modules = [db_module for db_module in db_modules if db_module.app_label == app_label]
 
+            if len(db_modules) != len(values):
+                raise ValidationError("error")
+
+            for db_module in db_modules:
+                if db_module.pk < 0:
+                    self.template_values[db_module.pk] = values[db_module.pk]
+                elif self.update_module(db_module, values[db_module.pk]):
                     self.modules_objects.append(db_module)
         except Exception:
             raise ValidationError("error")
 
         return data
 
+    def parse_modules(self, modules):
+        return {int(module["id"]): (module["column"], module["order"]) for module in modules}
+
+    def update_module(self, db_module, position):
+        column, order = position
+
+        if db_module.column == column and db_module.order == order:
+            return False
+
+        db_module.column = column
+        db_module.order = order
+        return True
+
+    def save_modules(self, module_models):
+        get_storage().update_positions(module_models)
+
     def save(self):
-        for module in self.modules_objects:
-            module.save()
+        if self.template_values:
+            # shared template widgets are changed, template is copied to user and copies are changed instead
+            copies = materialize_template(self.request, self.cleaned_data["app_label"] or None)
+
+            for pk, value in self.template_values.items():
+                # template could be copied by a concurrent request since the form was validated
+                if pk in copies and self.update_module(copies[pk], value):
+                    self.modules_objects.append(copies[pk])
+
+            self.materialized = True
+
+        if self.modules_objects:
+            self.save_modules(self.modules_objects)
+
+
+class UpdateDashboardModulesCollapseForm(UpdateDashboardModulesForm):
+    """
+    Applies collapsed state of several widgets at once, ``modules`` is a JSON object of widget ids to flags.
+    """
+
+    def parse_modules(self, modules):
+        return {int(pk): bool(collapsed) for pk, collapsed in modules.items()}
+
+    def update_module(self, db_module, collapsed):
+        if db_module.collapsed == collapsed:
+            return False
+
+        db_module.collapsed = collapsed
+        return True
+
+    def save_modules(self, module_models):
+        get_storage().update_collapsed(module_models)
 
 
 class AddUserDashboardModuleForm(forms.ModelForm):
@@ -76,14 +133,17 @@ class AddUserDashboardModuleForm(forms.ModelForm):
 
         if "app_label" in data:
             index_dashboard_cls = get_current_dashboard("app_index" if data["app_label"] else "index")
-            index_dashboard = index_dashboard_cls({"request": self.request}, app_label=data["app_label"])
+            index_dashboard = index_dashboard_cls({"request": self.request}, app_label=data["app_label"], spec=True)
 
             if "type" in data:
-                if data["type"] == "children":
-                    module = index_dashboard.children[data["module"]]
-                elif data["type"] == "available_children":
-                    module = index_dashboard.available_children[data["module"]]()
-                else:
+                try:
+                    if data["type"] == "children":
+                        module = index_dashboard.children[data["module"]]
+                    elif data["type"] == "available_children":
+                        module = index_dashboard.available_children[data["module"]]()
+                    else:
+                        raise ValidationError("error")
+                except (IndexError, TypeError):
                     raise ValidationError("error")
 
                 self.module_cls = module
@@ -98,6 +158,14 @@ class AddUserDashboardModuleForm(forms.ModelForm):
         self.instance.settings = self.module_cls.dump_settings()
         self.instance.children = self.module_cls.dump_children()
 
+        if commit:
+            if dashboard_settings.JET_DASHBOARD_SHARED_TEMPLATES:
+                # widget is added to a copy of shared template unless user dashboard was already copied
+                materialize_template(self.request, self.instance.app_label)
+
+            get_storage().add_module(self.instance)
+            return self.instance
+
         return super(AddUserDashboardModuleForm, self).save(commit)
 
 
@@ -166,6 +234,4 @@ class ResetDashboardForm(forms.Form):
 
     def save(self, commit=True):
         if commit:
-            UserDashboardModule.objects.filter(
-                user=self.request.user.pk, app_label=self.cleaned_data["app_label"]
-            ).delete()
+            get_storage().reset(self.request.user.pk, self.cleaned_data["app_label"])
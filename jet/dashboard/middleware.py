@@ -0,0 +1,20 @@
+from functools import partial
+
+from jet.dashboard.streaming import DashboardStream, stream_response
+
+
+class DashboardStreamingMiddleware:
+    """
+    Sends dashboard pages without waiting for slow widgets, which are streamed into the page as they complete.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        return self.get_response(request)
+
+    def process_template_response(self, request, response):
+        request._jet_dashboard_stream = DashboardStream()
+        response.add_post_render_callback(partial(stream_response, request))
+        return response
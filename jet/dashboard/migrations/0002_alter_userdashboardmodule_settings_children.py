@@ -0,0 +1,35 @@
+from django.db import migrations, models
+
+import jet.utils
+
+
+def convert_empty_values(apps, schema_editor):
+    UserDashboardModule = apps.get_model("dashboard", "UserDashboardModule")
+    db_alias = schema_editor.connection.alias
+    UserDashboardModule.objects.using(db_alias).filter(settings="").update(settings="{}")
+    UserDashboardModule.objects.using(db_alias).filter(children="").update(children="[]")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("dashboard", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.RunPython(convert_empty_values, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="userdashboardmodule",
+            name="settings",
+            field=models.JSONField(
+                blank=True, default=dict, encoder=jet.utils.LazyDateTimeEncoder, verbose_name="settings"
+            ),
+        ),
+        migrations.AlterField(
+            model_name="userdashboardmodule",
+            name="children",
+            field=models.JSONField(
+                blank=True, default=list, encoder=jet.utils.LazyDateTimeEncoder, verbose_name="children"
+            ),
+        ),
+    ]
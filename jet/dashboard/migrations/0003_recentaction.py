@@ -0,0 +1,55 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("admin", "0001_initial"),
+        ("contenttypes", "0002_remove_content_type_name"),
+        ("dashboard", "0002_alter_userdashboardmodule_settings_children"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RecentAction",
+            fields=[
+                ("id", models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("action_time", models.DateTimeField(db_index=True, verbose_name="action time")),
+                ("user", models.PositiveIntegerField(verbose_name="user")),
+                ("user_repr", models.CharField(max_length=255, verbose_name="user repr")),
+                ("object_repr", models.CharField(max_length=200, verbose_name="object repr")),
+                ("action_flag", models.PositiveSmallIntegerField(verbose_name="action flag")),
+                ("change_message", models.TextField(blank=True, verbose_name="change message")),
+                ("admin_url", models.CharField(blank=True, max_length=255, verbose_name="admin URL")),
+                (
+                    "content_type",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="contenttypes.contenttype",
+                        verbose_name="content type",
+                    ),
+                ),
+                (
+                    "log_entry",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="admin.logentry",
+                        verbose_name="log entry",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "recent action",
+                "verbose_name_plural": "recent actions",
+                "ordering": ("-action_time",),
+                "indexes": [
+                    models.Index(fields=["content_type", "-action_time"], name="dashboard_r_content_6806aa_idx")
+                ],
+            },
+        ),
+    ]
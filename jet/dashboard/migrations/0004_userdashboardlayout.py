@@ -0,0 +1,35 @@
+from django.db import migrations, models
+
+import jet.utils
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("dashboard", "0003_recentaction"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="UserDashboardLayout",
+            fields=[
+                ("id", models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("user", models.PositiveIntegerField(verbose_name="user")),
+                (
+                    "app_label",
+                    models.CharField(blank=True, default="", max_length=255, verbose_name="application name"),
+                ),
+                (
+                    "modules",
+                    models.JSONField(
+                        blank=True, default=list, encoder=jet.utils.LazyDateTimeEncoder, verbose_name="modules"
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "user dashboard layout",
+                "verbose_name_plural": "user dashboard layouts",
+                "unique_together": {("user", "app_label")},
+            },
+        ),
+    ]
@@ -1,12 +1,22 @@
+import functools
 import json
-from importlib import import_module
 
-from django.db import models
+from django.contrib.admin.models import ADDITION, CHANGE, DELETION, LogEntry
+from django.contrib.contenttypes.models import ContentType
+from django.db import connections, models
+from django.db.models import F, Func, Value
+from django.db.models.expressions import RawSQL
 from django.utils.translation import gettext_lazy as _
 
+from jet.dashboard import settings as dashboard_settings
+from jet.dashboard.utils import resolve_class
 from jet.utils import LazyDateTimeEncoder
 
 
+def get_settings_key_path(key):
+    return '$."%s"' % key.replace("\\", "\\\\").replace('"', '\\"')
+
+
 class UserDashboardModule(models.Model):
     title = models.CharField(verbose_name=_("Title"), max_length=255)
     module = models.CharField(verbose_name=_("module"), max_length=255)
@@ -14,10 +24,13 @@ class UserDashboardModule(models.Model):
     user = models.PositiveIntegerField(verbose_name=_("user"))
     column = models.PositiveIntegerField(verbose_name=_("column"))
     order = models.IntegerField(verbose_name=_("order"))
-    settings = models.TextField(verbose_name=_("settings"), default="", blank=True)
-    children = models.TextField(verbose_name=_("children"), default="", blank=True)
+    settings = models.JSONField(verbose_name=_("settings"), default=dict, blank=True, encoder=LazyDateTimeEncoder)
+    children = models.JSONField(verbose_name=_("children"), default=list, blank=True, encoder=LazyDateTimeEncoder)
     collapsed = models.BooleanField(verbose_name=_("collapsed"), default=False)
 
+    #: ``LayoutStorage`` which loaded this widget from a layout row, ``None`` if widget is stored in its own row
+    layout_storage = None
+
     class Meta:
         verbose_name = _("user dashboard module")
         verbose_name_plural = _("user dashboard modules")
@@ -26,32 +39,243 @@ class UserDashboardModule(models.Model):
     def __str__(self):
         return self.module
 
+    @property
+    def is_template(self):
+        """
+        Whether widget belongs to shared template dashboard (has negative id) instead of being stored for user.
+        """
+        return self.pk is not None and self.pk < 0
+
+    def save(self, *args, **kwargs):
+        if self.layout_storage is not None:
+            self.layout_storage.save_module(self)
+        else:
+            super(UserDashboardModule, self).save(*args, **kwargs)
+
+    def delete(self, *args, **kwargs):
+        if self.layout_storage is not None:
+            return self.layout_storage.delete_module(self)
+        return super(UserDashboardModule, self).delete(*args, **kwargs)
+
     def load_module(self):
-        try:
-            package, module_name = self.module.rsplit(".", 1)
-            package = import_module(package)
-            module = getattr(package, module_name)
+        return resolve_class(self.module)
+
+    def get_settings_expression(self, update_settings=None, pop_settings=None):
+        """
+        Returns database expression changing only given ``settings`` keys or ``None``
+        if database backend has no JSON functions for it.
+        """
+        vendor = connections[self._state.db or "default"].vendor
+        output_field = models.JSONField(encoder=LazyDateTimeEncoder)
 
-            return module
-        except AttributeError:
-            return None
-        except ImportError:
-            return None
+        if vendor == "postgresql":
+            if update_settings is not None:
+                value = Value(update_settings, output_field=output_field)
+                return Func(
+                    F("settings"), value, template="%(expressions)s", arg_joiner=" || ", output_field=output_field
+                )
+            value = RawSQL("%s::text[]", (list(pop_settings),))
+            return Func(
+                F("settings"), value, template="%(expressions)s", arg_joiner=" - ", output_field=output_field
+            )
+        elif vendor in ("sqlite", "mysql"):
+            if update_settings is not None:
+                expressions = []
+                for key, value in update_settings.items():
+                    value = Value(json.dumps(value, cls=LazyDateTimeEncoder))
+                    if vendor == "sqlite":
+                        value = Func(value, function="JSON")
+                    else:
+                        value = Func(value, Value("$"), function="JSON_EXTRACT")
+                    expressions.extend([Value(get_settings_key_path(key)), value])
+                return Func(F("settings"), *expressions, function="JSON_SET", output_field=output_field)
+            paths = [Value(get_settings_key_path(key)) for key in pop_settings]
+            return Func(F("settings"), *paths, function="JSON_REMOVE", output_field=output_field)
 
     def pop_settings(self, pop_settings):
-        settings = json.loads(self.settings)
+        settings = dict(self.settings or {})
 
         for setting in pop_settings:
             if setting in settings:
                 settings.pop(setting)
 
-        self.settings = json.dumps(settings, cls=LazyDateTimeEncoder)
-        self.save()
+        self.save_settings(settings, pop_settings=pop_settings)
 
     def update_settings(self, update_settings):
-        settings = json.loads(self.settings)
+        settings = dict(self.settings or {})
 
         settings.update(update_settings)
 
-        self.settings = json.dumps(settings, cls=LazyDateTimeEncoder)
-        self.save()
+        self.save_settings(settings, update_settings=update_settings)
+
+    def save_settings(self, settings, update_settings=None, pop_settings=None):
+        expression = None
+
+        if self.pk is not None and self.layout_storage is None and (update_settings or pop_settings):
+            expression = self.get_settings_expression(update_settings, pop_settings)
+
+        if expression is None:
+            self.settings = settings
+            self.save()
+            return
+
+        UserDashboardModule.objects.using(self._state.db).filter(pk=self.pk).update(settings=expression)
+        self.settings = settings
+
+
+class UserDashboardLayout(models.Model):
+    """
+    Whole dashboard of a user stored in a single row, used by ``jet.dashboard.storage.LayoutStorage``.
+    """
+
+    user = models.PositiveIntegerField(verbose_name=_("user"))
+    app_label = models.CharField(verbose_name=_("application name"), max_length=255, blank=True, default="")
+    modules = models.JSONField(verbose_name=_("modules"), default=list, blank=True, encoder=LazyDateTimeEncoder)
+
+    class Meta:
+        verbose_name = _("user dashboard layout")
+        verbose_name_plural = _("user dashboard layouts")
+        unique_together = ("user", "app_label")
+
+    def __str__(self):
+        return "%s %s" % (self.user, self.app_label)
+
+
+class RecentAction(models.Model):
+    """
+    Copy of one of the latest ``LogEntry`` rows of its content type, read by ``RecentActions`` widgets instead of
+    the whole admin log when ``JET_MODULE_RECENT_ACTIONS_STORE`` is enabled.
+    """
+
+    log_entry = models.OneToOneField(
+        LogEntry, verbose_name=_("log entry"), on_delete=models.CASCADE, related_name="+"
+    )
+    action_time = models.DateTimeField(verbose_name=_("action time"), db_index=True)
+    user = models.PositiveIntegerField(verbose_name=_("user"))
+    user_repr = models.CharField(verbose_name=_("user repr"), max_length=255)
+    content_type = models.ForeignKey(
+        ContentType, verbose_name=_("content type"), on_delete=models.CASCADE, null=True, blank=True, related_name="+"
+    )
+    object_repr = models.CharField(verbose_name=_("object repr"), max_length=200)
+    action_flag = models.PositiveSmallIntegerField(verbose_name=_("action flag"))
+    change_message = models.TextField(verbose_name=_("change message"), blank=True)
+    admin_url = models.CharField(verbose_name=_("admin URL"), max_length=255, blank=True)
+
+    class Meta:
+        verbose_name = _("recent action")
+        verbose_name_plural = _("recent actions")
+        ordering = ("-action_time",)
+        indexes = [models.Index(fields=["content_type", "-action_time"])]
+
+    def __str__(self):
+        return self.object_repr
+
+    @classmethod
+    def from_log_entry(cls, log_entry):
+        return cls(
+            log_entry_id=log_entry.pk,
+            action_time=log_entry.action_time,
+            user=log_entry.user_id,
+            user_repr=str(log_entry.user),
+            content_type_id=log_entry.content_type_id,
+            object_repr=log_entry.object_repr,
+            action_flag=log_entry.action_flag,
+            change_message=log_entry.get_change_message(),
+            admin_url=log_entry.get_admin_url() or "",
+        )
+
+    @classmethod
+    def trim(cls, content_type_id, size=None):
+        """
+        Removes all but ``size`` latest actions of content type.
+        """
+        size = dashboard_settings.JET_MODULE_RECENT_ACTIONS_STORE_SIZE if size is None else size
+        pks = list(
+            cls.objects.filter(content_type_id=content_type_id)
+            .order_by("-action_time", "-pk")
+            .values_list("pk", flat=True)[size:]
+        )
+
+        if pks:
+            cls.objects.filter(pk__in=pks).delete()
+
+    def is_addition(self):
+        return self.action_flag == ADDITION
+
+    def is_change(self):
+        return self.action_flag == CHANGE
+
+    def is_deletion(self):
+        return self.action_flag == DELETION
+
+    def get_change_message(self):
+        return self.change_message
+
+    def get_admin_url(self):
+        return self.admin_url
+
+
+def update_recent_actions(sender, instance, created, raw=False, **kwargs):
+    if not dashboard_settings.JET_MODULE_RECENT_ACTIONS_STORE or not created or raw:
+        return
+
+    RecentAction.from_log_entry(instance).save()
+    RecentAction.trim(instance.content_type_id)
+
+
+def store_recent_actions(log_entries):
+    """
+    Copies ``LogEntry`` rows created without ``post_save`` signal, like bulk created ones of admin actions.
+    """
+    if not dashboard_settings.JET_MODULE_RECENT_ACTIONS_STORE or not log_entries:
+        return
+
+    # Not all database backends set primary keys on bulk created objects
+    if any(log_entry.pk is None for log_entry in log_entries):
+        log_entries = list(
+            LogEntry.objects.filter(
+                user_id__in={log_entry.user_id for log_entry in log_entries},
+                content_type_id__in={log_entry.content_type_id for log_entry in log_entries},
+                object_id__in={log_entry.object_id for log_entry in log_entries},
+                action_flag__in={log_entry.action_flag for log_entry in log_entries},
+            )
+            .select_related("user")
+            .order_by("-pk")[: len(log_entries)]
+        )
+
+    stored = set(RecentAction.objects.filter(log_entry__in=log_entries).values_list("log_entry_id", flat=True))
+    users = {}
+
+    for log_entry in log_entries:
+        # admin actions log all objects for a single user, which is loaded once
+        if log_entry.user_id in users:
+            log_entry.user = users[log_entry.user_id]
+        else:
+            users[log_entry.user_id] = log_entry.user
+
+    RecentAction.objects.bulk_create(
+        [RecentAction.from_log_entry(log_entry) for log_entry in log_entries if log_entry.pk not in stored]
+    )
+
+    for content_type_id in {log_entry.content_type_id for log_entry in log_entries}:
+        RecentAction.trim(content_type_id)
+
+
+def store_bulk_logged_actions(log_actions):
+    """
+    Wraps ``LogEntryManager.log_actions()``, which bulk creates entries of multiple objects (e.g. deleted with
+    ``delete_selected`` admin action) without ``post_save`` signal handled by ``update_recent_actions``.
+    """
+
+    @functools.wraps(log_actions)
+    def wrapper(self, *args, **kwargs):
+        log_entries = log_actions(self, *args, **kwargs)
+
+        # single entry is saved and stored by update_recent_actions
+        if isinstance(log_entries, list) and len(log_entries) > 1:
+            store_recent_actions(log_entries)
+
+        return log_entries
+
+    wrapper.stores_recent_actions = True
+    return wrapper
@@ -1,13 +1,24 @@
 import datetime
+import hashlib
 import json
+import time
 
+from asgiref.sync import sync_to_async
 from django import forms
+from django.apps import apps
 from django.contrib.admin.models import LogEntry
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
 from django.db.models import Q
 from django.template.loader import render_to_string
+from django.utils import translation
 from django.utils.translation import gettext_lazy as _
 
-from jet.utils import LazyDateTimeEncoder, context_to_dict, get_app_list
+from jet.dashboard import settings as dashboard_settings
+from jet.dashboard.feeds import get_feed_entries
+from jet.dashboard.models import RecentAction
+from jet.dashboard.utils import get_model_pattern_matcher, get_permissions_fingerprint, run_in_thread
+from jet.utils import LazyDateTimeEncoder, context_to_dict, get_admin_site_name, get_app_list
 
 
 class DashboardModule:
@@ -63,12 +74,30 @@ class DashboardModule:
     #: later via AJAX.
     ajax_load = False
 
+    #: Set when widget is rendered into already sent dashboard page (see ``DashboardStreamingMiddleware``).
+    stream_load = False
+
     #: A boolean field which makes widget ui color contrast.
     contrast = False
 
     #: Optional style attributes which will be applied to widget content container.
     style = False
 
+    #: Number of seconds rendered widget content is cached for. ``None`` disables caching.
+    cache_timeout = None
+
+    #: Number of seconds expired content may still be served while another request renders it again.
+    cache_stale_timeout = 60
+
+    #: What cached widget content depends on. Allowed values: ``user``, ``permissions``, ``settings``, ``language``,
+    #: ``admin_site``.
+    cache_vary = ("user", "settings", "language", "admin_site")
+    context_initialized = False
+    cache_entry = None
+
+    #: Data version the widget is rendered with when dashboard polls for changes (see ``get_data_version``).
+    data_version = None
+
     class Media:
         css = ()
         js = ()
@@ -116,32 +145,25 @@ class DashboardModule:
     def dump_settings(self, settings=None):
         settings = settings or self.settings_dict()
         if settings:
-            return json.dumps(settings, cls=LazyDateTimeEncoder)
+            return json.loads(json.dumps(settings, cls=LazyDateTimeEncoder))
         else:
-            return ""
+            return {}
 
     def dump_children(self):
         if self.store_children():
-            return json.dumps(self.children, cls=LazyDateTimeEncoder)
+            return json.loads(json.dumps(self.children, cls=LazyDateTimeEncoder))
         else:
-            return ""
+            return []
 
     def load_from_model(self):
         self.title = self.model.title
 
         if self.model.settings:
-            try:
-                self.settings = json.loads(self.model.settings)
-                self.load_settings(self.settings)
-            except ValueError:
-                pass
+            self.settings = self.model.settings
+            self.load_settings(self.settings)
 
         if self.store_children() and self.model.children:
-            try:
-                children = json.loads(self.model.children)
-                self.load_children(children)
-            except ValueError:
-                pass
+            self.load_children(self.model.children)
 
     def init_with_context(self, context):
         """
@@ -149,15 +171,110 @@ class DashboardModule:
         """
         pass
 
+    async def ainit_with_context(self, context):
+        """
+        Asynchronous version of ``init_with_context`` used by async dashboard views. Can be overridden by modules
+        awaiting network requests, by default ``init_with_context`` is run in a separate thread.
+        """
+        await run_in_thread(self.init_with_context, context)
+
     def get_context_data(self):
         context = context_to_dict(self.context)
         context.update({"module": self})
         return context
 
-    def render(self):
-        self.init_with_context(self.context)
+    def get_cache_key(self):
+        if self.cache_timeout is None:
+            return
+
+        request = self.context.get("request")
+        vary = []
+
+        for key in self.cache_vary:
+            if key == "user":
+                vary.append(request.user.pk if request is not None else None)
+            elif key == "permissions":
+                vary.append(get_permissions_fingerprint(request.user) if request is not None else None)
+            elif key == "settings":
+                vary.extend([self.dump_settings(), self.dump_children()])
+            elif key == "language":
+                vary.append(translation.get_language())
+            elif key == "admin_site":
+                vary.append(get_admin_site_name(self.context))
+
+        vary_hash = hashlib.md5(json.dumps(vary, cls=LazyDateTimeEncoder).encode("utf-8")).hexdigest()
+
+        return "jet.dashboard.module.%s.%s" % (self.fullname(), vary_hash)
+
+    def get_cache_entry(self):
+        """
+        Returns ``(content, expires)`` tuple of cached widget content or ``None``.
+        """
+        if self.cache_entry is None:
+            cache_key = self.get_cache_key()
+            self.cache_entry = cache.get(cache_key) if cache_key is not None else None
+        return self.cache_entry
+
+    def is_cache_fresh(self):
+        entry = self.get_cache_entry()
+        return entry is not None and entry[1] > time.time()
+
+    def render_content(self):
+        if not self.context_initialized:
+            self.init_with_context(self.context)
+            self.context_initialized = True
         return render_to_string(self.template, self.get_context_data())
 
+    def get_data_version(self):
+        """
+        Should return cheap token changing when widget content changes or ``None`` if changes are not tracked.
+        Dashboards polling for changes reload only widgets with changed tokens. By default expiration time of cached
+        content is returned for widgets with ``cache_timeout``, or ``"0"`` once cached content is evicted.
+        """
+        if self.get_cache_key() is None:
+            return
+
+        entry = self.get_cache_entry()
+
+        return "%.6f" % entry[1] if entry is not None else "0"
+
+    async def arender(self):
+        if not self.context_initialized and not await sync_to_async(self.is_cache_fresh)():
+            await self.ainit_with_context(self.context)
+            self.context_initialized = True
+
+        return await sync_to_async(self.render)()
+
+    def render(self):
+        cache_key = self.get_cache_key()
+
+        if cache_key is None:
+            return self.render_content()
+
+        entry = self.get_cache_entry()
+        lock_key = cache_key + ".lock"
+        locked = False
+
+        if entry is not None:
+            if self.is_cache_fresh():
+                return entry[0]
+
+            # only one request renders expired content again, others are served stale copy meanwhile
+            locked = cache.add(lock_key, True, self.cache_stale_timeout)
+
+            if not locked:
+                return entry[0]
+
+        try:
+            content = self.render_content()
+            self.cache_entry = (content, time.time() + self.cache_timeout)
+            cache.set(cache_key, self.cache_entry, self.cache_timeout + self.cache_stale_timeout)
+        finally:
+            if locked:
+                cache.delete(lock_key)
+
+        return content
+
 
 class LinkListItemForm(forms.Form):
     url = forms.CharField(label=_("URL"))
@@ -270,6 +387,23 @@ class LinkList(DashboardModule):
             return link
 
 
+def filter_app_models(app, models_matcher, exclude_matcher):
+    """
+    Returns ``app`` models matched by ``models_matcher`` and not matched by ``exclude_matcher``.
+    """
+    if models_matcher is None and exclude_matcher is None:
+        return app["models"]
+
+    app_name = app.get("app_label", app.get("name", ""))
+
+    return [
+        model
+        for model in app["models"]
+        if (models_matcher is None or models_matcher.matches(app_name, model["object_name"]))
+        and (exclude_matcher is None or not exclude_matcher.matches(app_name, model["object_name"]))
+    ]
+
+
 class AppList(DashboardModule):
     """
     Shows applications and containing models links. For each model "created" and "change" links are displayed.
@@ -300,11 +434,13 @@ class AppList(DashboardModule):
     template = "jet.dashboard/modules/app_list.html"
 
     #: Specify models which should be displayed. ``models`` is an array of string formatted as ``app_label.model``.
-    #: Also its possible to specify all application models with * sign (e.g. ``auth.*``).
+    #: Also its possible to specify all application models with * sign (e.g. ``auth.*``) or other glob patterns
+    #: (e.g. ``auth.Perm*``).
     models = None
 
     #: Specify models which should NOT be displayed. ``exclude`` is an array of string formatted as ``app_label.model``.
-    #: Also its possible to specify all application models with * sign (e.g. ``auth.*``).
+    #: Also its possible to specify all application models with * sign (e.g. ``auth.*``) or other glob patterns
+    #: (e.g. ``auth.Perm*``).
     exclude = None
     hide_empty = True
 
@@ -316,32 +452,15 @@ class AppList(DashboardModule):
         self.exclude = settings.get("exclude")
 
     def init_with_context(self, context):
-        app_list = get_app_list(context)
-        app_to_remove = []
-
-        for app in app_list:
-            app_name = app.get("app_label", app.get("name", ""))
-            app["models"] = filter(
-                lambda model: self.models is None
-                or ("%s.%s" % (app_name, model["object_name"])) in self.models
-                or ("%s.*" % app_name) in self.models,
-                app["models"],
-            )
-            app["models"] = filter(
-                lambda model: self.exclude is None
-                or (
-                    ("%s.%s" % (app_name, model["object_name"])) not in self.exclude
-                    and ("%s.*" % app_name) not in self.exclude
-                ),
-                app["models"],
-            )
-            app["models"] = list(app["models"])
+        models_matcher = get_model_pattern_matcher(self.models)
+        exclude_matcher = get_model_pattern_matcher(self.exclude)
+        app_list = []
 
-            if self.hide_empty and len(list(app["models"])) == 0:
-                app_to_remove.append(app)
+        for app in get_app_list(context):
+            app["models"] = filter_app_models(app, models_matcher, exclude_matcher)
 
-        for app in app_to_remove:
-            app_list.remove(app)
+            if not self.hide_empty or app["models"]:
+                app_list.append(app)
 
         self.children = app_list
 
@@ -376,11 +495,13 @@ class ModelList(DashboardModule):
     template = "jet.dashboard/modules/model_list.html"
 
     #: Specify models which should be displayed. ``models`` is an array of string formatted as ``app_label.model``.
-    #: Also its possible to specify all application models with * sign (e.g. ``auth.*``).
+    #: Also its possible to specify all application models with * sign (e.g. ``auth.*``) or other glob patterns
+    #: (e.g. ``auth.Perm*``).
     models = None
 
     #: Specify models which should NOT be displayed. ``exclude`` is an array of string formatted as ``app_label.model``.
-    #: Also its possible to specify all application models with * sign (e.g. ``auth.*``).
+    #: Also its possible to specify all application models with * sign (e.g. ``auth.*``) or other glob patterns
+    #: (e.g. ``auth.Perm*``).
     exclude = None
     hide_empty = True
 
@@ -392,28 +513,13 @@ class ModelList(DashboardModule):
         self.exclude = settings.get("exclude")
 
     def init_with_context(self, context):
+        models_matcher = get_model_pattern_matcher(self.models)
+        exclude_matcher = get_model_pattern_matcher(self.exclude)
         app_list = get_app_list(context)
         models = []
 
         for app in app_list:
-            app_name = app.get("app_label", app.get("name", ""))
-            app["models"] = filter(
-                lambda model: self.models is None
-                or ("%s.%s" % (app_name, model["object_name"])) in self.models
-                or ("%s.*" % app_name) in self.models,
-                app["models"],
-            )
-            app["models"] = filter(
-                lambda model: self.exclude is None
-                or (
-                    ("%s.%s" % (app_name, model["object_name"])) not in self.exclude
-                    and ("%s.*" % app_name) not in self.exclude
-                ),
-                app["models"],
-            )
-            app["models"] = list(app["models"])
-
-            models.extend(app["models"])
+            models.extend(filter_app_models(app, models_matcher, exclude_matcher))
 
         self.children = models
 
@@ -467,6 +573,9 @@ class RecentActions(DashboardModule):
     settings_form = RecentActionsSettingsForm
     user = None
 
+    #: Cursor of the entries following shown ones, they are loaded on scroll.
+    next_cursor = None
+
     def __init__(self, title=None, limit=10, **kwargs):
         kwargs.update({"limit": limit})
         super(RecentActions, self).__init__(title, **kwargs)
@@ -485,37 +594,98 @@ class RecentActions(DashboardModule):
         self.exclude_list = settings.get("exclude_list")
         self.user = settings.get("user", None)
 
-    def init_with_context(self, context):
-        def get_qset(list):
-            qset = None
-            for contenttype in list:
+    def get_content_type_ids(self, patterns):
+        """
+        Resolves ``app_label.model`` patterns to content type ids through ``ContentType`` manager cache.
+        Application wildcards are expanded to models of installed applications.
+        """
+        content_type_ids = set()
+        models = []
+
+        for pattern in patterns:
+            try:
+                app_label, model = pattern.split(".")
+            except ValueError:
+                raise ValueError('Invalid contenttype: "%s"' % pattern)
+
+            if model == "*":
                 try:
-                    app_label, model = contenttype.split(".")
+                    models.extend(apps.get_app_config(app_label).get_models())
+                except LookupError:
+                    pass
+            else:
+                try:
+                    content_type_ids.add(ContentType.objects.get_by_natural_key(app_label, model).pk)
+                except ContentType.DoesNotExist:
+                    pass
+
+        if models:
+            # proxy models are logged with their own content types
+            content_types = ContentType.objects.get_for_models(*models, for_concrete_models=False)
+            content_type_ids.update(content_type.pk for content_type in content_types.values())
+
+        return content_type_ids
+
+    def get_queryset(self):
+        if dashboard_settings.JET_MODULE_RECENT_ACTIONS_STORE:
+            return RecentAction.objects.order_by("-action_time", "-pk")
+
+        # users are loaded with all their fields, as user model __str__ may use any of them;
+        # content types are taken from ContentType cache
+        return LogEntry.objects.order_by("-action_time", "-pk").select_related("user")
 
-                    if model == "*":
-                        current_qset = Q(content_type__app_label=app_label)
-                    else:
-                        current_qset = Q(content_type__app_label=app_label, content_type__model=model)
-                except:
-                    raise ValueError('Invalid contenttype: "%s"' % contenttype)
+    @staticmethod
+    def dump_cursor(entry):
+        return "%s_%d" % (entry.action_time.isoformat(), entry.pk)
 
-                if qset is None:
-                    qset = current_qset
-                else:
-                    qset = qset | current_qset
-            return qset
+    @staticmethod
+    def parse_cursor(cursor):
+        """
+        Returns ``(action_time, pk)`` tuple of the last entry of previous page. Raises ``ValueError`` if invalid.
+        """
+        action_time, pk = cursor.rsplit("_", 1)
+        return datetime.datetime.fromisoformat(action_time), int(pk)
 
-        qs = LogEntry.objects
+    def get_filtered_queryset(self):
+        qs = self.get_queryset()
 
         if self.user:
-            qs = qs.filter(user__pk=int(self.user))
+            qs = qs.filter(user=int(self.user))
 
         if self.include_list:
-            qs = qs.filter(get_qset(self.include_list))
+            qs = qs.filter(content_type_id__in=self.get_content_type_ids(self.include_list))
         if self.exclude_list:
-            qs = qs.exclude(get_qset(self.exclude_list))
+            qs = qs.exclude(content_type_id__in=self.get_content_type_ids(self.exclude_list))
+
+        return qs
 
-        self.children = qs.select_related("content_type", "user")[: int(self.limit)]
+    def get_entries(self, cursor=None):
+        """
+        Returns ``limit`` entries following ``cursor`` (or the latest ones) and cursor of the next page
+        (``None`` if there are no more entries).
+        """
+        qs = self.get_filtered_queryset()
+        limit = int(self.limit)
+
+        if cursor is not None:
+            action_time, pk = cursor
+            qs = qs.filter(Q(action_time__lt=action_time) | Q(action_time=action_time, pk__lt=pk))
+
+        entries = list(qs[: limit + 1])
+        next_cursor = self.dump_cursor(entries[limit - 1]) if len(entries) > limit else None
+        entries = entries[:limit]
+
+        for entry in entries:
+            if entry.content_type_id is not None:
+                entry.content_type = ContentType.objects.get_for_id(entry.content_type_id)
+
+        return entries, next_cursor
+
+    def get_data_version(self):
+        return str(self.get_filtered_queryset().values_list("pk", flat=True).first() or 0)
+
+    def init_with_context(self, context):
+        self.children, self.next_cursor = self.get_entries()
 
 
 class FeedSettingsForm(forms.Form):
@@ -576,22 +746,12 @@ class Feed(DashboardModule):
     def init_with_context(self, context):
         if self.feed_url is not None:
             try:
-                import feedparser
-
-                feed = feedparser.parse(self.feed_url)
+                entries = get_feed_entries(self.feed_url, self.limit)
 
                 if self.limit is not None:
-                    entries = feed["entries"][: self.limit]
-                else:
-                    entries = feed["entries"]
-
-                for entry in entries:
-                    try:
-                        entry.date = datetime.date(*entry.published_parsed[0:3])
-                    except Exception:
-                        pass
+                    entries = entries[: self.limit]
 
-                    self.children.append(entry)
+                self.children.extend(entries)
             except ImportError:
                 self.children.append(
                     {
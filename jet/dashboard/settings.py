@@ -5,3 +5,17 @@ JET_INDEX_DASHBOARD = getattr(settings, "JET_INDEX_DASHBOARD", "jet.dashboard.da
 JET_APP_INDEX_DASHBOARD = getattr(
     settings, "JET_APP_INDEX_DASHBOARD", "jet.dashboard.dashboard.DefaultAppIndexDashboard"
 )
+JET_DASHBOARD_STORAGE = getattr(settings, "JET_DASHBOARD_STORAGE", "jet.dashboard.storage.ModuleRowsStorage")
+JET_DASHBOARD_SHARED_TEMPLATES = getattr(settings, "JET_DASHBOARD_SHARED_TEMPLATES", False)
+JET_DASHBOARD_MODULES_WORKERS = getattr(settings, "JET_DASHBOARD_MODULES_WORKERS", 0)
+JET_DASHBOARD_MODULES_TIMEOUT = getattr(settings, "JET_DASHBOARD_MODULES_TIMEOUT", 10)
+JET_DASHBOARD_MAX_THREADS = getattr(settings, "JET_DASHBOARD_MAX_THREADS", 32)
+JET_DASHBOARD_ASYNC = getattr(settings, "JET_DASHBOARD_ASYNC", False)
+JET_DASHBOARD_STREAM_TIMEOUT = getattr(settings, "JET_DASHBOARD_STREAM_TIMEOUT", 0.1)
+JET_DASHBOARD_POLL_INTERVAL = getattr(settings, "JET_DASHBOARD_POLL_INTERVAL", 0)
+JET_MODULE_FEED_REFRESH_INTERVAL = getattr(settings, "JET_MODULE_FEED_REFRESH_INTERVAL", 300)
+JET_MODULE_FEED_TIMEOUT = getattr(settings, "JET_MODULE_FEED_TIMEOUT", 10)
+JET_MODULE_FEED_STORE_TIMEOUT = getattr(settings, "JET_MODULE_FEED_STORE_TIMEOUT", 60 * 60 * 24)
+JET_MODULE_FEED_MAX_BYTES = getattr(settings, "JET_MODULE_FEED_MAX_BYTES", 1024 * 1024)
+JET_MODULE_RECENT_ACTIONS_STORE = getattr(settings, "JET_MODULE_RECENT_ACTIONS_STORE", False)
+JET_MODULE_RECENT_ACTIONS_STORE_SIZE = getattr(settings, "JET_MODULE_RECENT_ACTIONS_STORE_SIZE", 100)
@@ -0,0 +1,348 @@
+from django.contrib.auth import get_user_model
+from django.db import transaction
+
+from jet.dashboard import settings
+from jet.dashboard.models import UserDashboardLayout, UserDashboardModule
+from jet.dashboard.utils import get_current_dashboard, resolve_class
+from jet.utils import user_is_authenticated
+
+#: ``app_label`` of widget lookups made without knowing which dashboard widget belongs to
+ANY_APP_LABEL = object()
+
+
+def get_storage():
+    """
+    Returns instance of storage class specified in ``JET_DASHBOARD_STORAGE`` setting.
+    """
+    return resolve_class(settings.JET_DASHBOARD_STORAGE)()
+
+
+def lock_user(user_pk):
+    # Locking user row makes concurrent changes of user layouts wait for each other
+    get_user_model()._default_manager.select_for_update().filter(pk=user_pk).first()
+
+
+def get_request_app_label(data):
+    """
+    Returns ``app_label`` of dashboard sent with request ``data`` (empty for index dashboard), or ``ANY_APP_LABEL``
+    if it was not sent.
+    """
+    if "app_label" not in data:
+        return ANY_APP_LABEL
+
+    return data["app_label"] or None
+
+
+def parse_pk(pk):
+    try:
+        return int(pk)
+    except (TypeError, ValueError):
+        raise UserDashboardModule.DoesNotExist
+
+
+def get_template_dashboard(request, app_label):
+    dashboard_cls = get_current_dashboard("app_index" if app_label else "index")
+    return dashboard_cls({"request": request}, app_label=app_label, spec=True)
+
+
+def get_user_modules(request, app_label):
+    """
+    Returns widgets of request user dashboard, or shared template widgets if user has not changed it yet.
+    """
+    module_models = get_storage().get_modules(request.user.pk, app_label)
+
+    if len(module_models) == 0 and settings.JET_DASHBOARD_SHARED_TEMPLATES:
+        module_models = get_template_dashboard(request, app_label).get_template_module_models(request.user)
+
+    return module_models
+
+
+def materialize_template(request, app_label):
+    """
+    Copies shared template dashboard to request user on first change.
+    Returns copied widgets by ids of template widgets, empty if user dashboard was already copied.
+    """
+    if len(get_storage().get_modules(request.user.pk, app_label)) > 0:
+        return {}
+
+    dashboard = get_template_dashboard(request, app_label)
+    module_models = dashboard.create_initial_module_models(request.user)
+
+    # copies are saved in order of dashboard children, same as template widgets ids are assigned
+    return {-(i + 1): module_model for i, module_model in enumerate(module_models)}
+
+
+def get_user_module(request, pk, app_label=ANY_APP_LABEL, materialize=False):
+    """
+    Returns widget of request user. Negative ``pk`` refers to shared template widget of ``app_label`` dashboard,
+    with ``materialize`` template is copied to user first and the copy is returned.
+    """
+    pk = parse_pk(pk)
+
+    if pk > 0 or not settings.JET_DASHBOARD_SHARED_TEMPLATES:
+        return get_storage().get_module(request.user.pk, pk, app_label)
+
+    if not user_is_authenticated(request.user) or not request.user.is_staff:
+        raise UserDashboardModule.DoesNotExist
+
+    if app_label is ANY_APP_LABEL:
+        app_label = None
+
+    if materialize:
+        module_models = materialize_template(request, app_label)
+    else:
+        # template widgets are not found once user dashboard was copied
+        module_models = {module_model.pk: module_model for module_model in get_user_modules(request, app_label)}
+
+    try:
+        return module_models[pk]
+    except KeyError:
+        raise UserDashboardModule.DoesNotExist
+
+
+def get_user_modules_in(request, pks, app_label=ANY_APP_LABEL):
+    """
+    Returns widgets of request user with given ids, negative ids refer to shared template widgets.
+    """
+    module_models = get_storage().get_modules_in(request.user.pk, [pk for pk in pks if pk > 0], app_label)
+    template_pks = {pk for pk in pks if pk < 0}
+
+    if template_pks and settings.JET_DASHBOARD_SHARED_TEMPLATES:
+        template_app_label = None if app_label is ANY_APP_LABEL else app_label
+        template_models = get_template_dashboard(request, template_app_label).get_template_module_models(
+            request.user
+        )
+        module_models += [module_model for module_model in template_models if module_model.pk in template_pks]
+
+    return module_models
+
+
+class ModuleRowsStorage:
+    """
+    Stores each user widget in its own ``UserDashboardModule`` row.
+    """
+
+    def get_modules(self, user_pk, app_label):
+        return list(UserDashboardModule.objects.filter(user=user_pk, app_label=app_label))
+
+    def get_module(self, user_pk, pk, app_label=ANY_APP_LABEL):
+        # widgets are looked up by primary key, ``app_label`` is not needed to find them
+        return UserDashboardModule.objects.get(pk=parse_pk(pk), user=user_pk)
+
+    def get_modules_in(self, user_pk, pks, app_label=ANY_APP_LABEL):
+        return list(UserDashboardModule.objects.filter(user=user_pk, pk__in=pks))
+
+    def get_dashboards(self, user_pks):
+        """
+        Returns ``(user_pk, app_label)`` pairs of created dashboards.
+        """
+        return list(
+            UserDashboardModule.objects.filter(user__in=user_pks)
+            .values_list("user", "app_label")
+            .order_by("user", "app_label")
+            .distinct()
+        )
+
+    def create_modules(self, user_pk, app_label, module_models):
+        """
+        Saves initial widgets of a dashboard unless it was already created concurrently.
+        Returns saved widgets in the given order.
+        """
+        user_modules = UserDashboardModule.objects.filter(app_label=app_label, user=user_pk)
+
+        with transaction.atomic():
+            lock_user(user_pk)
+
+            existing_module_models = list(user_modules)
+
+            if len(existing_module_models) > 0:
+                return existing_module_models
+
+            module_models = UserDashboardModule.objects.bulk_create(module_models)
+
+        # Not all database backends set primary keys on bulk created objects
+        if any(module_model.pk is None for module_model in module_models):
+            return list(user_modules.order_by("pk"))
+
+        return module_models
+
+    def add_module(self, module_model):
+        module_model.save()
+
+    def update_positions(self, module_models):
+        UserDashboardModule.objects.bulk_update(module_models, ["column", "order"])
+
+    def update_collapsed(self, module_models):
+        UserDashboardModule.objects.bulk_update(module_models, ["collapsed"])
+
+    def reset(self, user_pk, app_label):
+        UserDashboardModule.objects.filter(user=user_pk, app_label=app_label).delete()
+
+
+class LayoutStorage:
+    """
+    Stores the whole dashboard of a user (widgets, positions, collapsed flags, settings) in a single
+    ``UserDashboardLayout`` row, loaded with one lookup by unique ``(user, app_label)`` index.
+
+    Widgets are still represented by unsaved ``UserDashboardModule`` instances, their ``save()`` and
+    ``delete()`` update the layout row instead.
+    """
+
+    fields = ("title", "module", "column", "order", "settings", "children", "collapsed")
+
+    def to_entry(self, module_model):
+        entry = {"id": module_model.pk}
+        entry.update((field, getattr(module_model, field)) for field in self.fields)
+        return entry
+
+    def to_model(self, layout, entry):
+        module_model = UserDashboardModule(app_label=layout.app_label or None, user=layout.user, **entry)
+        module_model._state.adding = False
+        module_model._state.db = layout._state.db
+        module_model.layout_storage = self
+        return module_model
+
+    def get_layouts(self, user_pk):
+        return UserDashboardLayout.objects.filter(user=user_pk)
+
+    def get_user_modules(self, user_pk):
+        for layout in self.get_layouts(user_pk):
+            for entry in layout.modules:
+                yield self.to_model(layout, entry)
+
+    def get_next_pk(self, user_pk):
+        return max((entry["id"] for layout in self.get_layouts(user_pk) for entry in layout.modules), default=0) + 1
+
+    def get_modules(self, user_pk, app_label):
+        layout = UserDashboardLayout.objects.filter(user=user_pk, app_label=app_label or "").first()
+
+        if layout is None:
+            return []
+
+        module_models = [self.to_model(layout, entry) for entry in layout.modules]
+        module_models.sort(key=lambda module_model: (module_model.column, module_model.order))
+
+        return module_models
+
+    def get_dashboard_modules(self, user_pk, app_label):
+        """
+        Returns widgets of ``app_label`` dashboard, or of all user dashboards for ``ANY_APP_LABEL``.
+        """
+        if app_label is ANY_APP_LABEL:
+            return self.get_user_modules(user_pk)
+
+        return self.get_modules(user_pk, app_label)
+
+    def get_module(self, user_pk, pk, app_label=ANY_APP_LABEL):
+        pk = parse_pk(pk)
+
+        for module_model in self.get_dashboard_modules(user_pk, app_label):
+            if module_model.pk == pk:
+                return module_model
+
+        raise UserDashboardModule.DoesNotExist
+
+    def get_modules_in(self, user_pk, pks, app_label=ANY_APP_LABEL):
+        pks = set(pks)
+        return [
+            module_model for module_model in self.get_dashboard_modules(user_pk, app_label) if module_model.pk in pks
+        ]
+
+    def get_dashboards(self, user_pks):
+        dashboards = (
+            UserDashboardLayout.objects.filter(user__in=user_pks)
+            .exclude(modules=[])
+            .values_list("user", "app_label")
+            .order_by("user", "app_label")
+        )
+        return [(user_pk, app_label or None) for user_pk, app_label in dashboards]
+
+    def update_layout(self, user_pk, app_label, update):
+        """
+        Replaces widget entries of a locked layout row with ``update(entries)`` result.
+        """
+        with transaction.atomic():
+            layout, created = UserDashboardLayout.objects.select_for_update().get_or_create(
+                user=user_pk, app_label=app_label or ""
+            )
+            layout.modules = update(layout.modules)
+            layout.save()
+
+        return layout
+
+    def create_modules(self, user_pk, app_label, module_models):
+        with transaction.atomic():
+            lock_user(user_pk)
+
+            existing_module_models = self.get_modules(user_pk, app_label)
+
+            if len(existing_module_models) > 0:
+                return existing_module_models
+
+            next_pk = self.get_next_pk(user_pk)
+
+            for i, module_model in enumerate(module_models):
+                module_model.pk = next_pk + i
+
+            layout = self.update_layout(
+                user_pk, app_label, lambda entries: [self.to_entry(module_model) for module_model in module_models]
+            )
+
+        return [self.to_model(layout, entry) for entry in layout.modules]
+
+    def add_module(self, module_model):
+        with transaction.atomic():
+            lock_user(module_model.user)
+
+            if module_model.pk is None:
+                module_model.pk = self.get_next_pk(module_model.user)
+
+            self.update_layout(
+                module_model.user, module_model.app_label, lambda entries: entries + [self.to_entry(module_model)]
+            )
+
+        module_model._state.adding = False
+        module_model.layout_storage = self
+
+    def save_module(self, module_model):
+        entry = self.to_entry(module_model)
+
+        def update(entries):
+            return [entry if current["id"] == entry["id"] else current for current in entries]
+
+        self.update_layout(module_model.user, module_model.app_label, update)
+
+    def delete_module(self, module_model):
+        def update(entries):
+            return [entry for entry in entries if entry["id"] != module_model.pk]
+
+        self.update_layout(module_model.user, module_model.app_label, update)
+
+    def update_fields(self, module_models, fields):
+        """
+        Updates ``fields`` of widget entries, each layout row is written once.
+        """
+        layouts = {}
+
+        for module_model in module_models:
+            values = layouts.setdefault((module_model.user, module_model.app_label), {})
+            values[module_model.pk] = {field: getattr(module_model, field) for field in fields}
+
+        for (user_pk, app_label), values in layouts.items():
+
+            def update(entries, values=values):
+                for entry in entries:
+                    if entry["id"] in values:
+                        entry.update(values[entry["id"]])
+                return entries
+
+            self.update_layout(user_pk, app_label, update)
+
+    def update_positions(self, module_models):
+        self.update_fields(module_models, ["column", "order"])
+
+    def update_collapsed(self, module_models):
+        self.update_fields(module_models, ["collapsed"])
+
+    def reset(self, user_pk, app_label):
+        UserDashboardLayout.objects.filter(user=user_pk, app_label=app_label or "").delete()
@@ -0,0 +1,78 @@
+from concurrent.futures import TimeoutError, as_completed
+from itertools import chain
+
+from django.http import StreamingHttpResponse
+from django.template.loader import render_to_string
+
+
+class DashboardStream:
+    """
+    Widgets of a dashboard page which are still being initialized when the page is rendered. Page is sent
+    with placeholders and widgets are streamed into them as they complete.
+    """
+
+    def __init__(self):
+        self.pending = []
+        self.timeout = None
+
+    def add(self, module, future):
+        module.stream_load = True
+        self.pending.append((module, future))
+
+    def render_module(self, module, content=None):
+        return render_to_string("jet.dashboard/module_stream.html", {"module": module, "content": content})
+
+    def __iter__(self):
+        futures = {future: module for module, future in self.pending}
+
+        try:
+            for future in as_completed(list(futures), timeout=self.timeout):
+                module = futures.pop(future)
+
+                try:
+                    future.result()
+                    module.context_initialized = True
+                    content = module.render()
+                except Exception:
+                    # failed widgets are loaded via AJAX instead, which reports the error
+                    content = None
+
+                yield self.render_module(module, content)
+        except TimeoutError:
+            pass
+
+        # widgets not initialized in time are loaded via AJAX
+        for future, module in futures.items():
+            future.cancel()
+            yield self.render_module(module)
+
+
+def get_dashboard_stream(request):
+    return getattr(request, "_jet_dashboard_stream", None)
+
+
+def stream_response(request, response):
+    """
+    Replaces rendered page with streaming response sending widgets left in dashboard stream before ``</body>``.
+    """
+    stream = get_dashboard_stream(request)
+
+    if stream is None or len(stream.pending) == 0:
+        return
+
+    content = response.content
+    index = content.rfind(b"</body>")
+
+    if index == -1:
+        index = len(content)
+
+    streaming_response = StreamingHttpResponse(
+        chain([content[:index]], stream, [content[index:]]), status=response.status_code
+    )
+
+    for header, value in response.items():
+        streaming_response[header] = value
+
+    streaming_response.cookies = response.cookies
+
+    return streaming_response
@@ -1,22 +1,36 @@
-from django.urls import path
+from django.urls import path, register_converter
 from django.views.i18n import JavaScriptCatalog
 
 from jet.dashboard import dashboard
+from jet.dashboard import settings as dashboard_settings
+from jet.dashboard.utils import SignedIntConverter
 from jet.dashboard.views import (
     UpdateDashboardModuleView,
     add_user_dashboard_module_view,
+    aload_dashboard_module_view,
+    aload_dashboard_modules_view,
+    dashboard_modules_versions_view,
     load_dashboard_module_view,
+    load_dashboard_modules_view,
+    load_recent_actions_view,
     remove_dashboard_module_view,
     reset_dashboard_view,
     update_dashboard_module_collapse_view,
+    update_dashboard_modules_collapse_view,
     update_dashboard_modules_view,
 )
 
+register_converter(SignedIntConverter, "signed_int")
+
+if dashboard_settings.JET_DASHBOARD_ASYNC:
+    load_dashboard_module_view = aload_dashboard_module_view
+    load_dashboard_modules_view = aload_dashboard_modules_view
+
 javascript_catalog = JavaScriptCatalog.as_view()
 app_name = "dashboard"
 
 urlpatterns = [
-    path("module/<int:pk>/", UpdateDashboardModuleView.as_view(), name="update_module"),
+    path("module/<signed_int:pk>/", UpdateDashboardModuleView.as_view(), name="update_module"),
     path("update_dashboard_modules/", update_dashboard_modules_view, name="update_dashboard_modules"),
     path("add_user_dashboard_module/", add_user_dashboard_module_view, name="add_user_dashboard_module"),
     path(
@@ -24,8 +38,16 @@ urlpatterns = [
         update_dashboard_module_collapse_view,
         name="update_dashboard_module_collapse",
     ),
+    path(
+        "update_dashboard_modules_collapse/",
+        update_dashboard_modules_collapse_view,
+        name="update_dashboard_modules_collapse",
+    ),
     path("remove_dashboard_module/", remove_dashboard_module_view, name="remove_dashboard_module"),
-    path("load_dashboard_module/<int:pk>/", load_dashboard_module_view, name="load_dashboard_module"),
+    path("load_dashboard_module/<signed_int:pk>/", load_dashboard_module_view, name="load_dashboard_module"),
+    path("load_dashboard_modules/", load_dashboard_modules_view, name="load_dashboard_modules"),
+    path("dashboard_modules_versions/", dashboard_modules_versions_view, name="dashboard_modules_versions"),
+    path("load_recent_actions/<signed_int:pk>/", load_recent_actions_view, name="load_recent_actions"),
     path("reset_dashboard/", reset_dashboard_view, name="reset_dashboard"),
     path("jsi18n/", javascript_catalog, {"packages": "jet"}, name="jsi18n"),
 ]
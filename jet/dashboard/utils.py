@@ -1,21 +1,228 @@
+import asyncio
+import hashlib
+import re
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from fnmatch import translate
+from functools import lru_cache
 from importlib import import_module
 
+from asgiref.sync import sync_to_async
+from django.db import connections
+from django.utils import timezone, translation
+
 from jet.dashboard import settings
 
 
-def get_current_dashboard(location):
+def get_permissions_fingerprint(user):
+    """
+    Returns hash of user permissions, equal for users who see the same admin (``permissions`` value of ``cache_vary``).
+    """
+    permissions = sorted(user.get_all_permissions())
+    return hashlib.md5(("%s:%s" % (user.is_superuser, ",".join(permissions))).encode("utf-8")).hexdigest()
+
+
+# Process-wide cache of dotted paths resolved to classes, ``None`` is stored for paths which failed to import
+_class_registry = {}
+
+
+def resolve_class(path, remember_missing=True):
+    try:
+        return _class_registry[path]
+    except KeyError:
+        pass
+
+    try:
+        module, cls = path.rsplit(".", 1)
+        resolved = getattr(import_module(module), cls)
+    except (ValueError, ImportError, AttributeError):
+        resolved = None
+
+    if resolved is not None or remember_missing:
+        _class_registry[path] = resolved
+
+    return resolved
+
+
+def clear_class_registry(**kwargs):
+    _class_registry.clear()
+
+
+def get_dashboard_path(location):
     if location == "index":
-        path = settings.JET_INDEX_DASHBOARD
+        return settings.JET_INDEX_DASHBOARD
     elif location == "app_index":
-        path = settings.JET_APP_INDEX_DASHBOARD
+        return settings.JET_APP_INDEX_DASHBOARD
     else:
         raise ValueError("Unknown dashboard location: %s" % location)
 
-    module, cls = path.rsplit(".", 1)
 
-    try:
-        module = import_module(module)
-        index_dashboard_cls = getattr(module, cls)
-        return index_dashboard_cls
-    except ImportError:
+def get_current_dashboard(location):
+    return resolve_class(get_dashboard_path(location))
+
+
+class SignedIntConverter:
+    """
+    URL path converter for widget ids, which are negative for shared template widgets.
+    """
+
+    regex = "-?[0-9]+"
+
+    def to_python(self, value):
+        return int(value)
+
+    def to_url(self, value):
+        return str(value)
+
+
+class ModelPatternMatcher:
+    """
+    Tests ``app_label.ObjectName`` model names against ``AppList``/``ModelList`` patterns: exact names,
+    whole application wildcards (``auth.*``) and other glob patterns (``auth.Perm*``).
+    """
+
+    def __init__(self, patterns):
+        self.names = set()
+        self.app_labels = set()
+        globs = []
+
+        for pattern in patterns:
+            app_label, _, name = pattern.partition(".")
+
+            if name == "*" and not re.search(r"[*?\[]", app_label):
+                self.app_labels.add(app_label)
+            elif re.search(r"[*?\[]", pattern):
+                globs.append(translate(pattern))
+            else:
+                self.names.add(pattern)
+
+        self.glob = re.compile("|".join(globs)) if globs else None
+
+    def matches(self, app_label, object_name):
+        if app_label in self.app_labels:
+            return True
+
+        name = "%s.%s" % (app_label, object_name)
+
+        return name in self.names or (self.glob is not None and self.glob.match(name) is not None)
+
+
+@lru_cache(maxsize=256)
+def compile_model_patterns(patterns):
+    return ModelPatternMatcher(patterns)
+
+
+def get_model_pattern_matcher(patterns):
+    """
+    Returns compiled matcher for ``patterns`` or ``None`` if patterns are not specified.
+    """
+    if patterns is None:
         return None
+
+    return compile_model_patterns(tuple(patterns))
+
+
+# Process-wide pool running widget calls of all requests, created on first use
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_executor():
+    """
+    Returns thread pool shared by all requests. Calls which outlive their timeout keep running, so the number of
+    threads (and database connections they hold) is capped with ``JET_DASHBOARD_MAX_THREADS`` instead of growing
+    with every timed out request.
+    """
+    global _executor
+
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=settings.JET_DASHBOARD_MAX_THREADS, thread_name_prefix="jet-dashboard"
+            )
+
+    return _executor
+
+
+def start_concurrently(calls, workers):
+    """
+    Starts ``calls`` (``dict`` of keys and callables) in at most ``workers`` threads of the shared pool with current
+    language and timezone. Returns ``dict`` of keys and futures, cancelled futures are skipped if not started yet.
+    """
+    language = translation.get_language()
+    current_timezone = timezone.get_current_timezone()
+    futures = {key: Future() for key in calls}
+    pending = deque(zip(futures.values(), calls.values()))
+
+    def run():
+        try:
+            while pending:
+                try:
+                    future, func = pending.popleft()
+                except IndexError:
+                    return
+
+                if not future.set_running_or_notify_cancel():
+                    continue
+
+                try:
+                    with translation.override(language), timezone.override(current_timezone):
+                        result = func()
+                except BaseException as e:
+                    future.set_exception(e)
+                else:
+                    future.set_result(result)
+        finally:
+            connections.close_all()
+
+    # each runner takes calls one by one, so that calls of a request use at most ``workers`` threads
+    for _ in range(max(1, min(workers, len(calls)))):
+        get_executor().submit(run)
+
+    return futures
+
+
+def run_concurrently(calls, workers, timeout=None):
+    """
+    Runs ``calls`` (``dict`` of keys and callables) in at most ``workers`` threads with current language
+    and timezone. Returns ``dict`` of keys and results of calls finished within ``timeout`` seconds.
+    """
+    futures = start_concurrently(calls, workers)
+    done, not_done = wait(futures.values(), timeout=timeout)
+
+    for future in not_done:
+        future.cancel()
+
+    return {key: future.result() for key, future in futures.items() if future in done}
+
+
+async def arun_concurrently(calls, timeout=None):
+    """
+    Awaits ``calls`` (``dict`` of keys and coroutines) concurrently. Returns ``dict`` of keys and results
+    of calls finished within ``timeout`` seconds, others are cancelled.
+    """
+    if not calls:
+        return {}
+
+    tasks = {asyncio.ensure_future(coroutine): key for key, coroutine in calls.items()}
+    done, pending = await asyncio.wait(tasks, timeout=timeout)
+
+    for task in pending:
+        task.cancel()
+
+    return {tasks[task]: task.result() for task in done}
+
+
+async def run_in_thread(func, *args, **kwargs):
+    """
+    Runs synchronous ``func`` in a separate thread, so that several calls can run concurrently from async code.
+    """
+
+    def run():
+        try:
+            return func(*args, **kwargs)
+        finally:
+            connections.close_all()
+
+    return await sync_to_async(run, thread_sensitive=False)()
@@ -1,22 +1,35 @@
+import logging
+from functools import partial
+
+from asgiref.sync import sync_to_async
 from django.contrib import messages
 from django.core.exceptions import ValidationError
 from django.forms.formsets import formset_factory
-from django.http import HttpResponseRedirect, JsonResponse
+from django.http import Http404, HttpResponseNotAllowed, HttpResponseRedirect, JsonResponse
+from django.template.loader import render_to_string
 from django.urls import reverse
+from django.utils.http import urlencode
 from django.utils.translation import gettext_lazy as _
 from django.views.decorators.http import require_GET, require_POST
 from django.views.generic import UpdateView
 
+from jet.dashboard import settings as dashboard_settings
 from jet.dashboard.forms import (
     AddUserDashboardModuleForm,
     RemoveDashboardModuleForm,
     ResetDashboardForm,
     UpdateDashboardModuleCollapseForm,
+    UpdateDashboardModulesCollapseForm,
     UpdateDashboardModulesForm,
 )
 from jet.dashboard.models import UserDashboardModule
+from jet.dashboard.modules import RecentActions
+from jet.dashboard.storage import get_request_app_label, get_user_module, get_user_modules, get_user_modules_in
+from jet.dashboard.utils import arun_concurrently, run_concurrently
 from jet.utils import SuccessMessageMixin, get_app_list, user_is_authenticated
 
+logger = logging.getLogger(__name__)
+
 
 class UpdateDashboardModuleView(SuccessMessageMixin, UpdateView):
     model = UserDashboardModule
@@ -35,6 +48,17 @@ class UpdateDashboardModuleView(SuccessMessageMixin, UpdateView):
         else:
             return reverse("admin:index")
 
+    def get_object(self, queryset=None, materialize=False):
+        if self.object is not None and not materialize:
+            return self.object
+
+        try:
+            return get_user_module(
+                self.request, self.kwargs["pk"], get_request_app_label(self.request.GET), materialize=materialize
+            )
+        except UserDashboardModule.DoesNotExist:
+            raise Http404
+
     def get_module(self):
         object = self.object if getattr(self, "object", None) is not None else self.get_object()
         return object.load_module()
@@ -115,6 +139,11 @@ class UpdateDashboardModuleView(SuccessMessageMixin, UpdateView):
         return super(UpdateDashboardModuleView, self).dispatch(request, *args, **kwargs)
 
     def post(self, request, *args, **kwargs):
+        if self.object.is_template:
+            # shared template is copied to user on first change, submitted changes are saved to the copy
+            self.object = self.get_object(materialize=True)
+            self.module = self.get_module()(model=self.object)
+
         settings_form = self.get_settings_form()
         children_formset = self.get_children_formset()
 
@@ -153,6 +182,7 @@ def update_dashboard_modules_view(request):
 
     if form.is_valid():
         form.save()
+        result["reload"] = form.materialized
     else:
         result["error"] = True
 
@@ -184,7 +214,11 @@ def update_dashboard_module_collapse_view(request):
     result = {"error": False}
 
     try:
-        instance = UserDashboardModule.objects.get(pk=request.POST.get("id"))
+        instance = get_user_module(
+            request, request.POST.get("id"), get_request_app_label(request.POST), materialize=True
+        )
+        # shared template widget was copied to user, page is reloaded to refer copies by their ids
+        result["reload"] = str(instance.pk) != request.POST.get("id")
         form = UpdateDashboardModuleCollapseForm(request, request.POST, instance=instance)
 
         if form.is_valid():
@@ -198,12 +232,29 @@ def update_dashboard_module_collapse_view(request):
     return JsonResponse(result)
 
 
+@require_POST
+def update_dashboard_modules_collapse_view(request):
+    result = {"error": False}
+    form = UpdateDashboardModulesCollapseForm(request, request.POST)
+
+    if form.is_valid():
+        form.save()
+        result["reload"] = form.materialized
+    else:
+        result["error"] = True
+
+    return JsonResponse(result)
+
+
 @require_POST
 def remove_dashboard_module_view(request):
     result = {"error": False}
 
     try:
-        instance = UserDashboardModule.objects.get(pk=request.POST.get("id"))
+        instance = get_user_module(
+            request, request.POST.get("id"), get_request_app_label(request.POST), materialize=True
+        )
+        result["reload"] = str(instance.pk) != request.POST.get("id")
         form = RemoveDashboardModuleForm(request, request.POST, instance=instance)
 
         if form.is_valid():
@@ -224,16 +275,197 @@ def load_dashboard_module_view(request, pk):
         if not user_is_authenticated(request.user) or not request.user.is_staff:
             raise ValidationError("error")
 
-        instance = UserDashboardModule.objects.get(pk=pk, user=request.user.pk)
+        instance = get_user_module(request, pk, get_request_app_label(request.GET))
         module_cls = instance.load_module()
         module = module_cls(model=instance, context={"request": request})
         result["html"] = module.render()
+        result["version"] = module.get_data_version()
     except (ValidationError, UserDashboardModule.DoesNotExist):
         result["error"] = True
 
     return JsonResponse(result)
 
 
+def render_batch_module(module):
+    """
+    Renders widget loaded in a batch, failed widget is returned as ``None`` without failing the whole batch.
+    """
+    try:
+        return module.render()
+    except Exception:
+        logger.exception("Dashboard widget %s failed to render", module.model.pk)
+
+
+async def arender_batch_module(module):
+    """
+    Asynchronous version of ``render_batch_module``.
+    """
+    try:
+        return await module.arender()
+    except Exception:
+        logger.exception("Dashboard widget %s failed to render", module.model.pk)
+
+
+@require_GET
+def load_dashboard_modules_view(request):
+    result = {"error": False}
+
+    try:
+        if not user_is_authenticated(request.user) or not request.user.is_staff:
+            raise ValidationError("error")
+
+        pks = [int(pk) for pk in request.GET.getlist("id")]
+        context = {"request": request}
+        calls = {}
+
+        for instance in get_user_modules_in(request, pks, get_request_app_label(request.GET)):
+            module_cls = instance.load_module()
+
+            if module_cls is not None:
+                calls[instance.pk] = partial(render_batch_module, module_cls(model=instance, context=context))
+
+        if dashboard_settings.JET_DASHBOARD_MODULES_WORKERS < 1:
+            result["modules"] = {pk: render() for pk, render in calls.items()}
+        else:
+            result["modules"] = run_concurrently(
+                calls,
+                dashboard_settings.JET_DASHBOARD_MODULES_WORKERS,
+                dashboard_settings.JET_DASHBOARD_MODULES_TIMEOUT,
+            )
+
+        # widgets not rendered in time are loaded one by one instead
+        result["pending"] = [pk for pk in calls if pk not in result["modules"]]
+    except (ValidationError, ValueError):
+        result["error"] = True
+
+    return JsonResponse(result)
+
+
+def is_staff_request(request):
+    return user_is_authenticated(request.user) and request.user.is_staff
+
+
+async def aload_dashboard_module_view(request, pk):
+    """
+    Asynchronous version of ``load_dashboard_module_view`` used with ``JET_DASHBOARD_ASYNC``.
+    """
+    if request.method != "GET":
+        return HttpResponseNotAllowed(["GET"])
+
+    result = {"error": False}
+
+    try:
+        # user is loaded from session in a thread, later accesses are served from the loaded object
+        if not await sync_to_async(is_staff_request)(request):
+            raise ValidationError("error")
+
+        instance = await sync_to_async(get_user_module)(request, pk, get_request_app_label(request.GET))
+        module_cls = instance.load_module()
+        module = module_cls(model=instance, context={"request": request})
+        result["html"] = await module.arender()
+        result["version"] = await sync_to_async(module.get_data_version)()
+    except (ValidationError, UserDashboardModule.DoesNotExist):
+        result["error"] = True
+
+    return JsonResponse(result)
+
+
+async def aload_dashboard_modules_view(request):
+    """
+    Asynchronous version of ``load_dashboard_modules_view`` used with ``JET_DASHBOARD_ASYNC``.
+    Widgets are rendered concurrently without being limited by ``JET_DASHBOARD_MODULES_WORKERS``.
+    """
+    if request.method != "GET":
+        return HttpResponseNotAllowed(["GET"])
+
+    result = {"error": False}
+
+    try:
+        if not await sync_to_async(is_staff_request)(request):
+            raise ValidationError("error")
+
+        pks = [int(pk) for pk in request.GET.getlist("id")]
+        instances = await sync_to_async(get_user_modules_in)(request, pks, get_request_app_label(request.GET))
+        context = {"request": request}
+        calls = {}
+
+        for instance in instances:
+            module_cls = instance.load_module()
+
+            if module_cls is not None:
+                calls[instance.pk] = arender_batch_module(module_cls(model=instance, context=context))
+
+        result["modules"] = await arun_concurrently(calls, dashboard_settings.JET_DASHBOARD_MODULES_TIMEOUT)
+        result["pending"] = [pk for pk in calls if pk not in result["modules"]]
+    except (ValidationError, ValueError):
+        result["error"] = True
+
+    return JsonResponse(result)
+
+
+@require_GET
+def dashboard_modules_versions_view(request):
+    result = {"error": False}
+
+    try:
+        if not user_is_authenticated(request.user) or not request.user.is_staff:
+            raise ValidationError("error")
+
+        context = {"request": request}
+        versions = {}
+        instances = get_user_modules(request, request.GET.get("app_label") or None)
+
+        for instance in instances:
+            module_cls = instance.load_module()
+
+            if module_cls is not None:
+                versions[instance.pk] = module_cls(model=instance, context=context).get_data_version()
+
+        result["versions"] = versions
+    except ValidationError:
+        result["error"] = True
+
+    return JsonResponse(result)
+
+
+@require_GET
+def load_recent_actions_view(request, pk):
+    result = {"error": False}
+
+    try:
+        if not user_is_authenticated(request.user) or not request.user.is_staff:
+            raise ValidationError("error")
+
+        instance = get_user_module(request, pk, get_request_app_label(request.GET))
+        module_cls = instance.load_module()
+
+        if module_cls is None or not issubclass(module_cls, RecentActions):
+            raise ValidationError("error")
+
+        module = module_cls(model=instance, context={"request": request})
+        cursor = request.GET.get("cursor")
+        entries, next_cursor = module.get_entries(module.parse_cursor(cursor) if cursor else None)
+
+        result["html"] = render_to_string(
+            "jet.dashboard/modules/recent_actions_entries.html", {"entries": entries}, request=request
+        )
+
+        if next_cursor is not None:
+            query = {"cursor": next_cursor}
+
+            if instance.is_template:
+                query["app_label"] = instance.app_label or ""
+
+            result["next_url"] = "%s?%s" % (
+                reverse("jet-dashboard:load_recent_actions", kwargs={"pk": pk}),
+                urlencode(query),
+            )
+    except (ValidationError, ValueError, UserDashboardModule.DoesNotExist):
+        result["error"] = True
+
+    return JsonResponse(result)
+
+
 @require_POST
 def reset_dashboard_view(request):
     result = {"error": False}
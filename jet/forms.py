@@ -9,7 +9,7 @@ from django.core.exceptions import ValidationError
 from django.db.models import Q
 
 from jet.models import Bookmark, PinnedApplication
-from jet.utils import get_model_instance_label, user_is_authenticated
+from jet.utils import clear_request_memo, get_model_instance_label, user_is_authenticated
 
 get_model = apps.get_model
 
@@ -75,6 +75,7 @@ class ToggleApplicationPinForm(forms.ModelForm):
 
     def save(self, commit=True):
         if commit:
+            clear_request_memo(self.request)
             try:
                 pinned_app = PinnedApplication.objects.get(
                     app_label=self.cleaned_data["app_label"], user=self.request.user.pk
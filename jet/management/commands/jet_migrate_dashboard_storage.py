@@ -0,0 +1,137 @@
+import time
+
+from django.core.management import BaseCommand
+from django.db import transaction
+from django.db.models import Value
+from django.db.models.functions import Coalesce
+
+from jet.dashboard.models import UserDashboardLayout, UserDashboardModule
+from jet.dashboard.storage import LayoutStorage, ModuleRowsStorage
+
+
+class Command(BaseCommand):
+    help = (
+        "Moves user dashboards between one row per widget (UserDashboardModule) "
+        "and one row per dashboard (UserDashboardLayout) storage"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--to",
+            choices=("layouts", "rows"),
+            default="layouts",
+            help="Storage to move dashboards to: layouts (LayoutStorage) or rows (ModuleRowsStorage)",
+        )
+        parser.add_argument("--batch-size", type=int, default=1000, help="Number of rows inserted with one query")
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Replace dashboards already stored in the target storage instead of skipping them",
+        )
+
+    def delete_moved(self, model, pks, batch_size):
+        for i in range(0, len(pks), batch_size):
+            model.objects.filter(pk__in=pks[i : i + batch_size]).delete()
+
+    def to_layouts(self, batch_size, force):
+        storage = LayoutStorage()
+        existing = set(UserDashboardLayout.objects.values_list("user", "app_label"))
+        skipped = set()
+        moved_pks = []
+        layouts = []
+        layout = None
+        count = 0
+
+        # widgets are read in chunks ordered by dashboard, so that each layout is complete once the next one starts
+        module_models = UserDashboardModule.objects.order_by(
+            "user", Coalesce("app_label", Value("")), "column", "order", "pk"
+        ).iterator(chunk_size=batch_size)
+
+        for module_model in module_models:
+            dashboard = (module_model.user, module_model.app_label or "")
+
+            # dashboards already moved (and maybe edited since) are kept unless replacing them was asked for
+            if dashboard in existing and not force:
+                skipped.add(dashboard)
+                continue
+
+            if layout is None or (layout.user, layout.app_label) != dashboard:
+                if len(layouts) >= batch_size:
+                    UserDashboardLayout.objects.bulk_create(layouts)
+                    layouts = []
+
+                if dashboard in existing:
+                    storage.reset(*dashboard)
+
+                layout = UserDashboardLayout(user=dashboard[0], app_label=dashboard[1])
+                layouts.append(layout)
+                count += 1
+
+            # widget ids are kept, so that widget urls stay the same
+            layout.modules.append(storage.to_entry(module_model))
+            moved_pks.append(module_model.pk)
+
+        UserDashboardLayout.objects.bulk_create(layouts)
+        self.delete_moved(UserDashboardModule, moved_pks, batch_size)
+
+        return count, len(skipped)
+
+    def to_rows(self, batch_size, force):
+        storage = LayoutStorage()
+        rows_storage = ModuleRowsStorage()
+        existing = set(
+            UserDashboardModule.objects.values_list("user", Coalesce("app_label", Value(""))).order_by().distinct()
+        )
+        skipped = 0
+        moved_pks = []
+        module_models = []
+        count = 0
+
+        for layout in UserDashboardLayout.objects.order_by("user", "app_label").iterator(chunk_size=batch_size):
+            dashboard = (layout.user, layout.app_label)
+
+            if dashboard in existing:
+                if not force:
+                    skipped += 1
+                    continue
+
+                rows_storage.reset(layout.user, layout.app_label or None)
+
+            for entry in layout.modules:
+                module_model = storage.to_model(layout, entry)
+                module_model.pk = None
+                module_model.layout_storage = None
+                module_model._state.adding = True
+                module_models.append(module_model)
+
+            if len(module_models) >= batch_size:
+                UserDashboardModule.objects.bulk_create(module_models, batch_size=batch_size)
+                module_models = []
+
+            moved_pks.append(layout.pk)
+            count += 1
+
+        UserDashboardModule.objects.bulk_create(module_models, batch_size=batch_size)
+        self.delete_moved(UserDashboardLayout, moved_pks, batch_size)
+
+        return count, skipped
+
+    def handle(self, *args, **options):
+        start = time.time()
+
+        with transaction.atomic():
+            if options["to"] == "layouts":
+                count, skipped = self.to_layouts(options["batch_size"], options["force"])
+            else:
+                count, skipped = self.to_rows(options["batch_size"], options["force"])
+
+        self.stdout.write(
+            self.style.SUCCESS("Moved %d dashboards to %s in %.2fs" % (count, options["to"], time.time() - start))
+        )
+
+        if skipped:
+            self.stdout.write(
+                self.style.WARNING(
+                    "Skipped %d dashboards already stored in %s, use --force to replace them" % (skipped, options["to"])
+                )
+            )
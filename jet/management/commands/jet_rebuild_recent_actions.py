@@ -0,0 +1,58 @@
+import time
+
+from django.conf import settings
+from django.contrib.admin.models import LogEntry
+from django.contrib.contenttypes.models import ContentType
+from django.core.management import BaseCommand
+from django.db import transaction
+from django.utils import translation
+
+from jet.dashboard import settings as dashboard_settings
+from jet.dashboard.models import RecentAction
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuilds recent actions table read by RecentActions widgets from admin log history, "
+        "keeping the latest entries of each content type"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--size",
+            type=int,
+            default=dashboard_settings.JET_MODULE_RECENT_ACTIONS_STORE_SIZE,
+            help="Number of latest actions kept for each content type",
+        )
+        parser.add_argument(
+            "--language", default=settings.LANGUAGE_CODE, help="Language to render change messages in"
+        )
+
+    def get_recent_actions(self, content_type_id, size):
+        log_entries = (
+            LogEntry.objects.filter(content_type_id=content_type_id)
+            .select_related("user")
+            .order_by("-action_time", "-pk")[:size]
+        )
+        return [RecentAction.from_log_entry(log_entry) for log_entry in log_entries]
+
+    def handle(self, *args, **options):
+        start = time.time()
+        size = options["size"]
+        content_type_ids = list(ContentType.objects.order_by("pk").values_list("pk", flat=True)) + [None]
+        created = 0
+
+        with translation.override(options["language"]), transaction.atomic():
+            RecentAction.objects.all().delete()
+
+            for content_type_id in content_type_ids:
+                recent_actions = self.get_recent_actions(content_type_id, size)
+                RecentAction.objects.bulk_create(recent_actions)
+                created += len(recent_actions)
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                "Stored %d recent actions of %d content types in %.2fs"
+                % (created, len(content_type_ids), time.time() - start)
+            )
+        )
@@ -0,0 +1,128 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management import BaseCommand
+from django.db import connections
+from django.test import RequestFactory
+from django.urls import reverse
+from django.utils import translation
+
+from jet.dashboard import settings as dashboard_settings
+from jet.dashboard.modules import Feed
+from jet.dashboard.storage import get_storage
+from jet.dashboard.utils import get_current_dashboard, get_permissions_fingerprint
+
+
+class Command(BaseCommand):
+    help = (
+        "Precomputes cached dashboard widgets content and shared feeds for active staff users, "
+        "so that first admin requests after deploy are served from warm caches"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--workers", type=int, default=4, help="Number of dashboards warmed in parallel")
+        parser.add_argument(
+            "--distinct-permissions",
+            action="store_true",
+            help=(
+                "Warm only one user per distinct set of permissions, useful for widgets cached "
+                "by permissions instead of user"
+            ),
+        )
+        parser.add_argument("--language", default=settings.LANGUAGE_CODE, help="Language to render dashboards in")
+
+    def get_users(self, distinct_permissions):
+        users = get_user_model()._default_manager.filter(is_active=True, is_staff=True).order_by("pk")
+
+        if not distinct_permissions:
+            return list(users)
+
+        fingerprints = set()
+        result = []
+
+        for user in users:
+            fingerprint = get_permissions_fingerprint(user)
+
+            if fingerprint not in fingerprints:
+                fingerprints.add(fingerprint)
+                result.append(user)
+
+        return result
+
+    def get_dashboards(self, users):
+        users = {user.pk: user for user in users}
+        dashboards = get_storage().get_dashboards(users.keys())
+
+        if dashboard_settings.JET_DASHBOARD_SHARED_TEMPLATES:
+            # users without stored dashboards are shown shared templates, which are rendered without storing anything
+            app_labels = {None} | {app_label for user_pk, app_label in dashboards}
+            dashboards = sorted(
+                set(dashboards) | {(user_pk, app_label) for user_pk in users for app_label in app_labels},
+                key=lambda dashboard: (dashboard[0], dashboard[1] or ""),
+            )
+
+        # otherwise only dashboards users have already opened are warmed, so that no layouts are created here
+        return [(users[user_pk], app_label) for user_pk, app_label in dashboards]
+
+    def warm_dashboard(self, user, app_label, language):
+        start = time.time()
+        warmed = 0
+
+        with translation.override(language):
+            if app_label:
+                path = reverse("admin:app_list", kwargs={"app_label": app_label})
+                dashboard_cls = get_current_dashboard("app_index")
+            else:
+                path = reverse("admin:index")
+                dashboard_cls = get_current_dashboard("index")
+
+            request = RequestFactory().get(path)
+            request.user = user
+            dashboard = dashboard_cls({"request": request, "user": user}, app_label=app_label)
+
+            for module in dashboard.modules:
+                if module.cache_timeout is not None or isinstance(module, Feed):
+                    module.render()
+                    warmed += 1
+
+        return warmed, time.time() - start
+
+    def warm_dashboard_in_thread(self, *args):
+        try:
+            return self.warm_dashboard(*args)
+        finally:
+            connections.close_all()
+
+    def report(self, user, app_label, warm):
+        location = app_label or "index"
+
+        try:
+            warmed, duration = warm()
+            self.stdout.write("%s / %s: %d widgets in %.2fs" % (user, location, warmed, duration))
+        except Exception as e:
+            self.stderr.write("%s / %s: failed (%s)" % (user, location, e))
+
+    def handle(self, *args, **options):
+        start = time.time()
+        users = self.get_users(options["distinct_permissions"])
+        dashboards = self.get_dashboards(users)
+        language = options["language"]
+
+        self.stdout.write("Warming %d dashboards of %d users" % (len(dashboards), len(users)))
+
+        if options["workers"] > 1:
+            with ThreadPoolExecutor(max_workers=options["workers"]) as executor:
+                futures = [
+                    (user, app_label, executor.submit(self.warm_dashboard_in_thread, user, app_label, language))
+                    for user, app_label in dashboards
+                ]
+
+                for user, app_label, future in futures:
+                    self.report(user, app_label, future.result)
+        else:
+            for user, app_label in dashboards:
+                self.report(user, app_label, lambda: self.warm_dashboard(user, app_label, language))
+
+        self.stdout.write(self.style.SUCCESS("Done in %.2fs" % (time.time() - start)))
@@ -0,0 +1,32 @@
+from django.utils.cache import patch_cache_control
+
+
+def is_prefetch_request(request):
+    return "prefetch" in (
+        request.headers.get("Sec-Purpose", ""),
+        request.headers.get("Purpose", ""),
+        request.headers.get("X-Moz", ""),
+    )
+
+
+class SiblingLinksPrefetchMiddleware:
+    """
+    Lets the browser keep change forms prefetched with ``JET_CHANGE_FORM_SIBLING_LINKS_PREFETCH``. Admin views
+    are never cached, so prefetched pages would be discarded instead of being shown when the link is followed.
+    """
+
+    #: Number of seconds prefetched page can be shown for.
+    max_age = 30
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+
+        if request.method == "GET" and response.status_code == 200 and is_prefetch_request(request):
+            response.headers.pop("Expires", None)
+            response.headers.pop("Cache-Control", None)
+            patch_cache_control(response, private=True, max_age=self.max_age)
+
+        return response
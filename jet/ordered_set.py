@@ -2,12 +2,12 @@ from collections.abc import MutableSet
 
 
 class OrderedSet(MutableSet):
+    __slots__ = ("map",)
+
     def __init__(self, iterable=None):
-        self.end = end = []
-        end += [None, end, end]  # sentinel node for doubly linked list
-        self.map = {}  # key --> [key, prev, next]
+        self.map = {}  # insertion ordered dict with keys only, values are always None
         if iterable is not None:
-            self |= iterable
+            self.map.update(dict.fromkeys(iterable))
 
     def __len__(self):
         return len(self.map)
@@ -16,38 +16,32 @@ class OrderedSet(MutableSet):
         return key in self.map
 
     def add(self, key):
-        if key not in self.map:
-            end = self.end
-            curr = end[1]
-            curr[2] = end[1] = self.map[key] = [key, curr, end]
+        self.map[key] = None  # existing keys keep their position
 
     def discard(self, key):
-        if key in self.map:
-            key, prev, next = self.map.pop(key)
-            prev[2] = next
-            next[1] = prev
+        self.map.pop(key, None)
+
+    def clear(self):
+        self.map.clear()
 
     def __iter__(self):
-        end = self.end
-        curr = end[2]
-        while curr is not end:
-            yield curr[0]
-            curr = curr[2]
+        return iter(self.map)
 
     def __reversed__(self):
-        end = self.end
-        curr = end[1]
-        while curr is not end:
-            yield curr[0]
-            curr = curr[1]
+        return reversed(self.map)
 
     def pop(self, last=True):
         if not self:
             raise KeyError("set is empty")
-        key = self.end[1][0] if last else self.end[2][0]
-        self.discard(key)
+        if last:
+            return self.map.popitem()[0]
+        key = next(iter(self.map))
+        del self.map[key]
         return key
 
+    def __reduce__(self):
+        return self.__class__, (list(self),)
+
     def __repr__(self):
         if not self:
             return "%s()" % (self.__class__.__name__,)
@@ -11,3 +11,6 @@ JET_SIDE_MENU_CUSTOM_APPS = getattr(settings, 'JET_SIDE_MENU_CUSTOM_APPS', None)
 
 # Improved usability
 JET_CHANGE_FORM_SIBLING_LINKS = getattr(settings, 'JET_CHANGE_FORM_SIBLING_LINKS', True)
+JET_CHANGE_FORM_SIBLING_LINKS_PREFETCH = getattr(settings, 'JET_CHANGE_FORM_SIBLING_LINKS_PREFETCH', False)
+JET_CHANGE_FORM_SIBLING_LINKS_CACHE_TIMEOUT = getattr(settings, 'JET_CHANGE_FORM_SIBLING_LINKS_CACHE_TIMEOUT', None)
+JET_CHANGE_FORM_SIBLING_LINKS_CACHE_WINDOW = getattr(settings, 'JET_CHANGE_FORM_SIBLING_LINKS_CACHE_WINDOW', 300)
@@ -1,4 +1,4 @@
-!function t(e,i,n){function o(r,a){if(!i[r]){if(!e[r]){var l="function"==typeof require&&require;if(!a&&l)return l(r,!0);if(s)return s(r,!0);var c=new Error("Cannot find module '"+r+"'");throw c.code="MODULE_NOT_FOUND",c}var u=i[r]={exports:{}};e[r][0].call(u.exports,function(t){var i=e[r][1][t];return o(i?i:t)},u,u.exports,t,e,i,n)}return i[r].exports}for(var s="function"==typeof require&&require,r=0;r<n.length;r++)o(n[r]);return o}({1:[function(t,e,i){var n=t("jquery"),o=function(t){this.$changeform=t};o.prototype={getContentWrappers:function(){var t=this.$changeform.find("#content-main > form > div"),e=t.find("> .module"),i=t.find("> .inline-group");return n().add(e).add(i)},getHashSelector:function(t){if(void 0==t)return null;var e=t.match(/^(#(\/tab\/(.+)\/)?)?$/i);return null==e?null:void 0!=e[3]?e[3]:""},showTab:function(t,e){var i=this.$changeform.find(".changeform-tabs-item"),n=this.getContentWrappers(),o=this.getHashSelector(t);if(e||null!=o){null!=o&&0!=o.length||(o=this.getHashSelector(i.first().find(".changeform-tabs-item-link").attr("href")));var s=n.filter("."+o),r=i.find('.changeform-tabs-item-link[href="#/tab/'+o+'/"]').closest(".changeform-tabs-item");i.removeClass("selected"),r.addClass("selected"),n.removeClass("selected"),s.addClass("selected")}},initTabs:function(){var t=this;n(window).on("hashchange",function(){t.showTab(location.hash,!1)}),this.showTab(location.hash,!0)},updateErrorState:function(){var t=this.$changeform.find(".changeform-tabs-item"),e=this.getContentWrappers(),i=this;t.each(function(){var t=n(this),o=i.getHashSelector(t.find(".changeform-tabs-item-link").attr("href"));if(o){var s=e.filter("."+o);s.find(".form-row.errors").length&&t.addClass("errors")}})},run:function(){try{this.initTabs(),this.updateErrorState()}catch(t){console.error(t,t.stack)}}},n(document).ready(function(){n(".change-form").each(function(){new o(n(this)).run()})})},{jquery:69}],2:[function(t,e,i){var n=t("jquery"),o=t("../utils/translate"),s=function(t){this.$changeForm=t};s.prototype={changeDetected:!1,onWindowBeforeUnload:function(){return o("Warning: you have unsaved changes")},onFormInputChanged:function(t){t.off("change",this.onFormInputChanged),self.changeDetected||n(window).bind("beforeunload",this.onWindowBeforeUnload),this.changeDetected=!0},initUnsavedChangesWarning:function(t){var e=this,i=t.find("#content-main form");if(0!=i.length){var o=i.find("input, textarea, select");n(document).on("submit","form",function(){n(window).off("beforeunload",e.onWindowBeforeUnload)}),o.on("change",n.proxy(this.onFormInputChanged,this,o))}},run:function(){try{this.initUnsavedChangesWarning(this.$changeForm)}catch(t){console.error(t,t.stack)}}},n(document).ready(function(){n(".change-form").each(function(){new s(n(this)).run()})})},{"../utils/translate":37,jquery:69}],3:[function(t,e,i){var n=t("jquery"),o=function(t){this.$changelist=t};o.prototype={updateFixedHeaderVisibility:function(t,e){var i=n(window).scrollTop()>e.offset().top;t.closest("table").toggle(i)},updateFixedHeaderWidth:function(t,e){var i=e.find("th"),o=t.find("th");i.each(function(t){o.eq(t).css("width",n(this).width())})},initFixedHeader:function(t){var e=t.find("#result_list thead");if(0!=e.length){var i=e.clone(),o=n("<table>").addClass("helper").append(i);o.find(".action-checkbox-column").empty(),o.appendTo(document.body),n(window).on("scroll",n.proxy(this.updateFixedHeaderVisibility,this,o,e)),n(window).on("resize",n.proxy(this.updateFixedHeaderWidth,this,i,e)),this.updateFixedHeaderWidth(i,e)}},updateFixedFooter:function(t,e){if(n(window).scrollTop()+n(window).height()<t.offset().top+t.outerHeight(!1)+e.innerHeight()){if(!e.hasClass("fixed")){var i=n(window).scrollTop();e.addClass("fixed"),t.css("margin-bottom",e.innerHeight()+"px"),n(window).scrollTop(i)}}else e.hasClass("fixed")&&(e.removeClass("fixed"),t.css("margin-bottom",0))},initFixedFooter:function(t){var e=t.find(".changelist-footer"),i=e.siblings(".results");0!=e.length&&0!=i.length&&(n(window).on("scroll",n.proxy(this.updateFixedFooter,this,i,e)),n(window).on("resize",n.proxy(this.updateFixedFooter,this,i,e)),this.updateFixedFooter(i,e))},initHeaderSortableSelection:function(){n("table thead .sortable").on("click",function(t){if(t.target==this){var e=n(this).find(".text a").get(0);void 0!=e&&e.click()}})},initRowSelection:function(t){t.find("#result_list tbody th, #result_list tbody td").on("click",function(t){t.target==this&&n(this).closest("tr").find(".action-checkbox .action-select").click()})},run:function(){var t=this.$changelist;try{this.initFixedHeader(t),this.initFixedFooter(t),this.initHeaderSortableSelection(t),this.initRowSelection(t)}catch(e){console.error(e,e.stack)}this.$changelist.addClass("initialized")}},n(document).ready(function(){n("#changelist").each(function(){new o(n(this)).run()})})},{jquery:69}],4:[function(t,e,i){var n=t("jquery"),o=function(){};o.prototype={uniqueCheckboxIdCounter:0,uniqueCheckboxIdPrefix:"unique_checkbox_id_",addLabelToCheckbox:function(t){var e=t.attr("id")?t.attr("id"):this.uniqueCheckboxIdPrefix+this.uniqueCheckboxIdCounter++;t.attr("id",e),n("<label>").attr("for",e).insertAfter(t)},addLabelToCheckboxes:function(){var t=this;n('input[type="checkbox"]').each(function(){var e=n(this);void 0!=e.attr("id")&&0!=n('label[for="'+e.attr("id")+'"]').length||t.addLabelToCheckbox(e)})},run:function(){try{this.addLabelToCheckboxes()}catch(t){console.error(t,t.stack)}}},n(document).ready(function(){(new o).run()})},{jquery:69}],5:[function(t,e,i){var n=t("jquery"),o=function(t){this.$inline=t,this.prefix=t.data("inline-prefix"),this.verboseName=t.data("inline-verbose-name"),this.deleteText=t.data("inline-delete-text")};o.prototype={updateLabels:function(t){var e=this,i=t.find(".inline-navigation-item");t.find(".inline-related").each(function(t){var o=n(this),s=o.find(".inline_label"),r=s.html().replace(/(#\d+)/g,"#"+(t+1)),a=i.eq(t),l=o.hasClass("has_original")?r:e.verboseName+" "+r;s.html(r),a.html(l)})},updateFormIndex:function(t,e){var i=new RegExp("("+this.prefix+"-(\\d+|__prefix__))"),o=this.prefix+"-"+e;t.find("*").each(function(){var t=n(this);n.each(["for","id","name"],function(){var e=this;t.attr(e)&&t.attr(e,t.attr(e).replace(i,o))})}),t.hasClass("empty-form")||t.attr("id",this.prefix+"-"+e)},updateFormsIndexes:function(t){var e=this,i=t.find(".inline-navigation-item");t.find(".inline-related").each(function(t){var o=n(this);e.updateFormIndex(o,t),i.eq(t).attr("data-inline-related-id",o.attr("id"))})},updateTotalForms:function(t){var e=t.find('[name="'+this.prefix+'-TOTAL_FORMS"]'),i=t.find('[name="'+this.prefix+'-MAX_NUM_FORMS"]'),n=parseInt(t.find(".inline-related").length),o=i.val()?parseInt(i.val()):1/0;e.val(n),t.find(".add-row").toggle(o>=n)},addNavigationItem:function(t,e){var i=t.find(".inline-navigation-item.empty");return i.clone().removeClass("empty").attr("data-inline-related-id",e.attr("id")).insertBefore(i)},openNavigationItem:function(t,e){t.find(".inline-related").removeClass("selected").filter("#"+e.attr("data-inline-related-id")).addClass("selected"),t.find(".inline-navigation-item").removeClass("selected"),e.addClass("selected")},removeItem:function(t,e){e.remove(),t.find('.inline-navigation-item[data-inline-related-id="'+e.attr("id")+'"]').remove()},openFirstNavigationItem:function(t){var e=t.find(".inline-navigation-item:not(.empty)").first();void 0!=e&&(this.openNavigationItem(t,e),this.scrollNavigationToTop(t))},addItemDeleteButton:function(t){t.children(":first").append('<span><a class="inline-deletelink" href="#">'+this.deleteText+"</a></span>")},scrollNavigationToTop:function(t){var e=t.find(".inline-navigation-content");e.stop().animate({scrollTop:0})},scrollNavigationToBottom:function(t){var e=t.find(".inline-navigation-content");e.stop().animate({scrollTop:e.prop("scrollHeight")})},initAdding:function(t){var e=this;t.find(".add-row a").on("click",function(i){i.preventDefault();var n=t.find(".inline-related.empty-form"),o=parseInt(t.find(".inline-related").length)-1,s=n.clone(!0).removeClass("empty-form").insertBefore(n);e.updateTotalForms(t),e.updateFormIndex(s,o),e.updateFormIndex(n,o+1);var r=e.addNavigationItem(t,s);e.updateLabels(t),e.openNavigationItem(t,r),e.addItemDeleteButton(s),e.scrollNavigationToBottom(t)})},initDeletion:function(t){var e=this;t.on("click",".inline-deletelink",function(i){i.preventDefault();var o=n(this).closest(".inline-related");e.removeItem(t,o),e.updateFormsIndexes(t),e.updateLabels(t),e.updateTotalForms(t),e.openFirstNavigationItem(t)}),t.find(".inline-related").each(function(){var e=n(this);e.find(".delete input").on("change",function(){t.find('.inline-navigation-item[data-inline-related-id="'+e.attr("id")+'"]').toggleClass("delete",n(this).is(":checked"))})})},initNavigation:function(t){var e=this;t.on("click",".inline-navigation-item",function(i){i.preventDefault(),e.openNavigationItem(t,n(this))}),e.openFirstNavigationItem(t)},run:function(){var t=this.$inline;try{this.initAdding(t),this.initDeletion(t),this.initNavigation(t)}catch(e){console.error(e,e.stack)}}},e.exports=o},{jquery:69}],6:[function(t,e,i){t("./../utils/jquery-slidefade");var n=t("jquery"),o=t("../utils/translate");t("jquery-ui/ui/core"),t("jquery-ui/ui/widget"),t("jquery-ui/ui/mouse"),t("jquery-ui/ui/draggable"),t("jquery-ui/ui/droppable"),t("jquery-ui/ui/sortable"),t("jquery-ui/ui/resizable"),t("jquery-ui/ui/button"),t("jquery-ui/ui/dialog");var s=function(t){this.$dashboard=t};s.prototype={initTools:function(t){t.find(".dashboard-tools-toggle").on("click",function(e){e.preventDefault(),t.find(".dashboard-tools").toggleClass("visible")});var e=t.find("#add-dashboard-module-form");e.find(".add-dashboard-link").on("click",function(t){var i=e.find('[name="type"]'),o=e.find('[name="module"] option:selected').data("type");o&&(i.val(o),n.ajax({url:e.attr("action"),method:e.attr("method"),dataType:"json",data:e.serialize(),success:function(t){t.error||(document.location=t.success_url)}})),t.preventDefault()}),t.find(".reset-dashboard-link").on("click",function(e){var i={},s=function(){var e=t.find("#reset-dashboard-form");n.ajax({url:e.attr("action"),method:e.attr("method"),dataType:"json",data:e.serialize(),success:function(t){t.error||location.reload()}})};i[o("Yes")]=function(){s(),n(this).dialog("close")},i[o("Cancel")]=function(){n(this).dialog("close")},t.find("#reset-dashboard-dialog").dialog({resizable:!1,modal:!0,buttons:i}),e.preventDefault()})},updateDashboardModules:function(t){var e=t.find("#update-dashboard-modules-form"),i=[];t.find(".dashboard-column").each(function(){var t=n(this),e=t.closest(".dashboard-column-wrapper").index();t.find(".dashboard-item").each(function(){var t=n(this),o=t.index(),s=t.data("module-id");i.push({id:s,column:e,order:o})})}),e.find('[name="modules"]').val(JSON.stringify(i)),n.ajax({url:e.attr("action"),method:e.attr("method"),dataType:"json",data:e.serialize()})},initModulesDragAndDrop:function(t){var e=this;t.find(".dashboard-column").droppable({activeClass:"active",hoverClass:"hovered",tolerance:"pointer",accept:".dashboard-item"}).sortable({items:".dashboard-item.draggable",handle:".dashboard-item-header",tolerance:"pointer",connectWith:".dashboard-column",cursor:"move",placeholder:"dashboard-item placeholder",forcePlaceholderSize:!0,update:function(i,n){e.updateDashboardModules(t)}})},initCollapsibleModules:function(t){var e=t.find("#update-dashboard-module-collapse-form");t.find(".dashboard-item.collapsible").each(function(){var t=n(this),i=t.find(".dashboard-item-collapse"),o=t.find(".dashboard-item-content"),s=t.data("module-id");i.on("click",function(i){i.preventDefault(),o.slideFadeToggle(200,"swing",function(){var i=0==o.is(":visible");i?t.addClass("collapsed"):t.removeClass("collapsed"),e.find('[name="id"]').val(s),e.find('[name="collapsed"]').val(i?"true":"false"),n.ajax({url:e.attr("action"),method:e.attr("method"),dataType:"json",data:e.serialize()})})})})},initDeletableModules:function(t){var e=t.find("#remove-dashboard-module-form");t.find(".dashboard-item.deletable").each(function(){var i=n(this),s=i.find(".dashboard-item-remove"),r=i.data("module-id");s.on("click",function(s){s.preventDefault();var a={},l=function(){i.fadeOut(200,"swing",function(){e.find('[name="id"]').val(r),n.ajax({url:e.attr("action"),method:e.attr("method"),dataType:"json",data:e.serialize()})})};a[o("Delete")]=function(){l(),n(this).dialog("close")},a[o("Cancel")]=function(){n(this).dialog("close")},t.find("#module-remove-dialog").dialog({resizable:!1,modal:!0,buttons:a})})})},initAjaxModules:function(t){t.find(".dashboard-item.ajax").each(function(){var t=n(this),e=t.find(".dashboard-item-content"),i=t.data("ajax-url");n.ajax({url:i,dataType:"json",success:function(t){if(t.error)return void e.empty();var i=e.height();e.html(t.html);var n=e.height();e.height(i),e.animate({height:n},250,"swing",function(){e.height("auto")})},error:function(){e.empty()}})})},updateModuleChildrenFormsetLabels:function(t){t.find(".inline-related").each(function(t){n(this).find(".inline_label").text("#"+(t+1))})},updateModuleChildrenFormsetFormIndex:function(t,e){var i="children",o=new RegExp("("+i+"-(\\d+|__prefix__))"),s=i+"-"+e;t.find("fieldset.module *").each(function(){var t=n(this);n.each(["for","id","name"],function(){var e=this;t.attr(e)&&t.attr(e,t.attr(e).replace(o,s))})})},updateModuleChildrenFormsetFormsIndexes:function(t){var e=this,i=parseInt(t.find(".inline-related.has_original").length);t.find(".inline-related.last-related").each(function(t){e.updateModuleChildrenFormsetFormIndex(n(this),i+t)})},updateModuleChildrenFormsetTotalForms:function(t){var e=t.find('[name="children-TOTAL_FORMS"]'),i=parseInt(t.find(".inline-related").length);e.val(i)},initModuleChildrenFormsetUpdate:function(t){if(t.hasClass("change-form")){var e=this,i=t.find(".inline-group");i.find(".add-row a").on("click",function(t){t.preventDefault();var n=i.find(".inline-related.empty-form"),o=n.clone(!0).removeClass("empty-form").insertBefore(n);e.updateModuleChildrenFormsetLabels(i),e.updateModuleChildrenFormsetFormIndex(n,parseInt(i.find(".inline-related").length)-1),e.updateModuleChildrenFormsetFormIndex(o,parseInt(i.find(".inline-related").length)-2),e.updateModuleChildrenFormsetTotalForms(i)}),i.find(".inline-deletelink").on("click",function(t){t.preventDefault(),n(this).closest(".inline-related").remove(),e.updateModuleChildrenFormsetFormsIndexes(i),e.updateModuleChildrenFormsetLabels(i),e.updateModuleChildrenFormsetTotalForms(i)})}},run:function(){var t=this.$dashboard;try{this.initTools(t),this.initModulesDragAndDrop(t),this.initCollapsibleModules(t),this.initDeletableModules(t),this.initAjaxModules(t),this.initModuleChildrenFormsetUpdate(t)}catch(e){console.error(e,e.stack)}t.addClass("initialized")}},n(document).ready(function(){n(".dashboard.jet").each(function(){new s(n(this)).run()})})},{"../utils/translate":37,"./../utils/jquery-slidefade":36,jquery:69,"jquery-ui/ui/button":55,"jquery-ui/ui/core":56,"jquery-ui/ui/dialog":58,"jquery-ui/ui/draggable":59,"jquery-ui/ui/droppable":60,"jquery-ui/ui/mouse":61,"jquery-ui/ui/resizable":63,"jquery-ui/ui/sortable":64,"jquery-ui/ui/widget":66}],7:[function(t,e,i){var n=t("jquery");t("jquery-ui/ui/core"),t("jquery-ui/ui/datepicker"),t("timepicker");var o=function(){};o.prototype={removeInputTextNode:function(t){if(0!=t.length){var e=t.get(0).previousSibling;3==e.nodeType&&n(e).remove()}},updateDatetimeLayout:function(){var t=this;n(".form-row .datetime").each(function(){var e=n(this),i=e.find(".vDateField"),o=e.find(".vTimeField");t.removeInputTextNode(i),t.removeInputTextNode(o),i.nextAll("br").first().remove()}),n(".form-row .vDateField").each(function(){var t=n(this),e=n("<span>").addClass("icon-calendar");n("<a>").attr("href","#").addClass("vDateField-link").append(e).insertAfter(t)}),n(".form-row .vTimeField").each(function(){var t=n(this),e=n("<span>").addClass("icon-clock");n("<a>").attr("href","#").addClass("vTimeField-link").append(e).insertAfter(t)})},djangoDateTimeFormatToJs:function(t){return t.toLowerCase().replace(/%\w/g,function(t){return t=t.replace(/%/,""),t+t})},initDateWidgets:function(t){t=t||n(document);var e=this;t.find(".form-row .vDateField").each(function(){var t=n(this),i=t.next(".vDateField-link");t.datepicker({dateFormat:e.djangoDateTimeFormatToJs(DATE_FORMAT),showButtonPanel:!0,nextText:"",prevText:""}),i.on("click",function(e){t.datepicker("widget").is(":visible")?t.datepicker("hide"):t.datepicker("show"),e.preventDefault()})});var i=n.datepicker._gotoToday;n.datepicker._gotoToday=function(t){i.call(this,t),this._selectDate(t)}},initTimeWidgets:function(t){t=t||n(document),t.find(".form-row .vTimeField").each(function(){var t=n(this),e=t.next(".vTimeField-link");t.timepicker({showPeriodLabels:!1,showCloseButton:!0,showNowButton:!0}),e.on("click",function(e){t.datepicker("widget").is(":visible")?t.datepicker("hide"):t.timepicker("show"),e.preventDefault()})})},run:function(){try{this.updateDatetimeLayout(),this.initDateWidgets(),this.initTimeWidgets();var t=this;n(".inline-group").on("inline-group-row:added",function(e,i){i.find(".hasDatepicker").removeClass("hasDatepicker"),i.find(".hasTimepicker").removeClass("hasTimepicker"),t.initDateWidgets(i),t.initTimeWidgets(i)})}catch(e){console.error(e,e.stack)}}},n(document).ready(function(){(new o).run()})},{jquery:69,"jquery-ui/ui/core":56,"jquery-ui/ui/datepicker":57,timepicker:92}],8:[function(t,e,i){var n=t("jquery"),o=function(t){this.$toolbar=t};o.prototype={initFiltersInteraction:function(t){t.find(".changelist-filter-select").each(function(){var t=n(this),e=t.attr("multiple");e&&t.data("previous-options",t.find("option:selected")),t.on("change",function(){var t=n(this),i=t.find("option:selected");e&&(t.data("previous-options").length<i.length?i=i.filter(function(e,i){return 0==t.data("previous-options").filter(function(t,e){return e==i}).length}):t.data("previous-options").length>i.length&&(i=t.data("previous-options").filter(function(t,e){return 0==i.filter(function(t,i){return e==i}).length})),t.data("previous-options",t.find("option:selected")));var o=i.data("url"),s=t.data("queryset--lookup");o?document.location=i.data("url"):s&&(document.location="?"+s+"="+i.val())})})},run:function(){try{this.initFiltersInteraction(this.$toolbar)}catch(t){console.error(t,t.stack)}}},n(document).ready(function(){n("#toolbar").each(function(){new o(n(this)).run()})})},{jquery:69}],9:[function(t,e,i){var n=t("jquery"),o=t("./compact-inline"),s=function(t){this.$inline=t};s.prototype={initAddRow:function(t){t.on("click",".add-row a",function(){var e=t.find(".inline-related:not(.empty-form)").last();t.trigger("inline-group-row:added",[e])})},run:function(){var t=this.$inline;try{t.hasClass("compact")&&new o(t).run(),this.initAddRow(t)}catch(e){console.error(e,e.stack)}t.addClass("initialized")}},n(document).ready(function(){n(".inline-group").each(function(){new s(n(this)).run()})})},{"./compact-inline":5,jquery:69}],10:[function(t,e,i){var n=t("jquery"),o=t("../utils/window-storage"),s=function(){this.windowStorage=new o("relatedWindows")};s.prototype={updateLinks:function(t){t.find("~ .change-related, ~ .delete-related, ~ .add-another").each(function(){var e=n(this),i=e.data("href-template");if(void 0!=i){var o=t.val();o?e.attr("href",i.replace("__fk__",o)):e.removeAttr("href")}})},initLinksForRow:function(t){if(!t.data("related-popups-links-initialized")){var e=this;t.find("select").each(function(){var t=n(this);e.updateLinks(t),t.find("~ .add-related, ~ .change-related, ~ .delete-related, ~ .add-another").each(function(){var i=n(this);i.on("click",function(n){n.preventDefault();var o=i.attr("href");void 0!=o&&(o.indexOf("_popup")==-1&&(o+=o.indexOf("?")==-1?"?_popup=1":"&_popup=1"),e.showPopup(t,o))})})}).on("change",function(){e.updateLinks(n(this))}),t.find("input").each(function(){var t=n(this);t.find("~ .related-lookup").each(function(){var i=n(this);i.on("click",function(n){n.preventDefault();var o=i.attr("href");o+=o.indexOf("?")==-1?"?_popup=1":"&_popup=1",e.showPopup(t,o)})})}),t.data("related-popups-links-initialized",!0)}},initLinks:function(){var t=this;n(".form-row").each(function(){t.initLinksForRow(n(this))}),n(".inline-group").on("inline-group-row:added",function(e,i){i.find(".form-row").each(function(){t.initLinksForRow(n(this))})})},initPopupBackButton:function(){var t=this;n(".related-popup-back").on("click",function(e){e.preventDefault(),t.closePopup()})},showPopup:function(t,e){var i=n(window.top.document),o=i.find(".related-popup-container"),s=o.find(".loading-indicator"),r=i.find("body"),a=n("<div>").addClass("related-popup").data("input",t),l=n("<iframe>").attr("src",e).on("load",function(){a.add(i.find(".related-popup-back")).fadeIn(200,"swing",function(){s.hide()})});a.append(l),s.show(),i.find(".related-popup").add(i.find(".related-popup-back")).fadeOut(200,"swing"),o.fadeIn(200,"swing",function(){o.append(a)}),r.addClass("non-scrollable")},closePopup:function(t){var e=this.windowStorage.previous(),i=this;!function(e){var n=e(window.top.document),o=n.find(".related-popup"),s=n.find(".related-popup-container"),r=o.last();void 0!=t&&i.processPopupResponse(r,t),i.windowStorage.pop(),1==o.length?s.fadeOut(200,"swing",function(){n.find(".related-popup-back").hide(),n.find("body").removeClass("non-scrollable"),r.remove()}):o.length>1&&(r.remove(),o.eq(o.length-2).show())}(e?e.jet.jQuery:n)},findPopupResponse:function(){var t=this;n("#django-admin-popup-response-constants").each(function(){var e=n(this),i=e.data("popup-response");t.closePopup(i)})},processPopupResponse:function(t,e){var i=t.data("input");switch(e.action){case"change":i.find("option").each(function(){var t=n(this);t.val()==e.value&&t.html(e.obj).val(e.new_value)}),i.trigger("change").trigger("select:init");break;case"delete":i.find("option").each(function(){var t=n(this);t.val()==e.value&&t.remove()}),i.trigger("change").trigger("select:init");break;default:if(i.is("select")){var o=n("<option>").val(e.value).html(e.obj);i.append(o),o.attr("selected",!0),i.trigger("change").trigger("select:init")}else i.is("input.vManyToManyRawIdAdminField")&&i.val()?i.val(i.val()+","+e.value):i.is("input")&&i.val(e.value)}},overrideRelatedGlobals:function(){var t=this;window.showRelatedObjectLookupPopup=window.showAddAnotherPopup=window.showRelatedObjectPopup=function(){},window.opener=this.windowStorage.previous()||window.opener,window.dismissRelatedLookupPopup=function(e,i){t.closePopup({action:"lookup",value:i})}},initDeleteRelatedCancellation:function(){var t=this;n(".popup.delete-confirmation .cancel-link").on("click",function(e){e.preventDefault(),t.closePopup()}).removeAttr("onclick")},initLookupLinks:function(){var t=this;n("a[data-popup-opener]").click(function(e){e.preventDefault(),t.closePopup({action:"lookup",value:n(this).data("popup-opener")})})},run:function(){this.windowStorage.push(window);try{this.initLinks(),this.initPopupBackButton(),this.findPopupResponse(),this.overrideRelatedGlobals(),this.initDeleteRelatedCancellation(),this.initLookupLinks()}catch(t){console.error(t,t.stack)}}},n(document).ready(function(){(new s).run()})},{"../utils/window-storage":38,jquery:69}],11:[function(t,e,i){var n=t("jquery"),o=function(){};o.prototype={prevScrollTop:null,initDetector:function(){var t=this;n(window).on("scroll",function(){null!=t.prevScrollTop&&n(window).scrollTop()>t.prevScrollTop&&n(window).scrollTop()>60?n(document.body).addClass("scroll-to-bottom"):n(document.body).removeClass("scroll-to-bottom"),t.prevScrollTop=n(window).scrollTop()})},run:function(){try{this.initDetector()}catch(t){console.error(t,t.stack)}}},n(document).ready(function(){(new o).run()})},{jquery:69}],12:[function(t,e,i){t("select2");var n=t("jquery"),o=t("../utils/translate"),s=function(){};s.prototype={updateAttachBody:function(t){t.prototype._positionDropdown=function(){var t=n(window),e=this.$dropdown.hasClass("select2-dropdown--above"),i=this.$dropdown.hasClass("select2-dropdown--below"),o=null,s=(this.$container.position(),this.$container.offset());s.bottom=s.top+this.$container.outerHeight(!1);var r={height:this.$container.outerHeight(!1)};r.top=s.top,r.bottom=s.top+r.height;var a={height:this.$dropdown.outerHeight(!1)},l={top:t.scrollTop(),bottom:t.scrollTop()+t.height()},c=l.top<s.top-a.height,u=l.bottom>s.bottom+a.height,d={left:s.left,top:r.bottom};if(e||i||(o="below"),u||!c||e?!c&&u&&e&&(o="below"):o="above",("above"==o||e&&"below"!==o)&&(d.top=r.top-a.height),null!=o){this.$dropdown.removeClass("select2-dropdown--below select2-dropdown--above").addClass("select2-dropdown--"+o),this.$container.removeClass("select2-container--below select2-container--above").addClass("select2-container--"+o);var h=this.$dropdown.find(".select2-search");"above"==o&&h.is(":first-child")?h.detach().appendTo(this.$dropdown):"below"==o&&h.is(":last-child")&&h.detach().prependTo(this.$dropdown)}this.$dropdownContainer.css(d)},t.prototype.render=function(t){var e=n("<span></span>"),i=t.call(this);return e.append(i),this.$dropdownContainer=e,this.$element.prop("multiple")?this.$dropdown.addClass("select2-multiple-dropdown"):this.$dropdown.removeClass("select2-multiple-dropdown"),e}},updateDropdownAdapter:function(t){t.prototype.render=function(){var t="";this.options.get("multiple")&&(t='<div class="select2-buttons"><a href="#" class="select2-buttons-button select2-buttons-button-select-all">'+o("select all")+'</a> <a href="#" class="select2-buttons-button select2-buttons-button-deselect-all">'+o("deselect all")+"</a></div>");var e=n('<span class="select2-dropdown">'+t+'<span class="select2-results"></span></span>'),i=this.$element;return e.find(".select2-buttons-button-select-all").on("click",function(t){t.preventDefault();var e=[];i.find("option").each(function(){e.push(n(this).val())}),i.select2("val",e),i.select2("close")}),e.find(".select2-buttons-button-deselect-all").on("click",function(t){t.preventDefault(),i.select2("val",""),i.select2("close")}),e.attr("dir",this.options.get("dir")),this.$dropdown=e,e}},initSelect:function(t,e){var i={theme:"jet",dropdownAdapter:e,width:"auto"};if(t.hasClass("ajax")){var n=t.data("content-type-id"),o=t.data("app-label"),s=t.data("model"),r=t.data("object-id"),a=100;i.ajax={dataType:"json",data:function(t){return{content_type:n,app_label:o,model:s,q:t.term,page:t.page,page_size:a,object_id:r}},processResults:function(t,e){if(t.error)return{};e.page=e.page||1;var i=e.page*a<t.total;return{results:t.items,pagination:{more:i}}}}}t.on("change",function(e){django.jQuery(t.get(0)).trigger(e)}),t.select2(i)},initSelect2:function(){var t=this,e=n.fn.select2.amd.require("select2/dropdown/attachBody"),i=n.fn.select2.amd.require("select2/dropdown"),o=n.fn.select2.amd.require("select2/utils"),s=n.fn.select2.amd.require("select2/dropdown/search"),r=n.fn.select2.amd.require("select2/dropdown/minimumResultsForSearch"),a=n.fn.select2.amd.require("select2/dropdown/closeOnSelect");this.updateAttachBody(e),this.updateDropdownAdapter(i),i=o.Decorate(i,s),i=o.Decorate(i,e),i=o.Decorate(i,r),i=o.Decorate(i,a),n(document).on("select:init","select",function(){var e=n(this);e.parents(".empty-form").length>0||t.initSelect(e,i)}),n("select").trigger("select:init"),n(".inline-group").on("inline-group-row:added",function(t,e){e.find("select").trigger("select:init")})},run:function(){try{this.initSelect2()}catch(t){console.error(t,t.stack)}}},n(document).ready(function(){(new s).run()})},{"../utils/translate":37,jquery:69,select2:91}],13:[function(t,e,i){var n=t("jquery"),o=function(t){this.$siblings=t};o.prototype={moveSiblings:function(t){t.detach().insertBefore(n(".object-tools"))},run:function(){try{this.moveSiblings(this.$siblings)}catch(t){console.error(t,t.stack)}this.$siblings.addClass("initialized")}},n(document).ready(function(){n(".changeform-navigation").each(function(){new o(n(this)).run()})})},{jquery:69}],14:[function(t,e,i){t("./../../utils/jquery-slidefade");var n=t("jquery");t("jquery-ui/ui/core"),t("jquery-ui/ui/widget"),t("jquery-ui/ui/mouse"),t("jquery-ui/ui/draggable"),t("jquery-ui/ui/resizable"),t("jquery-ui/ui/button"),t("jquery-ui/ui/dialog");var o=function(t){this.$sidebar=t};o.prototype={pinToggle:function(t,e,i){var o=this,s=e.find(".apps-list"),r=e.find(".apps-list-pinned");n.ajax({url:t.attr("action"),method:t.attr("method"),dataType:"json",data:t.serialize(),success:function(t){if(!t.error){var n=t.pinned?r:s;i.toggleClass("pinned",t.pinned).detach().appendTo(n),o.updateAppsHide(e)}}})},initApplicationPinning:function(t){var e=this;t.find(".pin-toggle").on("click",function(i){i.preventDefault(),i.stopPropagation();var o=n(this).closest(".app-item"),s=o.data("app-label"),r=t.find("#toggle-application-pin-form");r.find('input[name="app_label"]').val(s),e.pinToggle(r,t,o)}),t.find(".edit-apps-list").on("click",function(t){t.preventDefault(),n(this).parents(".sidebar-section").toggleClass("editing")})},updateAppsHide:function(t){var e=t.find(".apps-list"),i=t.find(".apps-list-pinned"),n=t.find(".apps-hide");0!=e.children().length&&0!=i.children().length||!e.is(":visible")?(n.toggleClass("apps-visible",e.is(":visible")),n.toggleClass("apps-hidden",!e.is(":visible"))):n.removeClass("apps-visible apps-hidden")},initAppsHide:function(t){var e=this,i=t.find(".apps-list"),n=t.find(".apps-list-pinned"),o=t.find(".apps-hide");o.on("click",function(n){n.preventDefault(),i.slideFadeToggle(200,"swing",function(){localStorage.side_menu_apps_list_visible=i.is(":visible"),e.updateAppsHide(t)})}),"false"===localStorage.side_menu_apps_list_visible&&(0!=n.children().length?i.hide():localStorage.side_menu_apps_list_visible=!0),this.updateAppsHide(t)},run:function(){try{this.initApplicationPinning(this.$sidebar),this.initAppsHide(this.$sidebar)}catch(t){console.error(t,t.stack)}}},e.exports=o},{"./../../utils/jquery-slidefade":36,jquery:69,"jquery-ui/ui/button":55,"jquery-ui/ui/core":56,"jquery-ui/ui/dialog":58,"jquery-ui/ui/draggable":59,"jquery-ui/ui/mouse":61,"jquery-ui/ui/resizable":63,"jquery-ui/ui/widget":66}],15:[function(t,e,i){var n=t("jquery"),o=t("../../utils/translate");t("jquery-ui/ui/core"),t("jquery-ui/ui/widget"),t("jquery-ui/ui/mouse"),t("jquery-ui/ui/draggable"),t("jquery-ui/ui/resizable"),t("jquery-ui/ui/button"),t("jquery-ui/ui/dialog");var s=function(t){this.$sidebar=t};s.prototype={addBookmark:function(t,e){n.ajax({url:t.attr("action"),method:t.attr("method"),dataType:"json",data:t.serialize(),success:function(t){if(!t.error){var i=e.find(".bookmark-item.clone").clone().removeClass("clone");i.attr("href",t.url).find(".sidebar-link-label").append(t.title),i.find(".bookmarks-remove").data("bookmark-id",t.id),e.append(i)}}})},deleteBookmark:function(t,e){n.ajax({url:t.attr("action"),method:t.attr("method"),dataType:"json",data:t.serialize(),success:function(t){t.error||e.remove()}})},initBookmarksAdding:function(t){var e=this,i=t.find("#bookmarks-add-form"),s=i.find('input[name="title"]'),r=i.find('input[name="url"]'),a=t.find("#bookmarks-add-dialog"),l=t.find(".bookmarks-list");t.find(".bookmarks-add").on("click",function(t){t.preventDefault();var c=n(this),u=c.data("title")?c.data("title"):document.title,d=window.location.href;s.val(u),r.val(d);var h={};h[o("Add")]=function(){e.addBookmark(i,l),n(this).dialog("close")},h[o("Cancel")]=function(){n(this).dialog("close")},a.dialog({resizable:!1,modal:!0,buttons:h})})},initBookmarksRemoving:function(t){var e=this,i=t.find("#bookmarks-remove-form"),s=i.find('input[name="id"]'),r=t.find("#bookmarks-remove-dialog");t.on("click",".bookmarks-remove",function(t){t.preventDefault();var a=n(this),l=a.closest(".bookmark-item"),c=a.data("bookmark-id");s.val(c);var u={};u[o("Delete")]=function(){e.deleteBookmark(i,l),n(this).dialog("close")},u[o("Cancel")]=function(){n(this).dialog("close")},r.dialog({resizable:!1,modal:!0,buttons:u})})},initBookmarks:function(t){this.initBookmarksAdding(t),this.initBookmarksRemoving(t)},run:function(){
+!function t(e,i,n){function o(r,a){if(!i[r]){if(!e[r]){var l="function"==typeof require&&require;if(!a&&l)return l(r,!0);if(s)return s(r,!0);var c=new Error("Cannot find module '"+r+"'");throw c.code="MODULE_NOT_FOUND",c}var u=i[r]={exports:{}};e[r][0].call(u.exports,function(t){var i=e[r][1][t];return o(i?i:t)},u,u.exports,t,e,i,n)}return i[r].exports}for(var s="function"==typeof require&&require,r=0;r<n.length;r++)o(n[r]);return o}({1:[function(t,e,i){var n=t("jquery"),o=function(t){this.$changeform=t};o.prototype={getContentWrappers:function(){var t=this.$changeform.find("#content-main > form > div"),e=t.find("> .module"),i=t.find("> .inline-group");return n().add(e).add(i)},getHashSelector:function(t){if(void 0==t)return null;var e=t.match(/^(#(\/tab\/(.+)\/)?)?$/i);return null==e?null:void 0!=e[3]?e[3]:""},showTab:function(t,e){var i=this.$changeform.find(".changeform-tabs-item"),n=this.getContentWrappers(),o=this.getHashSelector(t);if(e||null!=o){null!=o&&0!=o.length||(o=this.getHashSelector(i.first().find(".changeform-tabs-item-link").attr("href")));var s=n.filter("."+o),r=i.find('.changeform-tabs-item-link[href="#/tab/'+o+'/"]').closest(".changeform-tabs-item");i.removeClass("selected"),r.addClass("selected"),n.removeClass("selected"),s.addClass("selected")}},initTabs:function(){var t=this;n(window).on("hashchange",function(){t.showTab(location.hash,!1)}),this.showTab(location.hash,!0)},updateErrorState:function(){var t=this.$changeform.find(".changeform-tabs-item"),e=this.getContentWrappers(),i=this;t.each(function(){var t=n(this),o=i.getHashSelector(t.find(".changeform-tabs-item-link").attr("href"));if(o){var s=e.filter("."+o);s.find(".form-row.errors").length&&t.addClass("errors")}})},run:function(){try{this.initTabs(),this.updateErrorState()}catch(t){console.error(t,t.stack)}}},n(document).ready(function(){n(".change-form").each(function(){new o(n(this)).run()})})},{jquery:69}],2:[function(t,e,i){var n=t("jquery"),o=t("../utils/translate"),s=function(t){this.$changeForm=t};s.prototype={changeDetected:!1,onWindowBeforeUnload:function(){return o("Warning: you have unsaved changes")},onFormInputChanged:function(t){t.off("change",this.onFormInputChanged),self.changeDetected||n(window).bind("beforeunload",this.onWindowBeforeUnload),this.changeDetected=!0},initUnsavedChangesWarning:function(t){var e=this,i=t.find("#content-main form");if(0!=i.length){var o=i.find("input, textarea, select");n(document).on("submit","form",function(){n(window).off("beforeunload",e.onWindowBeforeUnload)}),o.on("change",n.proxy(this.onFormInputChanged,this,o))}},run:function(){try{this.initUnsavedChangesWarning(this.$changeForm)}catch(t){console.error(t,t.stack)}}},n(document).ready(function(){n(".change-form").each(function(){new s(n(this)).run()})})},{"../utils/translate":37,jquery:69}],3:[function(t,e,i){var n=t("jquery"),o=function(t){this.$changelist=t};o.prototype={updateFixedHeaderVisibility:function(t,e){var i=n(window).scrollTop()>e.offset().top;t.closest("table").toggle(i)},updateFixedHeaderWidth:function(t,e){var i=e.find("th"),o=t.find("th");i.each(function(t){o.eq(t).css("width",n(this).width())})},initFixedHeader:function(t){var e=t.find("#result_list thead");if(0!=e.length){var i=e.clone(),o=n("<table>").addClass("helper").append(i);o.find(".action-checkbox-column").empty(),o.appendTo(document.body),n(window).on("scroll",n.proxy(this.updateFixedHeaderVisibility,this,o,e)),n(window).on("resize",n.proxy(this.updateFixedHeaderWidth,this,i,e)),this.updateFixedHeaderWidth(i,e)}},updateFixedFooter:function(t,e){if(n(window).scrollTop()+n(window).height()<t.offset().top+t.outerHeight(!1)+e.innerHeight()){if(!e.hasClass("fixed")){var i=n(window).scrollTop();e.addClass("fixed"),t.css("margin-bottom",e.innerHeight()+"px"),n(window).scrollTop(i)}}else e.hasClass("fixed")&&(e.removeClass("fixed"),t.css("margin-bottom",0))},initFixedFooter:function(t){var e=t.find(".changelist-footer"),i=e.siblings(".results");0!=e.length&&0!=i.length&&(n(window).on("scroll",n.proxy(this.updateFixedFooter,this,i,e)),n(window).on("resize",n.proxy(this.updateFixedFooter,this,i,e)),this.updateFixedFooter(i,e))},initHeaderSortableSelection:function(){n("table thead .sortable").on("click",function(t){if(t.target==this){var e=n(this).find(".text a").get(0);void 0!=e&&e.click()}})},initRowSelection:function(t){t.find("#result_list tbody th, #result_list tbody td").on("click",function(t){t.target==this&&n(this).closest("tr").find(".action-checkbox .action-select").click()})},run:function(){var t=this.$changelist;try{this.initFixedHeader(t),this.initFixedFooter(t),this.initHeaderSortableSelection(t),this.initRowSelection(t)}catch(e){console.error(e,e.stack)}this.$changelist.addClass("initialized")}},n(document).ready(function(){n("#changelist").each(function(){new o(n(this)).run()})})},{jquery:69}],4:[function(t,e,i){var n=t("jquery"),o=function(){};o.prototype={uniqueCheckboxIdCounter:0,uniqueCheckboxIdPrefix:"unique_checkbox_id_",addLabelToCheckbox:function(t){var e=t.attr("id")?t.attr("id"):this.uniqueCheckboxIdPrefix+this.uniqueCheckboxIdCounter++;t.attr("id",e),n("<label>").attr("for",e).insertAfter(t)},addLabelToCheckboxes:function(){var t=this;n('input[type="checkbox"]').each(function(){var e=n(this);void 0!=e.attr("id")&&0!=n('label[for="'+e.attr("id")+'"]').length||t.addLabelToCheckbox(e)})},run:function(){try{this.addLabelToCheckboxes()}catch(t){console.error(t,t.stack)}}},n(document).ready(function(){(new o).run()})},{jquery:69}],5:[function(t,e,i){var n=t("jquery"),o=function(t){this.$inline=t,this.prefix=t.data("inline-prefix"),this.verboseName=t.data("inline-verbose-name"),this.deleteText=t.data("inline-delete-text")};o.prototype={updateLabels:function(t){var e=this,i=t.find(".inline-navigation-item");t.find(".inline-related").each(function(t){var o=n(this),s=o.find(".inline_label"),r=s.html().replace(/(#\d+)/g,"#"+(t+1)),a=i.eq(t),l=o.hasClass("has_original")?r:e.verboseName+" "+r;s.html(r),a.html(l)})},updateFormIndex:function(t,e){var i=new RegExp("("+this.prefix+"-(\\d+|__prefix__))"),o=this.prefix+"-"+e;t.find("*").each(function(){var t=n(this);n.each(["for","id","name"],function(){var e=this;t.attr(e)&&t.attr(e,t.attr(e).replace(i,o))})}),t.hasClass("empty-form")||t.attr("id",this.prefix+"-"+e)},updateFormsIndexes:function(t){var e=this,i=t.find(".inline-navigation-item");t.find(".inline-related").each(function(t){var o=n(this);e.updateFormIndex(o,t),i.eq(t).attr("data-inline-related-id",o.attr("id"))})},updateTotalForms:function(t){var e=t.find('[name="'+this.prefix+'-TOTAL_FORMS"]'),i=t.find('[name="'+this.prefix+'-MAX_NUM_FORMS"]'),n=parseInt(t.find(".inline-related").length),o=i.val()?parseInt(i.val()):1/0;e.val(n),t.find(".add-row").toggle(o>=n)},addNavigationItem:function(t,e){var i=t.find(".inline-navigation-item.empty");return i.clone().removeClass("empty").attr("data-inline-related-id",e.attr("id")).insertBefore(i)},openNavigationItem:function(t,e){t.find(".inline-related").removeClass("selected").filter("#"+e.attr("data-inline-related-id")).addClass("selected"),t.find(".inline-navigation-item").removeClass("selected"),e.addClass("selected")},removeItem:function(t,e){e.remove(),t.find('.inline-navigation-item[data-inline-related-id="'+e.attr("id")+'"]').remove()},openFirstNavigationItem:function(t){var e=t.find(".inline-navigation-item:not(.empty)").first();void 0!=e&&(this.openNavigationItem(t,e),this.scrollNavigationToTop(t))},addItemDeleteButton:function(t){t.children(":first").append('<span><a class="inline-deletelink" href="#">'+this.deleteText+"</a></span>")},scrollNavigationToTop:function(t){var e=t.find(".inline-navigation-content");e.stop().animate({scrollTop:0})},scrollNavigationToBottom:function(t){var e=t.find(".inline-navigation-content");e.stop().animate({scrollTop:e.prop("scrollHeight")})},initAdding:function(t){var e=this;t.find(".add-row a").on("click",function(i){i.preventDefault();var n=t.find(".inline-related.empty-form"),o=parseInt(t.find(".inline-related").length)-1,s=n.clone(!0).removeClass("empty-form").insertBefore(n);e.updateTotalForms(t),e.updateFormIndex(s,o),e.updateFormIndex(n,o+1);var r=e.addNavigationItem(t,s);e.updateLabels(t),e.openNavigationItem(t,r),e.addItemDeleteButton(s),e.scrollNavigationToBottom(t)})},initDeletion:function(t){var e=this;t.on("click",".inline-deletelink",function(i){i.preventDefault();var o=n(this).closest(".inline-related");e.removeItem(t,o),e.updateFormsIndexes(t),e.updateLabels(t),e.updateTotalForms(t),e.openFirstNavigationItem(t)}),t.find(".inline-related").each(function(){var e=n(this);e.find(".delete input").on("change",function(){t.find('.inline-navigation-item[data-inline-related-id="'+e.attr("id")+'"]').toggleClass("delete",n(this).is(":checked"))})})},initNavigation:function(t){var e=this;t.on("click",".inline-navigation-item",function(i){i.preventDefault(),e.openNavigationItem(t,n(this))}),e.openFirstNavigationItem(t)},run:function(){var t=this.$inline;try{this.initAdding(t),this.initDeletion(t),this.initNavigation(t)}catch(e){console.error(e,e.stack)}}},e.exports=o},{jquery:69}],6:[function(require,module,exports){require("./../utils/jquery-slidefade");var $=require("jquery");var t=require("../utils/translate");require("jquery-ui/ui/core");require("jquery-ui/ui/widget");require("jquery-ui/ui/mouse");require("jquery-ui/ui/draggable");require("jquery-ui/ui/droppable");require("jquery-ui/ui/sortable");require("jquery-ui/ui/resizable");require("jquery-ui/ui/button");require("jquery-ui/ui/dialog");var Dashboard=function($dashboard){this.$dashboard=$dashboard};Dashboard.prototype={initTools:function($dashboard){$dashboard.find(".dashboard-tools-toggle").on("click",function(e){e.preventDefault();$dashboard.find(".dashboard-tools").toggleClass("visible")});var $form=$dashboard.find("#add-dashboard-module-form");$form.find(".add-dashboard-link").on("click",function(e){var $typeInput=$form.find("[name=\"type\"]");var type=$form.find("[name=\"module\"] option:selected").data("type");if(type){$typeInput.val(type);$.ajax({url:$form.attr("action"),method:$form.attr("method"),dataType:"json",data:$form.serialize(),success:function(result){if(result.error){return}document.location=result.success_url}})}e.preventDefault()});$dashboard.find(".reset-dashboard-link").on("click",function(e){var buttons={};var resetDashboard=function(){var $form=$dashboard.find("#reset-dashboard-form");$.ajax({url:$form.attr("action"),method:$form.attr("method"),dataType:"json",data:$form.serialize(),success:function(result){if(result.error){return}location.reload()}})};buttons[t("Yes")]=function(){resetDashboard();$(this).dialog("close")};buttons[t("Cancel")]=function(){$(this).dialog("close")};$dashboard.find("#reset-dashboard-dialog").dialog({resizable:false,modal:true,buttons:buttons});e.preventDefault()})},getDashboardModulesPositions:function($dashboard){var positions={};$dashboard.find(".dashboard-column").each(function(){var $column=$(this);var column=$column.closest(".dashboard-column-wrapper").index();$column.find(".dashboard-item").each(function(){var $item=$(this);positions[$item.data("module-id")]={column:column,order:$item.index()}})});return positions},updateDashboardModules:function($dashboard){var $form=$dashboard.find("#update-dashboard-modules-form");var positions=this.getDashboardModulesPositions($dashboard);var savedPositions=this.savedPositions||{};var modules=[];$.each(positions,function(id,position){var saved=savedPositions[id];if(saved&&saved.column==position.column&&saved.order==position.order){return}modules.push({id:id,column:position.column,order:position.order})});this.savedPositions=positions;if(modules.length==0){return}$form.find("[name=\"modules\"]").val(JSON.stringify(modules));$.ajax({url:$form.attr("action"),method:$form.attr("method"),dataType:"json",data:$form.serialize(),success:this.reloadIfMaterialized})},initModulesDragAndDrop:function($dashboard){var self=this;this.savedPositions={};$dashboard.find(".dashboard-item").each(function(){var $item=$(this);self.savedPositions[$item.data("module-id")]={column:$item.data("module-column"),order:$item.data("module-order")}});$dashboard.find(".dashboard-column").droppable({activeClass:"active",hoverClass:"hovered",tolerance:"pointer",accept:".dashboard-item"}).sortable({items:".dashboard-item.draggable",handle:".dashboard-item-header",tolerance:"pointer",connectWith:".dashboard-column",cursor:"move",placeholder:"dashboard-item placeholder",forcePlaceholderSize:true,update:function(event,ui){self.updateDashboardModules($dashboard)}})},reloadIfMaterialized:function(result){if(result.reload){location.reload()}},flushCollapsedModules:function($form,beacon){var pending=this.pendingCollapsed;clearTimeout(this.collapsedTimeout);if($.isEmptyObject(pending)){return}this.pendingCollapsed={};$form.find("[name=\"modules\"]").val(JSON.stringify(pending));if(beacon&&navigator.sendBeacon){navigator.sendBeacon($form.attr("action"),new FormData($form.get(0)));return}$.ajax({url:$form.attr("action"),method:$form.attr("method"),dataType:"json",data:$form.serialize(),success:this.reloadIfMaterialized})},initCollapsedModulesFlush:function($form){var self=this;this.pendingCollapsed={};$(window).on("pagehide",function(){self.flushCollapsedModules($form,true)});$(document).on("visibilitychange",function(){if(document.visibilityState=="hidden"){self.flushCollapsedModules($form,true)}})},initCollapsibleModules:function($dashboard){var self=this;var $form=$dashboard.find("#update-dashboard-modules-collapse-form");var $moduleForm=$dashboard.find("#update-dashboard-module-collapse-form");if($form.length!=0){this.initCollapsedModulesFlush($form)}$dashboard.find(".dashboard-item.collapsible").each(function(){var $item=$(this);var $link=$item.find(".dashboard-item-collapse");var $collapsible=$item.find(".dashboard-item-content");var moduleId=$item.data("module-id");$link.on("click",function(e){e.preventDefault();$collapsible.slideFadeToggle(200,"swing",function(){var collapsed=$collapsible.is(":visible")==false;if(collapsed){$item.addClass("collapsed")}else{$item.removeClass("collapsed")}if($form.length!=0){self.pendingCollapsed[moduleId]=collapsed;clearTimeout(self.collapsedTimeout);self.collapsedTimeout=setTimeout(function(){self.flushCollapsedModules($form,false)},1000);return}$moduleForm.find("[name=\"id\"]").val(moduleId);$moduleForm.find("[name=\"collapsed\"]").val(collapsed?"true":"false");$.ajax({url:$moduleForm.attr("action"),method:$moduleForm.attr("method"),dataType:"json",data:$moduleForm.serialize(),success:self.reloadIfMaterialized})})})})},initDeletableModules:function($dashboard){var self=this;var $form=$dashboard.find("#remove-dashboard-module-form");$dashboard.find(".dashboard-item.deletable").each(function(){var $item=$(this);var $link=$item.find(".dashboard-item-remove");var moduleId=$item.data("module-id");$link.on("click",function(e){e.preventDefault();var buttons={};var deleteModule=function(){$item.fadeOut(200,"swing",function(){$form.find("[name=\"id\"]").val(moduleId);$.ajax({url:$form.attr("action"),method:$form.attr("method"),dataType:"json",data:$form.serialize(),success:self.reloadIfMaterialized})})};buttons[t("Delete")]=function(){deleteModule();$(this).dialog("close")};buttons[t("Cancel")]=function(){$(this).dialog("close")};$dashboard.find("#module-remove-dialog").dialog({resizable:false,modal:true,buttons:buttons})})})},setAjaxModuleContent:function($item,html){var $content=$item.find(".dashboard-item-content");if(html==null){$content.empty();return}var oldHeight=$content.height();$content.html(html);var newHeight=$content.height();$content.height(oldHeight);$content.animate({height:newHeight},250,"swing",function(){$content.height("auto")})},loadAjaxModule:function($item){var self=this;$.ajax({url:$item.data("ajax-url"),dataType:"json",success:function(result){self.setAjaxModuleContent($item,result.error?null:result.html)},error:function(){self.setAjaxModuleContent($item,null)}})},initAjaxModules:function($dashboard){var self=this;var $form=$dashboard.find("#load-dashboard-modules-form");var $items=$dashboard.find(".dashboard-item.ajax");if($items.length==0){return}if($form.length==0){$items.each(function(){self.loadAjaxModule($(this))});return}$.ajax({url:$form.attr("action"),method:$form.attr("method"),dataType:"json",traditional:true,data:{app_label:$form.find("[name=\"app_label\"]").val(),id:$items.map(function(){return $(this).data("module-id")}).get()},success:function(result){var pending=result.error?[]:result.pending||[];$items.each(function(){var $item=$(this);var id=$item.data("module-id");if(pending.indexOf(id)!=-1){self.loadAjaxModule($item);return}self.setAjaxModuleContent($item,result.error?null:result.modules[id])})},error:function(){$items.each(function(){self.setAjaxModuleContent($(this),null)})}})},reloadModule:function($item,version){var $content=$item.find(".dashboard-item-content");$.ajax({url:$item.data("load-url"),dataType:"json",success:function(result){if(result.error){return}$content.html(result.html);$item.attr("data-version",result.version!=null?result.version:version)}})},initModulesPolling:function($dashboard){var self=this;var $form=$dashboard.find("#dashboard-modules-versions-form");var interval=parseInt($form.data("interval"));if($form.length==0||!interval){return}var poll=function(){$.ajax({url:$form.attr("action"),method:$form.attr("method"),dataType:"json",data:$form.serialize(),success:function(result){if(result.error){return}$dashboard.find(".dashboard-item[data-load-url]").each(function(){var $item=$(this);var version=result.versions[$item.data("module-id")];if(version!=null&&String(version)!=$item.attr("data-version")){self.reloadModule($item,version)}})},complete:function(){setTimeout(poll,interval*1000)}})};setTimeout(poll,interval*1000)},loadNextPage:function($list){var url=$list.data("next-url");if(!url||$list.data("loading")){return}$list.data("loading",true);$.ajax({url:url,dataType:"json",success:function(result){if(result.error){return}$list.append(result.html);$list.data("next-url",result.next_url);if(!result.next_url){$list.removeAttr("data-next-url")}},complete:function(){$list.data("loading",false)}})},initPaginatedModules:function($dashboard){var self=this;var loadVisiblePages=function(){var bottom=$(window).scrollTop()+$(window).height();$dashboard.find("ul[data-next-url]").each(function(){var $list=$(this);if($list.is(":visible")&&$list.offset().top+$list.outerHeight()<=bottom+100){self.loadNextPage($list)}})};$(window).on("scroll",loadVisiblePages)},updateModuleChildrenFormsetLabels:function($inline){$inline.find(".inline-related").each(function(i){$(this).find(".inline_label").text("#"+(i+1))})},updateModuleChildrenFormsetFormIndex:function($form,index){var prefix="children";var id_regex=new RegExp("("+prefix+"-(\\d+|__prefix__))");var replacement=prefix+"-"+index;$form.find("fieldset.module *").each(function(){var $el=$(this);$.each(["for","id","name"],function(){var attr=this;if($el.attr(attr)){$el.attr(attr,$el.attr(attr).replace(id_regex,replacement))}})})},updateModuleChildrenFormsetFormsIndexes:function($inline){var self=this;var from=parseInt($inline.find(".inline-related.has_original").length);$inline.find(".inline-related.last-related").each(function(i){self.updateModuleChildrenFormsetFormIndex($(this),from+i)})},updateModuleChildrenFormsetTotalForms:function($inline){var $totalFormsInput=$inline.find("[name=\"children-TOTAL_FORMS\"]");var totalForms=parseInt($inline.find(".inline-related").length);$totalFormsInput.val(totalForms)},initModuleChildrenFormsetUpdate:function($dashboard){if(!$dashboard.hasClass("change-form")){return}var self=this;var $inline=$dashboard.find(".inline-group");$inline.find(".add-row a").on("click",function(e){e.preventDefault();var $empty=$inline.find(".inline-related.empty-form");var $clone=$empty.clone(true).removeClass("empty-form").insertBefore($empty);self.updateModuleChildrenFormsetLabels($inline);self.updateModuleChildrenFormsetFormIndex($empty,parseInt($inline.find(".inline-related").length)-1);self.updateModuleChildrenFormsetFormIndex($clone,parseInt($inline.find(".inline-related").length)-2);self.updateModuleChildrenFormsetTotalForms($inline)});$inline.find(".inline-deletelink").on("click",function(e){e.preventDefault();$(this).closest(".inline-related").remove();self.updateModuleChildrenFormsetFormsIndexes($inline);self.updateModuleChildrenFormsetLabels($inline);self.updateModuleChildrenFormsetTotalForms($inline)})},run:function(){var $dashboard=this.$dashboard;try{this.initTools($dashboard);this.initModulesDragAndDrop($dashboard);this.initCollapsibleModules($dashboard);this.initDeletableModules($dashboard);this.initAjaxModules($dashboard);this.initPaginatedModules($dashboard);this.initModulesPolling($dashboard);this.initModuleChildrenFormsetUpdate($dashboard)}catch(e){console.error(e,e.stack)}$dashboard.addClass("initialized")}};$(document).ready(function(){$(".dashboard.jet").each(function(){new Dashboard($(this)).run()})})},{"../utils/translate":37,"./../utils/jquery-slidefade":36,jquery:69,"jquery-ui/ui/button":55,"jquery-ui/ui/core":56,"jquery-ui/ui/dialog":58,"jquery-ui/ui/draggable":59,"jquery-ui/ui/droppable":60,"jquery-ui/ui/mouse":61,"jquery-ui/ui/resizable":63,"jquery-ui/ui/sortable":64,"jquery-ui/ui/widget":66}],7:[function(t,e,i){var n=t("jquery");t("jquery-ui/ui/core"),t("jquery-ui/ui/datepicker"),t("timepicker");var o=function(){};o.prototype={removeInputTextNode:function(t){if(0!=t.length){var e=t.get(0).previousSibling;3==e.nodeType&&n(e).remove()}},updateDatetimeLayout:function(){var t=this;n(".form-row .datetime").each(function(){var e=n(this),i=e.find(".vDateField"),o=e.find(".vTimeField");t.removeInputTextNode(i),t.removeInputTextNode(o),i.nextAll("br").first().remove()}),n(".form-row .vDateField").each(function(){var t=n(this),e=n("<span>").addClass("icon-calendar");n("<a>").attr("href","#").addClass("vDateField-link").append(e).insertAfter(t)}),n(".form-row .vTimeField").each(function(){var t=n(this),e=n("<span>").addClass("icon-clock");n("<a>").attr("href","#").addClass("vTimeField-link").append(e).insertAfter(t)})},djangoDateTimeFormatToJs:function(t){return t.toLowerCase().replace(/%\w/g,function(t){return t=t.replace(/%/,""),t+t})},initDateWidgets:function(t){t=t||n(document);var e=this;t.find(".form-row .vDateField").each(function(){var t=n(this),i=t.next(".vDateField-link");t.datepicker({dateFormat:e.djangoDateTimeFormatToJs(DATE_FORMAT),showButtonPanel:!0,nextText:"",prevText:""}),i.on("click",function(e){t.datepicker("widget").is(":visible")?t.datepicker("hide"):t.datepicker("show"),e.preventDefault()})});var i=n.datepicker._gotoToday;n.datepicker._gotoToday=function(t){i.call(this,t),this._selectDate(t)}},initTimeWidgets:function(t){t=t||n(document),t.find(".form-row .vTimeField").each(function(){var t=n(this),e=t.next(".vTimeField-link");t.timepicker({showPeriodLabels:!1,showCloseButton:!0,showNowButton:!0}),e.on("click",function(e){t.datepicker("widget").is(":visible")?t.datepicker("hide"):t.timepicker("show"),e.preventDefault()})})},run:function(){try{this.updateDatetimeLayout(),this.initDateWidgets(),this.initTimeWidgets();var t=this;n(".inline-group").on("inline-group-row:added",function(e,i){i.find(".hasDatepicker").removeClass("hasDatepicker"),i.find(".hasTimepicker").removeClass("hasTimepicker"),t.initDateWidgets(i),t.initTimeWidgets(i)})}catch(e){console.error(e,e.stack)}}},n(document).ready(function(){(new o).run()})},{jquery:69,"jquery-ui/ui/core":56,"jquery-ui/ui/datepicker":57,timepicker:92}],8:[function(t,e,i){var n=t("jquery"),o=function(t){this.$toolbar=t};o.prototype={initFiltersInteraction:function(t){t.find(".changelist-filter-select").each(function(){var t=n(this),e=t.attr("multiple");e&&t.data("previous-options",t.find("option:selected")),t.on("change",function(){var t=n(this),i=t.find("option:selected");e&&(t.data("previous-options").length<i.length?i=i.filter(function(e,i){return 0==t.data("previous-options").filter(function(t,e){return e==i}).length}):t.data("previous-options").length>i.length&&(i=t.data("previous-options").filter(function(t,e){return 0==i.filter(function(t,i){return e==i}).length})),t.data("previous-options",t.find("option:selected")));var o=i.data("url"),s=t.data("queryset--lookup");o?document.location=i.data("url"):s&&(document.location="?"+s+"="+i.val())})})},run:function(){try{this.initFiltersInteraction(this.$toolbar)}catch(t){console.error(t,t.stack)}}},n(document).ready(function(){n("#toolbar").each(function(){new o(n(this)).run()})})},{jquery:69}],9:[function(t,e,i){var n=t("jquery"),o=t("./compact-inline"),s=function(t){this.$inline=t};s.prototype={initAddRow:function(t){t.on("click",".add-row a",function(){var e=t.find(".inline-related:not(.empty-form)").last();t.trigger("inline-group-row:added",[e])})},run:function(){var t=this.$inline;try{t.hasClass("compact")&&new o(t).run(),this.initAddRow(t)}catch(e){console.error(e,e.stack)}t.addClass("initialized")}},n(document).ready(function(){n(".inline-group").each(function(){new s(n(this)).run()})})},{"./compact-inline":5,jquery:69}],10:[function(t,e,i){var n=t("jquery"),o=t("../utils/window-storage"),s=function(){this.windowStorage=new o("relatedWindows")};s.prototype={updateLinks:function(t){t.find("~ .change-related, ~ .delete-related, ~ .add-another").each(function(){var e=n(this),i=e.data("href-template");if(void 0!=i){var o=t.val();o?e.attr("href",i.replace("__fk__",o)):e.removeAttr("href")}})},initLinksForRow:function(t){if(!t.data("related-popups-links-initialized")){var e=this;t.find("select").each(function(){var t=n(this);e.updateLinks(t),t.find("~ .add-related, ~ .change-related, ~ .delete-related, ~ .add-another").each(function(){var i=n(this);i.on("click",function(n){n.preventDefault();var o=i.attr("href");void 0!=o&&(o.indexOf("_popup")==-1&&(o+=o.indexOf("?")==-1?"?_popup=1":"&_popup=1"),e.showPopup(t,o))})})}).on("change",function(){e.updateLinks(n(this))}),t.find("input").each(function(){var t=n(this);t.find("~ .related-lookup").each(function(){var i=n(this);i.on("click",function(n){n.preventDefault();var o=i.attr("href");o+=o.indexOf("?")==-1?"?_popup=1":"&_popup=1",e.showPopup(t,o)})})}),t.data("related-popups-links-initialized",!0)}},initLinks:function(){var t=this;n(".form-row").each(function(){t.initLinksForRow(n(this))}),n(".inline-group").on("inline-group-row:added",function(e,i){i.find(".form-row").each(function(){t.initLinksForRow(n(this))})})},initPopupBackButton:function(){var t=this;n(".related-popup-back").on("click",function(e){e.preventDefault(),t.closePopup()})},showPopup:function(t,e){var i=n(window.top.document),o=i.find(".related-popup-container"),s=o.find(".loading-indicator"),r=i.find("body"),a=n("<div>").addClass("related-popup").data("input",t),l=n("<iframe>").attr("src",e).on("load",function(){a.add(i.find(".related-popup-back")).fadeIn(200,"swing",function(){s.hide()})});a.append(l),s.show(),i.find(".related-popup").add(i.find(".related-popup-back")).fadeOut(200,"swing"),o.fadeIn(200,"swing",function(){o.append(a)}),r.addClass("non-scrollable")},closePopup:function(t){var e=this.windowStorage.previous(),i=this;!function(e){var n=e(window.top.document),o=n.find(".related-popup"),s=n.find(".related-popup-container"),r=o.last();void 0!=t&&i.processPopupResponse(r,t),i.windowStorage.pop(),1==o.length?s.fadeOut(200,"swing",function(){n.find(".related-popup-back").hide(),n.find("body").removeClass("non-scrollable"),r.remove()}):o.length>1&&(r.remove(),o.eq(o.length-2).show())}(e?e.jet.jQuery:n)},findPopupResponse:function(){var t=this;n("#django-admin-popup-response-constants").each(function(){var e=n(this),i=e.data("popup-response");t.closePopup(i)})},processPopupResponse:function(t,e){var i=t.data("input");switch(e.action){case"change":i.find("option").each(function(){var t=n(this);t.val()==e.value&&t.html(e.obj).val(e.new_value)}),i.trigger("change").trigger("select:init");break;case"delete":i.find("option").each(function(){var t=n(this);t.val()==e.value&&t.remove()}),i.trigger("change").trigger("select:init");break;default:if(i.is("select")){var o=n("<option>").val(e.value).html(e.obj);i.append(o),o.attr("selected",!0),i.trigger("change").trigger("select:init")}else i.is("input.vManyToManyRawIdAdminField")&&i.val()?i.val(i.val()+","+e.value):i.is("input")&&i.val(e.value)}},overrideRelatedGlobals:function(){var t=this;window.showRelatedObjectLookupPopup=window.showAddAnotherPopup=window.showRelatedObjectPopup=function(){},window.opener=this.windowStorage.previous()||window.opener,window.dismissRelatedLookupPopup=function(e,i){t.closePopup({action:"lookup",value:i})}},initDeleteRelatedCancellation:function(){var t=this;n(".popup.delete-confirmation .cancel-link").on("click",function(e){e.preventDefault(),t.closePopup()}).removeAttr("onclick")},initLookupLinks:function(){var t=this;n("a[data-popup-opener]").click(function(e){e.preventDefault(),t.closePopup({action:"lookup",value:n(this).data("popup-opener")})})},run:function(){this.windowStorage.push(window);try{this.initLinks(),this.initPopupBackButton(),this.findPopupResponse(),this.overrideRelatedGlobals(),this.initDeleteRelatedCancellation(),this.initLookupLinks()}catch(t){console.error(t,t.stack)}}},n(document).ready(function(){(new s).run()})},{"../utils/window-storage":38,jquery:69}],11:[function(t,e,i){var n=t("jquery"),o=function(){};o.prototype={prevScrollTop:null,initDetector:function(){var t=this;n(window).on("scroll",function(){null!=t.prevScrollTop&&n(window).scrollTop()>t.prevScrollTop&&n(window).scrollTop()>60?n(document.body).addClass("scroll-to-bottom"):n(document.body).removeClass("scroll-to-bottom"),t.prevScrollTop=n(window).scrollTop()})},run:function(){try{this.initDetector()}catch(t){console.error(t,t.stack)}}},n(document).ready(function(){(new o).run()})},{jquery:69}],12:[function(t,e,i){t("select2");var n=t("jquery"),o=t("../utils/translate"),s=function(){};s.prototype={updateAttachBody:function(t){t.prototype._positionDropdown=function(){var t=n(window),e=this.$dropdown.hasClass("select2-dropdown--above"),i=this.$dropdown.hasClass("select2-dropdown--below"),o=null,s=(this.$container.position(),this.$container.offset());s.bottom=s.top+this.$container.outerHeight(!1);var r={height:this.$container.outerHeight(!1)};r.top=s.top,r.bottom=s.top+r.height;var a={height:this.$dropdown.outerHeight(!1)},l={top:t.scrollTop(),bottom:t.scrollTop()+t.height()},c=l.top<s.top-a.height,u=l.bottom>s.bottom+a.height,d={left:s.left,top:r.bottom};if(e||i||(o="below"),u||!c||e?!c&&u&&e&&(o="below"):o="above",("above"==o||e&&"below"!==o)&&(d.top=r.top-a.height),null!=o){this.$dropdown.removeClass("select2-dropdown--below select2-dropdown--above").addClass("select2-dropdown--"+o),this.$container.removeClass("select2-container--below select2-container--above").addClass("select2-container--"+o);var h=this.$dropdown.find(".select2-search");"above"==o&&h.is(":first-child")?h.detach().appendTo(this.$dropdown):"below"==o&&h.is(":last-child")&&h.detach().prependTo(this.$dropdown)}this.$dropdownContainer.css(d)},t.prototype.render=function(t){var e=n("<span></span>"),i=t.call(this);return e.append(i),this.$dropdownContainer=e,this.$element.prop("multiple")?this.$dropdown.addClass("select2-multiple-dropdown"):this.$dropdown.removeClass("select2-multiple-dropdown"),e}},updateDropdownAdapter:function(t){t.prototype.render=function(){var t="";this.options.get("multiple")&&(t='<div class="select2-buttons"><a href="#" class="select2-buttons-button select2-buttons-button-select-all">'+o("select all")+'</a> <a href="#" class="select2-buttons-button select2-buttons-button-deselect-all">'+o("deselect all")+"</a></div>");var e=n('<span class="select2-dropdown">'+t+'<span class="select2-results"></span></span>'),i=this.$element;return e.find(".select2-buttons-button-select-all").on("click",function(t){t.preventDefault();var e=[];i.find("option").each(function(){e.push(n(this).val())}),i.select2("val",e),i.select2("close")}),e.find(".select2-buttons-button-deselect-all").on("click",function(t){t.preventDefault(),i.select2("val",""),i.select2("close")}),e.attr("dir",this.options.get("dir")),this.$dropdown=e,e}},initSelect:function(t,e){var i={theme:"jet",dropdownAdapter:e,width:"auto"};if(t.hasClass("ajax")){var n=t.data("content-type-id"),o=t.data("app-label"),s=t.data("model"),r=t.data("object-id"),a=100;i.ajax={dataType:"json",data:function(t){return{content_type:n,app_label:o,model:s,q:t.term,page:t.page,page_size:a,object_id:r}},processResults:function(t,e){if(t.error)return{};e.page=e.page||1;var i=e.page*a<t.total;return{results:t.items,pagination:{more:i}}}}}t.on("change",function(e){django.jQuery(t.get(0)).trigger(e)}),t.select2(i)},initSelect2:function(){var t=this,e=n.fn.select2.amd.require("select2/dropdown/attachBody"),i=n.fn.select2.amd.require("select2/dropdown"),o=n.fn.select2.amd.require("select2/utils"),s=n.fn.select2.amd.require("select2/dropdown/search"),r=n.fn.select2.amd.require("select2/dropdown/minimumResultsForSearch"),a=n.fn.select2.amd.require("select2/dropdown/closeOnSelect");this.updateAttachBody(e),this.updateDropdownAdapter(i),i=o.Decorate(i,s),i=o.Decorate(i,e),i=o.Decorate(i,r),i=o.Decorate(i,a),n(document).on("select:init","select",function(){var e=n(this);e.parents(".empty-form").length>0||t.initSelect(e,i)}),n("select").trigger("select:init"),n(".inline-group").on("inline-group-row:added",function(t,e){e.find("select").trigger("select:init")})},run:function(){try{this.initSelect2()}catch(t){console.error(t,t.stack)}}},n(document).ready(function(){(new s).run()})},{"../utils/translate":37,jquery:69,select2:91}],13:[function(require,module,exports){var $=require("jquery");var Siblings=function($siblings){this.$siblings=$siblings};Siblings.prototype={moveSiblings:function($siblings){$siblings.detach().insertBefore($(".object-tools"))},isSlowConnection:function(){var connection=navigator.connection||navigator.mozConnection||navigator.webkitConnection;if(!connection){return false}return connection.saveData==true||/(^|-)2g$/.test(connection.effectiveType||"")},prefetchNext:function($siblings){var url=$siblings.find(".changeform-navigation-button.right").attr("href");if(!url||this.isSlowConnection()){return}var prefetch=function(){$("<link>").attr("rel","prefetch").attr("href",url).appendTo("head")};if(window.requestIdleCallback){window.requestIdleCallback(prefetch,{timeout:2000})}else{setTimeout(prefetch,1000)}},run:function(){try{this.moveSiblings(this.$siblings);if(this.$siblings.data("prefetch")){this.prefetchNext(this.$siblings)}}catch(e){console.error(e,e.stack)}this.$siblings.addClass("initialized")}};$(document).ready(function(){$(".changeform-navigation").each(function(){new Siblings($(this)).run()})})},{jquery:69}],14:[function(t,e,i){t("./../../utils/jquery-slidefade");var n=t("jquery");t("jquery-ui/ui/core"),t("jquery-ui/ui/widget"),t("jquery-ui/ui/mouse"),t("jquery-ui/ui/draggable"),t("jquery-ui/ui/resizable"),t("jquery-ui/ui/button"),t("jquery-ui/ui/dialog");var o=function(t){this.$sidebar=t};o.prototype={pinToggle:function(t,e,i){var o=this,s=e.find(".apps-list"),r=e.find(".apps-list-pinned");n.ajax({url:t.attr("action"),method:t.attr("method"),dataType:"json",data:t.serialize(),success:function(t){if(!t.error){var n=t.pinned?r:s;i.toggleClass("pinned",t.pinned).detach().appendTo(n),o.updateAppsHide(e)}}})},initApplicationPinning:function(t){var e=this;t.find(".pin-toggle").on("click",function(i){i.preventDefault(),i.stopPropagation();var o=n(this).closest(".app-item"),s=o.data("app-label"),r=t.find("#toggle-application-pin-form");r.find('input[name="app_label"]').val(s),e.pinToggle(r,t,o)}),t.find(".edit-apps-list").on("click",function(t){t.preventDefault(),n(this).parents(".sidebar-section").toggleClass("editing")})},updateAppsHide:function(t){var e=t.find(".apps-list"),i=t.find(".apps-list-pinned"),n=t.find(".apps-hide");0!=e.children().length&&0!=i.children().length||!e.is(":visible")?(n.toggleClass("apps-visible",e.is(":visible")),n.toggleClass("apps-hidden",!e.is(":visible"))):n.removeClass("apps-visible apps-hidden")},initAppsHide:function(t){var e=this,i=t.find(".apps-list"),n=t.find(".apps-list-pinned"),o=t.find(".apps-hide");o.on("click",function(n){n.preventDefault(),i.slideFadeToggle(200,"swing",function(){localStorage.side_menu_apps_list_visible=i.is(":visible"),e.updateAppsHide(t)})}),"false"===localStorage.side_menu_apps_list_visible&&(0!=n.children().length?i.hide():localStorage.side_menu_apps_list_visible=!0),this.updateAppsHide(t)},run:function(){try{this.initApplicationPinning(this.$sidebar),this.initAppsHide(this.$sidebar)}catch(t){console.error(t,t.stack)}}},e.exports=o},{"./../../utils/jquery-slidefade":36,jquery:69,"jquery-ui/ui/button":55,"jquery-ui/ui/core":56,"jquery-ui/ui/dialog":58,"jquery-ui/ui/draggable":59,"jquery-ui/ui/mouse":61,"jquery-ui/ui/resizable":63,"jquery-ui/ui/widget":66}],15:[function(t,e,i){var n=t("jquery"),o=t("../../utils/translate");t("jquery-ui/ui/core"),t("jquery-ui/ui/widget"),t("jquery-ui/ui/mouse"),t("jquery-ui/ui/draggable"),t("jquery-ui/ui/resizable"),t("jquery-ui/ui/button"),t("jquery-ui/ui/dialog");var s=function(t){this.$sidebar=t};s.prototype={addBookmark:function(t,e){n.ajax({url:t.attr("action"),method:t.attr("method"),dataType:"json",data:t.serialize(),success:function(t){if(!t.error){var i=e.find(".bookmark-item.clone").clone().removeClass("clone");i.attr("href",t.url).find(".sidebar-link-label").append(t.title),i.find(".bookmarks-remove").data("bookmark-id",t.id),e.append(i)}}})},deleteBookmark:function(t,e){n.ajax({url:t.attr("action"),method:t.attr("method"),dataType:"json",data:t.serialize(),success:function(t){t.error||e.remove()}})},initBookmarksAdding:function(t){var e=this,i=t.find("#bookmarks-add-form"),s=i.find('input[name="title"]'),r=i.find('input[name="url"]'),a=t.find("#bookmarks-add-dialog"),l=t.find(".bookmarks-list");t.find(".bookmarks-add").on("click",function(t){t.preventDefault();var c=n(this),u=c.data("title")?c.data("title"):document.title,d=window.location.href;s.val(u),r.val(d);var h={};h[o("Add")]=function(){e.addBookmark(i,l),n(this).dialog("close")},h[o("Cancel")]=function(){n(this).dialog("close")},a.dialog({resizable:!1,modal:!0,buttons:h})})},initBookmarksRemoving:function(t){var e=this,i=t.find("#bookmarks-remove-form"),s=i.find('input[name="id"]'),r=t.find("#bookmarks-remove-dialog");t.on("click",".bookmarks-remove",function(t){t.preventDefault();var a=n(this),l=a.closest(".bookmark-item"),c=a.data("bookmark-id");s.val(c);var u={};u[o("Delete")]=function(){e.deleteBookmark(i,l),n(this).dialog("close")},u[o("Cancel")]=function(){n(this).dialog("close")},r.dialog({resizable:!1,modal:!0,buttons:u})})},initBookmarks:function(t){this.initBookmarksAdding(t),this.initBookmarksRemoving(t)},run:function(){
 try{this.initBookmarksAdding(this.$sidebar),this.initBookmarksRemoving(this.$sidebar)}catch(t){console.error(t,t.stack)}}},e.exports=s},{"../../utils/translate":37,jquery:69,"jquery-ui/ui/button":55,"jquery-ui/ui/core":56,"jquery-ui/ui/dialog":58,"jquery-ui/ui/draggable":59,"jquery-ui/ui/mouse":61,"jquery-ui/ui/resizable":63,"jquery-ui/ui/widget":66}],16:[function(t,e,i){var n=t("jquery"),o=t("./application-pinning"),s=t("./bookmarks"),r=t("./popup");t("perfect-scrollbar/jquery")(n),t("browsernizr/test/touchevents"),t("browsernizr"),t("jquery.cookie");var a=function(t){this.$sidebar=t};a.prototype={initScrollBars:function(t){n(document.documentElement).hasClass("touchevents")||t.find(".sidebar-wrapper").perfectScrollbar()},initSideBarToggle:function(){var t=function(t){t.preventDefault(),this.sideBarToggle()};n(".sidebar-toggle").on("click",t.bind(this)),n(document.body).on("click",".sidebar-backdrop",t.bind(this))},sideBarToggle:function(){var t=n(".sidebar-dependent"),e=!t.hasClass("sidebar-opened")&&!n(document.body).hasClass("menu-pinned");n(document.body).toggleClass("non-scrollable",e).removeClass("menu-pinned"),t.toggleClass("sidebar-opened",e),this.storePinStatus(!1),this.toggleBackdrop(e)},toggleBackdrop:function(t){if(t){var e=n("<div/>",{"class":"sidebar-backdrop"});n(document.body).append(e),e.animate({opacity:.5},300)}else n(".sidebar-backdrop").animate({opacity:0},300,function(){n(this).remove()})},initPinSideBar:function(t){t.on("click",".sidebar-pin",function(){var t=n(".sidebar-dependent");n(document.body).hasClass("menu-pinned")?(t.removeClass("sidebar-opened"),n(document.body).removeClass("menu-pinned"),this.storePinStatus(!1)):(this.storePinStatus(!0),n(document.body).addClass("menu-pinned").removeClass("non-scrollable")),this.toggleBackdrop(!1),setTimeout(function(){n(window).trigger("resize")},500)}.bind(this))},storePinStatus:function(t){n.cookie("sidebar_pinned",t,{expires:365,path:"/"})},addToggleButton:function(){var t=n("<span>").addClass("sidebar-container-toggle sidebar-header-menu-icon icon-menu sidebar-toggle");n("#container").prepend(t)},run:function(){var t=this.$sidebar;new o(t).run(),new s(t).run(),new r(t).run();try{this.initScrollBars(t),this.addToggleButton(),this.initSideBarToggle(),this.initPinSideBar(t)}catch(e){console.error(e,e.stack)}t.addClass("initialized")}},n(document).ready(function(){n(".sidebar").each(function(){new a(n(this)).run()})}),e.exports=new a},{"./application-pinning":14,"./bookmarks":15,"./popup":17,browsernizr:39,"browsernizr/test/touchevents":54,jquery:69,"jquery.cookie":67,"perfect-scrollbar/jquery":70}],17:[function(t,e,i){t("../../utils/jquery-icontains");var n=t("jquery");t("browsernizr/test/touchevents"),t("browsernizr");var o=function(t){this.$sidebar=t};o.prototype={popupDisplayTimeout:null,$currentSectionLink:null,$currentSection:null,$currentSectionListItem:null,resetPopupDisplayTimeout:function(){null!=this.popupDisplayTimeout&&clearTimeout(this.popupDisplayTimeout)},setCurrentSectionLink:function(t){this.$currentSectionLink&&this.$currentSectionLink.removeClass("selected"),this.$currentSectionLink=t,this.$currentSectionLink&&this.$currentSectionLink.addClass("selected")},openPopup:function(t,e){var i=this;this.resetPopupDisplayTimeout(),e=e&&void 0!=e?e:200,this.popupDisplayTimeout=setTimeout(function(){i.popupDisplayTimeout=null;var e=t.find(".sidebar-popup-section");if(e.hide(),i.$currentSectionLink){var o=e.filter("."+i.$currentSectionLink.data("popup-section-class")),s=o.find(".sidebar-popup-search");o.show(),s.val("").trigger("change").focus(),i.$currentSection=o,i.resetCurrentSectionListItems(),i.$currentSectionListItem=null}t.stop().fadeIn(200,"swing"),n(document.body).addClass("non-scrollable")},e)},closePopup:function(t,e){var i=this;this.resetPopupDisplayTimeout(),e=e&&void 0!=e?e:50,this.popupDisplayTimeout=setTimeout(function(){i.popupDisplayTimeout=null,i.setCurrentSectionLink(null),i.$currentSection=null,t.stop().fadeOut(200,"swing"),n(document.documentElement).hasClass("touchevents")||n(document.body).removeClass("non-scrollable")},e)},onSectionLinkInteracted:function(t,e){var i=this.$currentSectionLink&&e!==this.$currentSectionLink;this.setCurrentSectionLink(e),this.openPopup(t,i?500:null)},initSectionsDisplay:function(t){var e=this,i=t.find(".sidebar-popup-container"),o=t.find(".sidebar-popup");t.find(".popup-section-link").on("mouseenter",function(){n(document.documentElement).hasClass("touchevents")||e.onSectionLinkInteracted(i,n(this))}).on("mouseleave",function(){e.closePopup(i)}).on("click",function(t){t.preventDefault(),!n(document.documentElement).hasClass("touchevents")&&n(this).attr("href")?document.location=n(this).attr("href"):e.onSectionLinkInteracted(i,n(this))}),t.find(".sidebar-back").on("click touchend",function(t){t.preventDefault(),e.closePopup(i)}),o.on("mouseenter",function(){e.openPopup(i,0)}).on("mouseleave",function(){e.closePopup(i)})},initSectionsSearch:function(t){t.find(".sidebar-popup-section").each(function(){var t=n(this),e=t.find(".sidebar-popup-search"),i=t.find(".sidebar-popup-list-item");e.on("change keyup",function(){var t=n(this).val();i.hide().find('.sidebar-popup-list-item-link:icontains("'+t+'")').closest(".sidebar-popup-list-item").show()})})},resetCurrentSectionListItems:function(){this.$currentSection.find(".sidebar-popup-list-item:visible").removeClass("selected")},moveSectionListItemSelection:function(t){if(null!=this.$currentSectionListItem&&(t?this.$currentSectionListItem=this.$currentSectionListItem.nextAll(":visible").first():this.$currentSectionListItem=this.$currentSectionListItem.prevAll(":visible").first()),null==this.$currentSectionListItem||0==this.$currentSectionListItem.length){var e=this.$currentSection.find(".sidebar-popup-list-item:visible");this.$currentSectionListItem=t?e.first():e.last()}this.resetCurrentSectionListItems(),this.$currentSectionListItem.addClass("selected")},initSectionKeyboardControls:function(){var t=this;n(document).keydown(function(e){if(null!=t.$currentSectionLink){if(38==e.which)t.moveSectionListItemSelection(!1);else if(40==e.which)t.moveSectionListItemSelection(!0);else{if(13!=e.which)return;if(t.$currentSectionListItem){var i=t.$currentSectionListItem.find("a");i.attr("href")&&(document.location=i.attr("href"))}}e.preventDefault()}})},initSectionLists:function(t){var e=this;t.find(".sidebar-popup-list-item-link").on("mouseenter",function(){e.$currentSectionListItem=n(this).closest(".sidebar-popup-list-item"),e.resetCurrentSectionListItems(),e.$currentSectionListItem.addClass("selected")}).on("touchmove touchend",function(t){var e=n(this);return"touchmove"==t.type?void e.data("element_swiped",!0):("touchend"==t.type&&!e.data("element_swiped")&&e.attr("href")&&(window.location=e.attr("href")),void e.data("element_swiped",!1))}),this.initSectionKeyboardControls()},run:function(){try{this.initSectionsDisplay(this.$sidebar),this.initSectionsSearch(this.$sidebar),this.initSectionLists(this.$sidebar)}catch(t){console.error(t,t.stack)}}},e.exports=o},{"../../utils/jquery-icontains":35,browsernizr:39,"browsernizr/test/touchevents":54,jquery:69}],18:[function(t,e,i){t("jquery.cookie");var n=t("jquery"),o=function(){};o.prototype={moveChooser:function(t){t.detach().insertAfter(n(".user-tools-welcome-msg")).addClass("initialized")},initChooser:function(t){var e=t.find(".choose-theme");e.on("click",function(t){t.preventDefault();var i=n(this);n.cookie("JET_THEME",i.data("theme"),{expires:365,path:"/"});var o=[{url:i.data("base-stylesheet"),"class":"base-stylesheet"},{url:i.data("select2-stylesheet"),"class":"select2-stylesheet"},{url:i.data("jquery-ui-stylesheet"),"class":"jquery-ui-stylesheet"}],s=0,r=function(){++s,s==o.length&&n(document).trigger("theme:changed")};n.each(o,function(){n("<link>").attr("rel","stylesheet").addClass(this["class"]).attr("href",this.url).load(r).appendTo("head"),n("."+this["class"]).slice(0,-2).remove()}),e.removeClass("selected"),i.addClass("selected")})},run:function(){var t=n(".theme-chooser");try{this.moveChooser(t),this.initChooser(t)}catch(e){console.error(e,e.stack)}}},n(document).ready(function(){(new o).run()})},{jquery:69,"jquery.cookie":67}],19:[function(t,e,i){var n=t("jquery");t("jquery-ui/ui/core"),t("jquery-ui/ui/position"),t("jquery-ui/ui/widget"),t("jquery-ui/ui/tooltip"),t("browsernizr/test/touchevents"),t("browsernizr");var o=function(){};o.prototype={initTooltips:function(){n(document.documentElement).hasClass("touchevents")||n("a[title], .tooltip[title]").tooltip({track:!0})},run:function(){try{this.initTooltips()}catch(t){console.error(t,t.stack)}}},n(document).ready(function(){new o(n(this)).run()})},{browsernizr:39,"browsernizr/test/touchevents":54,jquery:69,"jquery-ui/ui/core":56,"jquery-ui/ui/position":62,"jquery-ui/ui/tooltip":65,"jquery-ui/ui/widget":66}],20:[function(t,e,i){var n=t("jquery"),o=function(){};o.prototype={initTouchMoveHandler:function(){n(document).on("touchmove",function(t){for(var e=!0,i=n(t.target);i.length>0;){if(i.hasClass("non-scrollable")){e=!1;break}if(i.hasClass("scrollable")||i.hasClass("ui-widget-overlay"))break;i=i.parent()}e||t.preventDefault()})},run:function(){try{this.initTouchMoveHandler()}catch(t){console.error(t,t.stack)}}},n(document).ready(function(){(new o).run()})},{jquery:69}],21:[function(t,e,i){var n=t("jquery"),o=function(t){this.$changelist=t};o.prototype={removeLabel:function(t){var e=t.find('[name="action"]').first();if(0!=e.length){var i=n(e[0].previousSibling);3==i.get(0).nodeType&&i.remove()}},wrapLabels:function(t){var e=n("<div>").addClass("labels");t.find("span.all, span.action-counter, span.clear, span.question").wrapAll(e)},moveActions:function(t){var e=this.$changelist.find(".paginator"),i=n("<div>").addClass("changelist-footer");i.insertAfter(e),t.detach(),e.detach(),i.append(t).append(e).append(n("<div>").addClass("cf"))},run:function(){var t=this.$changelist.find(".actions");try{this.removeLabel(t),this.wrapLabels(t),this.moveActions(t)}catch(e){console.error(e,e.stack)}t.addClass("initialized")}},n(document).ready(function(){n("#changelist").each(function(){new o(n(this)).run()})})},{jquery:69}],22:[function(t,e,i){var n=t("jquery"),o=function(t){this.$branding=t};o.prototype={move:function(t){t.detach().prependTo(n(".sidebar-wrapper")).css("height",t.outerHeight())},run:function(){var t=this.$branding;try{this.move(t)}catch(e){console.error(e,e.stack)}t.addClass("initialized")}},n(document).ready(function(){n("#branding").each(function(){new o(n(this)).run()}),0!=n("body.login").length&&n("<img>").attr("src","//jet.geex-arts.com/ping.gif")})},{jquery:69}],23:[function(t,e,i){var n=t("jquery"),o=function(t){this.$breadcrumbs=t};o.prototype={replaceSeparators:function(t){var e=t.html();e=e.replace(/›/g,'<span class="icon-arrow-right breadcrumbs-separator"></span>'),t.html(e)},scrollToEnd:function(t){t.scrollLeft(t[0].scrollWidth-t.width())},run:function(){var t=this.$breadcrumbs;try{this.replaceSeparators(t),this.scrollToEnd(t)}catch(e){console.error(e,e.stack)}t.addClass("initialized")}},n(document).ready(function(){var t=n(".breadcrumbs");0!=t.length&&t.each(function(){new o(n(this)).run()})})},{jquery:69}],24:[function(t,e,i){var n=t("jquery"),o=t("../utils/translate"),s=function(t){this.$changeform=t};s.prototype={findTabs:function(t,e){var i=[];return t.each(function(t){var e=n(this),s=e.find("> h2").first(),r=0!=s.length?s.html():o("General"),a="module_"+t;e.addClass(a),s.remove(),i.push({className:a,title:r})}),e.each(function(t){var e=n(this),s=e.find("> h2, > fieldset.module > h2, .tabular.inline-related > .module > h2").first(),r=0!=s.length?s.html():o("General"),a="inline_"+t;e.addClass(a),s.remove(),i.push({className:a,title:r})}),i},createTabs:function(t,e){if(!(e.length<2)){var i=n("<ul>").addClass("changeform-tabs");n.each(e,function(){var t=this,e=n("<li>").addClass("changeform-tabs-item"),o=n("<a>").addClass("changeform-tabs-item-link").html(t.title).attr("href","#/tab/"+t.className+"/");o.appendTo(e),e.appendTo(i)}),i.insertBefore(t.first())}},run:function(){var t=this.$changeform.find("#content-main > form > div"),e=t.find("> .module"),i=t.find("> .inline-group"),o=n().add(e).add(i);try{var s=this.findTabs(e,i);this.createTabs(o,s)}catch(r){console.error(r,r.stack)}o.addClass("initialized")}},n(document).ready(function(){n(".change-form").each(function(){new s(n(this)).run()})})},{"../utils/translate":37,jquery:69}],25:[function(t,e,i){var n=t("jquery"),o=function(){};o.prototype={run:function(){try{0!=n(".delete-confirmation-marker").length&&n("body").addClass("delete-confirmation")}catch(t){console.error(t,t.stack)}}},n(document).ready(function(){(new o).run()})},{jquery:69}],26:[function(t,e,i){var n=t("jquery"),o=function(){};o.prototype={updateBooleanIcons:function(){n('img[src$="admin/img/icon-yes.gif"]').add('img[src$="admin/img/icon-yes.svg"]').after(n('<span class="icon-tick">')),n('img[src$="admin/img/icon-no.gif"]').add('img[src$="admin/img/icon-no.svg"]').after(n('<span class="icon-cross">')),n('img[src$="admin/img/icon-unknown.gif"]').add('img[src$="admin/img/icon-unknown.svg"]').after(n('<span class="icon-question">'))},run:function(){try{this.updateBooleanIcons()}catch(t){console.error(t,t.stack)}}},n(document).ready(function(){(new o).run()})},{jquery:69}],27:[function(t,e,i){var n=t("jquery"),o=function(t){this.$objectTools=t};o.prototype={run:function(){this.$objectTools.addClass("initialized")}},n(document).ready(function(){n(".object-tools").each(function(){new o(n(this)).run()})})},{jquery:69}],28:[function(t,e,i){var n=t("jquery"),o=function(t){this.$paginator=t};o.prototype={removeSpacesBetweenPages:function(){this.$paginator.contents().each(function(){if(3==this.nodeType){var t=n(this);"A"!=t.prev().prop("tagName")&&"SPAN"!=t.prev().prop("tagName")||"A"!=t.next().prop("tagName")&&"SPAN"!=t.next().prop("tagName")||("..."==n.trim(t.text())?t.wrap(n("<span>").addClass("disabled")):""==n.trim(t.text())&&t.remove())}})},wrapPages:function(){var t=!1,e=!1,i=n([]);this.$paginator.contents().each(function(){var o=n(this),s="A"==this.tagName&&!o.hasClass("showall")||"SPAN"==this.tagName;s&&(t=!0),t&&(s&&!e?(o.detach(),i=i.add(o)):e=!0)}),this.$paginator.prepend(n("<span>").addClass("pages-wrapper").append(i))},wrapTextNodes:function(){var t=!1,e=n([]);this.$paginator.contents().each(function(){var i=n(this),o="A"==this.tagName&&!i.hasClass("showall")||"SPAN"==this.tagName;o?t=!0:t&&!o&&"INPUT"!=this.tagName&&(i.detach(),e=e.add(i))}),n("<div>").addClass("label").append(e).appendTo(this.$paginator)},run:function(){try{this.removeSpacesBetweenPages(),this.wrapPages(),this.wrapTextNodes()}catch(t){console.error(t,t.stack)}this.$paginator.addClass("initialized")}},n(document).ready(function(){n(".paginator").each(function(){new o(n(this)).run()})})},{jquery:69}],29:[function(t,e,i){var n=t("jquery"),o=function(){};o.prototype={replaceLinkIcon:function(t){var e=n(t);n("<span>").addClass("related-widget-wrapper-icon").insertAfter(e),e.remove()},updateLinkIcons:function(){this.replaceLinkIcon('img[src*="admin/img/icon-addlink"], img[src*="admin/img/icon_addlink"]'),this.replaceLinkIcon('img[src*="admin/img/icon-changelink"], img[src*="admin/img/icon_changelink"]'),this.replaceLinkIcon('img[src*="admin/img/icon-deletelink"], img[src*="admin/img/icon_deletelink"]'),n('img[src*="admin/img/selector-search"]').remove(),n(".add-related, .add-another, .change-related, .delete-related, .related-lookup").addClass("initialized")},run:function(){try{this.updateLinkIcons()}catch(t){console.error(t,t.stack)}}},n(document).ready(function(){(new o).run()})},{jquery:69}],30:[function(t,e,i){var n=t("jquery"),o=function(t){this.$inline=t};o.prototype={updateObjectLinks:function(){var t=this.$inline.find(".inline_label"),e=t.find("> .inlinechangelink");t.find("+ a").addClass("inlineviewlink").text(""),e.text("").detach().insertAfter(t)},run:function(){try{this.updateObjectLinks()}catch(t){console.error(t,t.stack)}this.$inline.addClass("initialized")}},n(document).ready(function(){n(".inline-related:not(.tabular)").each(function(){new o(n(this)).run()})})},{jquery:69}],31:[function(t,e,i){var n=t("jquery"),o=function(t){this.$inline=t};o.prototype={updateOriginalCell:function(){this.$inline.find("tr").each(function(){var t=n(this).find("td.original p");t.contents().each(function(){var t=n(this);return 3==t.get(0).nodeType?void t.remove():t.hasClass("inlinechangelink")?void 0:(t.addClass("inlineviewlink"),!1)}),t.find("a").text(""),0==t.children().length&&t.parent().addClass("empty")})},run:function(){try{this.updateOriginalCell()}catch(t){console.error(t,t.stack)}this.$inline.addClass("initialized")}},n(document).ready(function(){n(".inline-related.tabular").each(function(){new o(n(this)).run()})})},{jquery:69}],32:[function(t,e,i){var n=t("jquery"),o=function(t){this.$changelist=t};o.prototype={getToolbar:function(t){var e=t.find("#toolbar");return 0==e.length&&(e=n("<div>").attr("id","toolbar"),n("#changelist").prepend(e)),e},updateToolbar:function(t){var e=t.find('input[type="submit"]').val();t.find("#searchbar").attr("placeholder",e)},moveFilters:function(t,e){var i,o=e.find("#searchbar");t.find("#changelist-filter").children().each(function(){var t=n(this);if("H3"==t.prop("tagName"))i=t.text();else if("UL"==t.prop("tagName")){var s=n("<select>"),r=t.find("li");n.each(t.prop("attributes"),function(){s.attr(this.name,this.value)}),s.addClass("changelist-filter-select"),r.filter(".selected").length>1&&s.attr("multiple",!0),r.each(function(t){var e=n(this),o=e.find("a"),r=n("<option>").text(o.text()).attr("data-url",o.attr("href")).attr("selected",e.hasClass("selected"));if(0==t){null!=i&&r.text(i);var a=n("<option>").attr("disabled",!0).text("---");r=r.add(a)}s.append(r)});var a=n("<span>").addClass("changelist-filter-select-wrapper").append(s);o.length?a.insertAfter(o):e.append(a),i=null}else if(t.hasClass("changelist-filter-popup")){var l=t.find(".changelist-filter-popup-toggle"),c=t.find(".changelist-filter-popup-content"),a=n("<span>").addClass("changelist-filter-select-wrapper").append(t);o.length?a.insertAfter(o):e.append(a),l.on("click",function(t){t.preventDefault(),t.stopPropagation(),c.toggleClass("visible")}),c.on("click",function(t){t.stopPropagation()}),n(document.body).on("click",function(){c.removeClass("visible")})}}),t.find("#changelist-filter").remove()},fixFloatLineBreak:function(){n("#content-main").each(function(){var t=n(this);n.each(["#toolbar",".object-tools","changeform-navigation"],function(e,i){var o=t.find(i).first();if(0!=o.length)return n("<div>").addClass("clear").insertAfter(o),!1})})},run:function(){var t=this.getToolbar(this.$changelist);try{this.updateToolbar(t),this.moveFilters(this.$changelist,t)}catch(e){console.error(e,e.stack)}try{this.fixFloatLineBreak()}catch(e){console.error(e,e.stack)}t.addClass("initialized")}},n(document).ready(function(){n("#changelist").each(function(){new o(n(this)).run()})})},{jquery:69}],33:[function(t,e,i){var n=t("jquery");t("browsernizr/test/touchevents"),t("browsernizr");var o=function(t){this.$usertools=t};o.prototype={updateUserTools:function(t){var e=n("<ul>").addClass("sidebar-dependent"),i=t.find("strong").first().text();n("<li>").addClass("user-tools-welcome-msg").text(i).appendTo(e).on("click",function(){n(document.documentElement).hasClass("touchevents")&&e.toggleClass("opened")}),t.find("a").each(function(){var t=n(this);n("<li>").addClass("user-tools-link").html(t).appendTo(e)}),t.empty().addClass("user-tools").append(e),e.on("mouseenter",function(){e.addClass("opened")}).on("mouseleave",function(){e.removeClass("opened")})},run:function(){try{this.updateUserTools(this.$usertools)}catch(t){console.error(t,t.stack)}this.$usertools.addClass("initialized")}},n(document).ready(function(){n("#user-tools").each(function(){new o(n(this)).run()})})},{browsernizr:39,"browsernizr/test/touchevents":54,jquery:69}],34:[function(t,e,i){var n=window.jQuery=t("jquery");jet={jQuery:n},t("./layout-updaters/actions"),t("./layout-updaters/breadcrumbs"),t("./layout-updaters/paginator"),t("./layout-updaters/toolbar"),t("./layout-updaters/object-tools"),t("./layout-updaters/user-tools"),t("./layout-updaters/changeform-tabs"),t("./layout-updaters/tabular-inline"),t("./layout-updaters/stacked-inline"),t("./layout-updaters/related-widget-wrapper"),t("./layout-updaters/delete-confirmation"),t("./layout-updaters/branding"),t("./layout-updaters/icons"),t("./features/sidebar/main"),t("./features/filters"),t("./features/changeform-tabs"),t("./features/checkboxes"),t("./features/date-time-widgets"),t("./features/inlines"),t("./features/changelist"),t("./features/tooltips"),t("./features/dashboard"),t("./features/changeform"),t("./features/themes"),t("./features/siblings"),t("./features/selects"),t("./features/related-popups"),t("./features/scroll-to-bottom-detector"),t("./features/touchmove-non-scrollable")},{"./features/changeform":2,"./features/changeform-tabs":1,"./features/changelist":3,"./features/checkboxes":4,"./features/dashboard":6,"./features/date-time-widgets":7,"./features/filters":8,"./features/inlines":9,"./features/related-popups":10,"./features/scroll-to-bottom-detector":11,"./features/selects":12,"./features/siblings":13,"./features/sidebar/main":16,"./features/themes":18,"./features/tooltips":19,"./features/touchmove-non-scrollable":20,"./layout-updaters/actions":21,"./layout-updaters/branding":22,"./layout-updaters/breadcrumbs":23,"./layout-updaters/changeform-tabs":24,"./layout-updaters/delete-confirmation":25,"./layout-updaters/icons":26,"./layout-updaters/object-tools":27,"./layout-updaters/paginator":28,"./layout-updaters/related-widget-wrapper":29,"./layout-updaters/stacked-inline":30,"./layout-updaters/tabular-inline":31,"./layout-updaters/toolbar":32,"./layout-updaters/user-tools":33,jquery:69}],35:[function(t,e,i){var n=t("jquery");n.expr[":"].icontains=n.expr.createPseudo(function(t){return function(e){return n(e).text().toUpperCase().indexOf(t.toUpperCase())>=0}})},{jquery:69}],36:[function(t,e,i){var n=t("jquery");n.fn.slideFadeToggle=function(t,e,i){return this.animate({opacity:"toggle",height:"toggle"},t,e,i)}},{jquery:69}],37:[function(t,e,i){e.exports=function(t){return void 0==window.django?t:django.gettext(t)}},{}],38:[function(t,e,i){var n=t("jquery"),o=function(t){void 0==window.top[t]&&(window.top[t]=[]),this.name=t};o.prototype={push:function(t){t.top[this.name][t.top[this.name].length-1]!=t&&t.top[this.name].push(t)},pop:function(){window.top[this.name].pop()},previous:function(){return void 0==window.top[this.name]||!n.isArray(window.top[this.name])||window.top[this.name].length<2?null:window.top[this.name][window.top[this.name].length-2]}},e.exports=o},{jquery:69}],39:[function(t,e,i){var n=t("./lib/Modernizr"),o=t("./lib/ModernizrProto"),s=t("./lib/classes"),r=t("./lib/testRunner"),a=t("./lib/setClasses");r(),a(s),delete o.addTest,delete o.addAsyncTest;for(var l=0;l<n._q.length;l++)n._q[l]();e.exports=n},{"./lib/Modernizr":40,"./lib/ModernizrProto":41,"./lib/classes":42,"./lib/setClasses":50,"./lib/testRunner":51}],40:[function(t,e,i){var n=t("./ModernizrProto.js"),o=function(){};o.prototype=n,o=new o,e.exports=o},{"./ModernizrProto.js":41}],41:[function(t,e,i){var n=t("./tests.js"),o={_version:"3.3.1 (browsernizr 2.1.0)",_config:{classPrefix:"",enableClasses:!0,enableJSClass:!0,usePrefixes:!0},_q:[],on:function(t,e){var i=this;setTimeout(function(){e(i[t])},0)},addTest:function(t,e,i){n.push({name:t,fn:e,options:i})},addAsyncTest:function(t){n.push({name:null,fn:t})}};e.exports=o},{"./tests.js":53}],42:[function(t,e,i){var n=[];e.exports=n},{}],43:[function(t,e,i){function n(){return"function"!=typeof document.createElement?document.createElement(arguments[0]):o?document.createElementNS.call(document,"http://www.w3.org/2000/svg",arguments[0]):document.createElement.apply(document,arguments)}var o=t("./isSVG.js");e.exports=n},{"./isSVG.js":48}],44:[function(t,e,i){var n=document.documentElement;e.exports=n},{}],45:[function(t,e,i){function n(){var t=document.body;return t||(t=o(s?"svg":"body"),t.fake=!0),t}var o=t("./createElement.js"),s=t("./isSVG.js");e.exports=n},{"./createElement.js":43,"./isSVG.js":48}],46:[function(t,e,i){function n(t,e,i,n){var a,l,c,u,d="modernizr",h=s("div"),p=r();if(parseInt(i,10))for(;i--;)c=s("div"),c.id=n?n[i]:d+(i+1),h.appendChild(c);return a=s("style"),a.type="text/css",a.id="s"+d,(p.fake?p:h).appendChild(a),p.appendChild(h),a.styleSheet?a.styleSheet.cssText=t:a.appendChild(document.createTextNode(t)),h.id=d,p.fake&&(p.style.background="",p.style.overflow="hidden",u=o.style.overflow,o.style.overflow="hidden",o.appendChild(p)),l=e(h,t),p.fake?(p.parentNode.removeChild(p),o.style.overflow=u,o.offsetHeight):h.parentNode.removeChild(h),!!l}var o=(t("./ModernizrProto.js"),t("./docElement.js")),s=t("./createElement.js"),r=t("./getBody.js");e.exports=n},{"./ModernizrProto.js":41,"./createElement.js":43,"./docElement.js":44,"./getBody.js":45}],47:[function(t,e,i){function n(t,e){return typeof t===e}e.exports=n},{}],48:[function(t,e,i){var n=t("./docElement.js"),o="svg"===n.nodeName.toLowerCase();e.exports=o},{"./docElement.js":44}],49:[function(t,e,i){var n=t("./ModernizrProto.js"),o=n._config.usePrefixes?" -webkit- -moz- -o- -ms- ".split(" "):["",""];n._prefixes=o,e.exports=o},{"./ModernizrProto.js":41}],50:[function(t,e,i){function n(t){var e=s.className,i=o._config.classPrefix||"";if(r&&(e=e.baseVal),o._config.enableJSClass){var n=new RegExp("(^|\\s)"+i+"no-js(\\s|$)");e=e.replace(n,"$1"+i+"js$2")}o._config.enableClasses&&(e+=" "+i+t.join(" "+i),r?s.className.baseVal=e:s.className=e)}var o=t("./Modernizr.js"),s=t("./docElement.js"),r=t("./isSVG.js");e.exports=n},{"./Modernizr.js":40,"./docElement.js":44,"./isSVG.js":48}],51:[function(t,e,i){function n(){var t,e,i,n,l,c,u;for(var d in o)if(o.hasOwnProperty(d)){if(t=[],e=o[d],e.name&&(t.push(e.name.toLowerCase()),e.options&&e.options.aliases&&e.options.aliases.length))for(i=0;i<e.options.aliases.length;i++)t.push(e.options.aliases[i].toLowerCase());for(n=a(e.fn,"function")?e.fn():e.fn,l=0;l<t.length;l++)c=t[l],u=c.split("."),1===u.length?s[u[0]]=n:(!s[u[0]]||s[u[0]]instanceof Boolean||(s[u[0]]=new Boolean(s[u[0]])),s[u[0]][u[1]]=n),r.push((n?"":"no-")+u.join("-"))}}var o=t("./tests.js"),s=t("./Modernizr.js"),r=t("./classes.js"),a=t("./is.js");e.exports=n},{"./Modernizr.js":40,"./classes.js":42,"./is.js":47,"./tests.js":53}],52:[function(t,e,i){var n=t("./ModernizrProto.js"),o=t("./injectElementWithStyles.js"),s=n.testStyles=o;e.exports=s},{"./ModernizrProto.js":41,"./injectElementWithStyles.js":46}],53:[function(t,e,i){var n=[];e.exports=n},{}],54:[function(t,e,i){var n=t("./../lib/Modernizr.js"),o=t("./../lib/prefixes.js"),s=t("./../lib/testStyles.js");n.addTest("touchevents",function(){var t;if("ontouchstart"in window||window.DocumentTouch&&document instanceof DocumentTouch)t=!0;else{var e=["@media (",o.join("touch-enabled),("),"heartz",")","{#modernizr{top:9px;position:absolute}}"].join("");s(e,function(e){t=9===e.offsetTop})}return t})},{"./../lib/Modernizr.js":40,"./../lib/prefixes.js":49,"./../lib/testStyles.js":52}],55:[function(t,e,i){!function(t){"function"==typeof define&&define.amd?define(["jquery","./core","./widget"],t):t(jQuery)}(function(t){var e,i="ui-button ui-widget ui-state-default ui-corner-all",n="ui-button-icons-only ui-button-icon-only ui-button-text-icons ui-button-text-icon-primary ui-button-text-icon-secondary ui-button-text-only",o=function(){var e=t(this);setTimeout(function(){e.find(":ui-button").button("refresh")},1)},s=function(e){var i=e.name,n=e.form,o=t([]);return i&&(i=i.replace(/'/g,"\\'"),o=n?t(n).find("[name='"+i+"'][type=radio]"):t("[name='"+i+"'][type=radio]",e.ownerDocument).filter(function(){return!this.form})),o};return t.widget("ui.button",{version:"1.11.4",defaultElement:"<button>",options:{disabled:null,text:!0,label:null,icons:{primary:null,secondary:null}},_create:function(){this.element.closest("form").unbind("reset"+this.eventNamespace).bind("reset"+this.eventNamespace,o),"boolean"!=typeof this.options.disabled?this.options.disabled=!!this.element.prop("disabled"):this.element.prop("disabled",this.options.disabled),this._determineButtonType(),this.hasTitle=!!this.buttonElement.attr("title");var n=this,r=this.options,a="checkbox"===this.type||"radio"===this.type,l=a?"":"ui-state-active";null===r.label&&(r.label="input"===this.type?this.buttonElement.val():this.buttonElement.html()),this._hoverable(this.buttonElement),this.buttonElement.addClass(i).attr("role","button").bind("mouseenter"+this.eventNamespace,function(){r.disabled||this===e&&t(this).addClass("ui-state-active")}).bind("mouseleave"+this.eventNamespace,function(){r.disabled||t(this).removeClass(l)}).bind("click"+this.eventNamespace,function(t){r.disabled&&(t.preventDefault(),t.stopImmediatePropagation())}),this._on({focus:function(){this.buttonElement.addClass("ui-state-focus")},blur:function(){this.buttonElement.removeClass("ui-state-focus")}}),a&&this.element.bind("change"+this.eventNamespace,function(){n.refresh()}),"checkbox"===this.type?this.buttonElement.bind("click"+this.eventNamespace,function(){if(r.disabled)return!1}):"radio"===this.type?this.buttonElement.bind("click"+this.eventNamespace,function(){if(r.disabled)return!1;t(this).addClass("ui-state-active"),n.buttonElement.attr("aria-pressed","true");var e=n.element[0];s(e).not(e).map(function(){return t(this).button("widget")[0]}).removeClass("ui-state-active").attr("aria-pressed","false")}):(this.buttonElement.bind("mousedown"+this.eventNamespace,function(){return!r.disabled&&(t(this).addClass("ui-state-active"),e=this,void n.document.one("mouseup",function(){e=null}))}).bind("mouseup"+this.eventNamespace,function(){return!r.disabled&&void t(this).removeClass("ui-state-active")}).bind("keydown"+this.eventNamespace,function(e){return!r.disabled&&void(e.keyCode!==t.ui.keyCode.SPACE&&e.keyCode!==t.ui.keyCode.ENTER||t(this).addClass("ui-state-active"))}).bind("keyup"+this.eventNamespace+" blur"+this.eventNamespace,function(){t(this).removeClass("ui-state-active")}),this.buttonElement.is("a")&&this.buttonElement.keyup(function(e){e.keyCode===t.ui.keyCode.SPACE&&t(this).click()})),this._setOption("disabled",r.disabled),this._resetButton()},_determineButtonType:function(){var t,e,i;this.element.is("[type=checkbox]")?this.type="checkbox":this.element.is("[type=radio]")?this.type="radio":this.element.is("input")?this.type="input":this.type="button","checkbox"===this.type||"radio"===this.type?(t=this.element.parents().last(),e="label[for='"+this.element.attr("id")+"']",this.buttonElement=t.find(e),this.buttonElement.length||(t=t.length?t.siblings():this.element.siblings(),this.buttonElement=t.filter(e),this.buttonElement.length||(this.buttonElement=t.find(e))),this.element.addClass("ui-helper-hidden-accessible"),i=this.element.is(":checked"),i&&this.buttonElement.addClass("ui-state-active"),this.buttonElement.prop("aria-pressed",i)):this.buttonElement=this.element},widget:function(){return this.buttonElement},_destroy:function(){this.element.removeClass("ui-helper-hidden-accessible"),this.buttonElement.removeClass(i+" ui-state-active "+n).removeAttr("role").removeAttr("aria-pressed").html(this.buttonElement.find(".ui-button-text").html()),this.hasTitle||this.buttonElement.removeAttr("title")},_setOption:function(t,e){return this._super(t,e),"disabled"===t?(this.widget().toggleClass("ui-state-disabled",!!e),this.element.prop("disabled",!!e),void(e&&("checkbox"===this.type||"radio"===this.type?this.buttonElement.removeClass("ui-state-focus"):this.buttonElement.removeClass("ui-state-focus ui-state-active")))):void this._resetButton()},refresh:function(){var e=this.element.is("input, button")?this.element.is(":disabled"):this.element.hasClass("ui-button-disabled");e!==this.options.disabled&&this._setOption("disabled",e),"radio"===this.type?s(this.element[0]).each(function(){
 t(this).is(":checked")?t(this).button("widget").addClass("ui-state-active").attr("aria-pressed","true"):t(this).button("widget").removeClass("ui-state-active").attr("aria-pressed","false")}):"checkbox"===this.type&&(this.element.is(":checked")?this.buttonElement.addClass("ui-state-active").attr("aria-pressed","true"):this.buttonElement.removeClass("ui-state-active").attr("aria-pressed","false"))},_resetButton:function(){if("input"===this.type)return void(this.options.label&&this.element.val(this.options.label));var e=this.buttonElement.removeClass(n),i=t("<span></span>",this.document[0]).addClass("ui-button-text").html(this.options.label).appendTo(e.empty()).text(),o=this.options.icons,s=o.primary&&o.secondary,r=[];o.primary||o.secondary?(this.options.text&&r.push("ui-button-text-icon"+(s?"s":o.primary?"-primary":"-secondary")),o.primary&&e.prepend("<span class='ui-button-icon-primary ui-icon "+o.primary+"'></span>"),o.secondary&&e.append("<span class='ui-button-icon-secondary ui-icon "+o.secondary+"'></span>"),this.options.text||(r.push(s?"ui-button-icons-only":"ui-button-icon-only"),this.hasTitle||e.attr("title",t.trim(i)))):r.push("ui-button-text-only"),e.addClass(r.join(" "))}}),t.widget("ui.buttonset",{version:"1.11.4",options:{items:"button, input[type=button], input[type=submit], input[type=reset], input[type=checkbox], input[type=radio], a, :data(ui-button)"},_create:function(){this.element.addClass("ui-buttonset")},_init:function(){this.refresh()},_setOption:function(t,e){"disabled"===t&&this.buttons.button("option",t,e),this._super(t,e)},refresh:function(){var e="rtl"===this.element.css("direction"),i=this.element.find(this.options.items),n=i.filter(":ui-button");i.not(":ui-button").button(),n.button("refresh"),this.buttons=i.map(function(){return t(this).button("widget")[0]}).removeClass("ui-corner-all ui-corner-left ui-corner-right").filter(":first").addClass(e?"ui-corner-right":"ui-corner-left").end().filter(":last").addClass(e?"ui-corner-left":"ui-corner-right").end().end()},_destroy:function(){this.element.removeClass("ui-buttonset"),this.buttons.map(function(){return t(this).button("widget")[0]}).removeClass("ui-corner-left ui-corner-right").end().button("destroy")}}),t.ui.button})},{}],56:[function(t,e,i){!function(t){"function"==typeof define&&define.amd?define(["jquery"],t):t(jQuery)}(function(t){function e(e,n){var o,s,r,a=e.nodeName.toLowerCase();return"area"===a?(o=e.parentNode,s=o.name,!(!e.href||!s||"map"!==o.nodeName.toLowerCase())&&(r=t("img[usemap='#"+s+"']")[0],!!r&&i(r))):(/^(input|select|textarea|button|object)$/.test(a)?!e.disabled:"a"===a?e.href||n:n)&&i(e)}function i(e){return t.expr.filters.visible(e)&&!t(e).parents().addBack().filter(function(){return"hidden"===t.css(this,"visibility")}).length}t.ui=t.ui||{},t.extend(t.ui,{version:"1.11.4",keyCode:{BACKSPACE:8,COMMA:188,DELETE:46,DOWN:40,END:35,ENTER:13,ESCAPE:27,HOME:36,LEFT:37,PAGE_DOWN:34,PAGE_UP:33,PERIOD:190,RIGHT:39,SPACE:32,TAB:9,UP:38}}),t.fn.extend({scrollParent:function(e){var i=this.css("position"),n="absolute"===i,o=e?/(auto|scroll|hidden)/:/(auto|scroll)/,s=this.parents().filter(function(){var e=t(this);return(!n||"static"!==e.css("position"))&&o.test(e.css("overflow")+e.css("overflow-y")+e.css("overflow-x"))}).eq(0);return"fixed"!==i&&s.length?s:t(this[0].ownerDocument||document)},uniqueId:function(){var t=0;return function(){return this.each(function(){this.id||(this.id="ui-id-"+ ++t)})}}(),removeUniqueId:function(){return this.each(function(){/^ui-id-\d+$/.test(this.id)&&t(this).removeAttr("id")})}}),t.extend(t.expr[":"],{data:t.expr.createPseudo?t.expr.createPseudo(function(e){return function(i){return!!t.data(i,e)}}):function(e,i,n){return!!t.data(e,n[3])},focusable:function(i){return e(i,!isNaN(t.attr(i,"tabindex")))},tabbable:function(i){var n=t.attr(i,"tabindex"),o=isNaN(n);return(o||n>=0)&&e(i,!o)}}),t("<a>").outerWidth(1).jquery||t.each(["Width","Height"],function(e,i){function n(e,i,n,s){return t.each(o,function(){i-=parseFloat(t.css(e,"padding"+this))||0,n&&(i-=parseFloat(t.css(e,"border"+this+"Width"))||0),s&&(i-=parseFloat(t.css(e,"margin"+this))||0)}),i}var o="Width"===i?["Left","Right"]:["Top","Bottom"],s=i.toLowerCase(),r={innerWidth:t.fn.innerWidth,innerHeight:t.fn.innerHeight,outerWidth:t.fn.outerWidth,outerHeight:t.fn.outerHeight};t.fn["inner"+i]=function(e){return void 0===e?r["inner"+i].call(this):this.each(function(){t(this).css(s,n(this,e)+"px")})},t.fn["outer"+i]=function(e,o){return"number"!=typeof e?r["outer"+i].call(this,e):this.each(function(){t(this).css(s,n(this,e,!0,o)+"px")})}}),t.fn.addBack||(t.fn.addBack=function(t){return this.add(null==t?this.prevObject:this.prevObject.filter(t))}),t("<a>").data("a-b","a").removeData("a-b").data("a-b")&&(t.fn.removeData=function(e){return function(i){return arguments.length?e.call(this,t.camelCase(i)):e.call(this)}}(t.fn.removeData)),t.ui.ie=!!/msie [\w.]+/.exec(navigator.userAgent.toLowerCase()),t.fn.extend({focus:function(e){return function(i,n){return"number"==typeof i?this.each(function(){var e=this;setTimeout(function(){t(e).focus(),n&&n.call(e)},i)}):e.apply(this,arguments)}}(t.fn.focus),disableSelection:function(){var t="onselectstart"in document.createElement("div")?"selectstart":"mousedown";return function(){return this.bind(t+".ui-disableSelection",function(t){t.preventDefault()})}}(),enableSelection:function(){return this.unbind(".ui-disableSelection")},zIndex:function(e){if(void 0!==e)return this.css("zIndex",e);if(this.length)for(var i,n,o=t(this[0]);o.length&&o[0]!==document;){if(i=o.css("position"),("absolute"===i||"relative"===i||"fixed"===i)&&(n=parseInt(o.css("zIndex"),10),!isNaN(n)&&0!==n))return n;o=o.parent()}return 0}}),t.ui.plugin={add:function(e,i,n){var o,s=t.ui[e].prototype;for(o in n)s.plugins[o]=s.plugins[o]||[],s.plugins[o].push([i,n[o]])},call:function(t,e,i,n){var o,s=t.plugins[e];if(s&&(n||t.element[0].parentNode&&11!==t.element[0].parentNode.nodeType))for(o=0;o<s.length;o++)t.options[s[o][0]]&&s[o][1].apply(t.element,i)}}})},{}],57:[function(t,e,i){!function(t){"function"==typeof define&&define.amd?define(["jquery","./core"],t):t(jQuery)}(function(t){function e(t){for(var e,i;t.length&&t[0]!==document;){if(e=t.css("position"),("absolute"===e||"relative"===e||"fixed"===e)&&(i=parseInt(t.css("zIndex"),10),!isNaN(i)&&0!==i))return i;t=t.parent()}return 0}function i(){this._curInst=null,this._keyEvent=!1,this._disabledInputs=[],this._datepickerShowing=!1,this._inDialog=!1,this._mainDivId="ui-datepicker-div",this._inlineClass="ui-datepicker-inline",this._appendClass="ui-datepicker-append",this._triggerClass="ui-datepicker-trigger",this._dialogClass="ui-datepicker-dialog",this._disableClass="ui-datepicker-disabled",this._unselectableClass="ui-datepicker-unselectable",this._currentClass="ui-datepicker-current-day",this._dayOverClass="ui-datepicker-days-cell-over",this.regional=[],this.regional[""]={closeText:"Done",prevText:"Prev",nextText:"Next",currentText:"Today",monthNames:["January","February","March","April","May","June","July","August","September","October","November","December"],monthNamesShort:["Jan","Feb","Mar","Apr","May","Jun","Jul","Aug","Sep","Oct","Nov","Dec"],dayNames:["Sunday","Monday","Tuesday","Wednesday","Thursday","Friday","Saturday"],dayNamesShort:["Sun","Mon","Tue","Wed","Thu","Fri","Sat"],dayNamesMin:["Su","Mo","Tu","We","Th","Fr","Sa"],weekHeader:"Wk",dateFormat:"mm/dd/yy",firstDay:0,isRTL:!1,showMonthAfterYear:!1,yearSuffix:""},this._defaults={showOn:"focus",showAnim:"fadeIn",showOptions:{},defaultDate:null,appendText:"",buttonText:"...",buttonImage:"",buttonImageOnly:!1,hideIfNoPrevNext:!1,navigationAsDateFormat:!1,gotoCurrent:!1,changeMonth:!1,changeYear:!1,yearRange:"c-10:c+10",showOtherMonths:!1,selectOtherMonths:!1,showWeek:!1,calculateWeek:this.iso8601Week,shortYearCutoff:"+10",minDate:null,maxDate:null,duration:"fast",beforeShowDay:null,beforeShow:null,onSelect:null,onChangeMonthYear:null,onClose:null,numberOfMonths:1,showCurrentAtPos:0,stepMonths:1,stepBigMonths:12,altField:"",altFormat:"",constrainInput:!0,showButtonPanel:!1,autoSize:!1,disabled:!1},t.extend(this._defaults,this.regional[""]),this.regional.en=t.extend(!0,{},this.regional[""]),this.regional["en-US"]=t.extend(!0,{},this.regional.en),this.dpDiv=n(t("<div id='"+this._mainDivId+"' class='ui-datepicker ui-widget ui-widget-content ui-helper-clearfix ui-corner-all'></div>"))}function n(e){var i="button, .ui-datepicker-prev, .ui-datepicker-next, .ui-datepicker-calendar td a";return e.delegate(i,"mouseout",function(){t(this).removeClass("ui-state-hover"),this.className.indexOf("ui-datepicker-prev")!==-1&&t(this).removeClass("ui-datepicker-prev-hover"),this.className.indexOf("ui-datepicker-next")!==-1&&t(this).removeClass("ui-datepicker-next-hover")}).delegate(i,"mouseover",o)}function o(){t.datepicker._isDisabledDatepicker(r.inline?r.dpDiv.parent()[0]:r.input[0])||(t(this).parents(".ui-datepicker-calendar").find("a").removeClass("ui-state-hover"),t(this).addClass("ui-state-hover"),this.className.indexOf("ui-datepicker-prev")!==-1&&t(this).addClass("ui-datepicker-prev-hover"),this.className.indexOf("ui-datepicker-next")!==-1&&t(this).addClass("ui-datepicker-next-hover"))}function s(e,i){t.extend(e,i);for(var n in i)null==i[n]&&(e[n]=i[n]);return e}t.extend(t.ui,{datepicker:{version:"1.11.4"}});var r;return t.extend(i.prototype,{markerClassName:"hasDatepicker",maxRows:4,_widgetDatepicker:function(){return this.dpDiv},setDefaults:function(t){return s(this._defaults,t||{}),this},_attachDatepicker:function(e,i){var n,o,s;n=e.nodeName.toLowerCase(),o="div"===n||"span"===n,e.id||(this.uuid+=1,e.id="dp"+this.uuid),s=this._newInst(t(e),o),s.settings=t.extend({},i||{}),"input"===n?this._connectDatepicker(e,s):o&&this._inlineDatepicker(e,s)},_newInst:function(e,i){var o=e[0].id.replace(/([^A-Za-z0-9_\-])/g,"\\\\$1");return{id:o,input:e,selectedDay:0,selectedMonth:0,selectedYear:0,drawMonth:0,drawYear:0,inline:i,dpDiv:i?n(t("<div class='"+this._inlineClass+" ui-datepicker ui-widget ui-widget-content ui-helper-clearfix ui-corner-all'></div>")):this.dpDiv}},_connectDatepicker:function(e,i){var n=t(e);i.append=t([]),i.trigger=t([]),n.hasClass(this.markerClassName)||(this._attachments(n,i),n.addClass(this.markerClassName).keydown(this._doKeyDown).keypress(this._doKeyPress).keyup(this._doKeyUp),this._autoSize(i),t.data(e,"datepicker",i),i.settings.disabled&&this._disableDatepicker(e))},_attachments:function(e,i){var n,o,s,r=this._get(i,"appendText"),a=this._get(i,"isRTL");i.append&&i.append.remove(),r&&(i.append=t("<span class='"+this._appendClass+"'>"+r+"</span>"),e[a?"before":"after"](i.append)),e.unbind("focus",this._showDatepicker),i.trigger&&i.trigger.remove(),n=this._get(i,"showOn"),"focus"!==n&&"both"!==n||e.focus(this._showDatepicker),"button"!==n&&"both"!==n||(o=this._get(i,"buttonText"),s=this._get(i,"buttonImage"),i.trigger=t(this._get(i,"buttonImageOnly")?t("<img/>").addClass(this._triggerClass).attr({src:s,alt:o,title:o}):t("<button type='button'></button>").addClass(this._triggerClass).html(s?t("<img/>").attr({src:s,alt:o,title:o}):o)),e[a?"before":"after"](i.trigger),i.trigger.click(function(){return t.datepicker._datepickerShowing&&t.datepicker._lastInput===e[0]?t.datepicker._hideDatepicker():t.datepicker._datepickerShowing&&t.datepicker._lastInput!==e[0]?(t.datepicker._hideDatepicker(),t.datepicker._showDatepicker(e[0])):t.datepicker._showDatepicker(e[0]),!1}))},_autoSize:function(t){if(this._get(t,"autoSize")&&!t.inline){var e,i,n,o,s=new Date(2009,11,20),r=this._get(t,"dateFormat");r.match(/[DM]/)&&(e=function(t){for(i=0,n=0,o=0;o<t.length;o++)t[o].length>i&&(i=t[o].length,n=o);return n},s.setMonth(e(this._get(t,r.match(/MM/)?"monthNames":"monthNamesShort"))),s.setDate(e(this._get(t,r.match(/DD/)?"dayNames":"dayNamesShort"))+20-s.getDay())),t.input.attr("size",this._formatDate(t,s).length)}},_inlineDatepicker:function(e,i){var n=t(e);n.hasClass(this.markerClassName)||(n.addClass(this.markerClassName).append(i.dpDiv),t.data(e,"datepicker",i),this._setDate(i,this._getDefaultDate(i),!0),this._updateDatepicker(i),this._updateAlternate(i),i.settings.disabled&&this._disableDatepicker(e),i.dpDiv.css("display","block"))},_dialogDatepicker:function(e,i,n,o,r){var a,l,c,u,d,h=this._dialogInst;return h||(this.uuid+=1,a="dp"+this.uuid,this._dialogInput=t("<input type='text' id='"+a+"' style='position: absolute; top: -100px; width: 0px;'/>"),this._dialogInput.keydown(this._doKeyDown),t("body").append(this._dialogInput),h=this._dialogInst=this._newInst(this._dialogInput,!1),h.settings={},t.data(this._dialogInput[0],"datepicker",h)),s(h.settings,o||{}),i=i&&i.constructor===Date?this._formatDate(h,i):i,this._dialogInput.val(i),this._pos=r?r.length?r:[r.pageX,r.pageY]:null,this._pos||(l=document.documentElement.clientWidth,c=document.documentElement.clientHeight,u=document.documentElement.scrollLeft||document.body.scrollLeft,d=document.documentElement.scrollTop||document.body.scrollTop,this._pos=[l/2-100+u,c/2-150+d]),this._dialogInput.css("left",this._pos[0]+20+"px").css("top",this._pos[1]+"px"),h.settings.onSelect=n,this._inDialog=!0,this.dpDiv.addClass(this._dialogClass),this._showDatepicker(this._dialogInput[0]),t.blockUI&&t.blockUI(this.dpDiv),t.data(this._dialogInput[0],"datepicker",h),this},_destroyDatepicker:function(e){var i,n=t(e),o=t.data(e,"datepicker");n.hasClass(this.markerClassName)&&(i=e.nodeName.toLowerCase(),t.removeData(e,"datepicker"),"input"===i?(o.append.remove(),o.trigger.remove(),n.removeClass(this.markerClassName).unbind("focus",this._showDatepicker).unbind("keydown",this._doKeyDown).unbind("keypress",this._doKeyPress).unbind("keyup",this._doKeyUp)):"div"!==i&&"span"!==i||n.removeClass(this.markerClassName).empty(),r===o&&(r=null))},_enableDatepicker:function(e){var i,n,o=t(e),s=t.data(e,"datepicker");o.hasClass(this.markerClassName)&&(i=e.nodeName.toLowerCase(),"input"===i?(e.disabled=!1,s.trigger.filter("button").each(function(){this.disabled=!1}).end().filter("img").css({opacity:"1.0",cursor:""})):"div"!==i&&"span"!==i||(n=o.children("."+this._inlineClass),n.children().removeClass("ui-state-disabled"),n.find("select.ui-datepicker-month, select.ui-datepicker-year").prop("disabled",!1)),this._disabledInputs=t.map(this._disabledInputs,function(t){return t===e?null:t}))},_disableDatepicker:function(e){var i,n,o=t(e),s=t.data(e,"datepicker");o.hasClass(this.markerClassName)&&(i=e.nodeName.toLowerCase(),"input"===i?(e.disabled=!0,s.trigger.filter("button").each(function(){this.disabled=!0}).end().filter("img").css({opacity:"0.5",cursor:"default"})):"div"!==i&&"span"!==i||(n=o.children("."+this._inlineClass),n.children().addClass("ui-state-disabled"),n.find("select.ui-datepicker-month, select.ui-datepicker-year").prop("disabled",!0)),this._disabledInputs=t.map(this._disabledInputs,function(t){return t===e?null:t}),this._disabledInputs[this._disabledInputs.length]=e)},_isDisabledDatepicker:function(t){if(!t)return!1;for(var e=0;e<this._disabledInputs.length;e++)if(this._disabledInputs[e]===t)return!0;return!1},_getInst:function(e){try{return t.data(e,"datepicker")}catch(i){throw"Missing instance data for this datepicker"}},_optionDatepicker:function(e,i,n){var o,r,a,l,c=this._getInst(e);return 2===arguments.length&&"string"==typeof i?"defaults"===i?t.extend({},t.datepicker._defaults):c?"all"===i?t.extend({},c.settings):this._get(c,i):null:(o=i||{},"string"==typeof i&&(o={},o[i]=n),void(c&&(this._curInst===c&&this._hideDatepicker(),r=this._getDateDatepicker(e,!0),a=this._getMinMaxDate(c,"min"),l=this._getMinMaxDate(c,"max"),s(c.settings,o),null!==a&&void 0!==o.dateFormat&&void 0===o.minDate&&(c.settings.minDate=this._formatDate(c,a)),null!==l&&void 0!==o.dateFormat&&void 0===o.maxDate&&(c.settings.maxDate=this._formatDate(c,l)),"disabled"in o&&(o.disabled?this._disableDatepicker(e):this._enableDatepicker(e)),this._attachments(t(e),c),this._autoSize(c),this._setDate(c,r),this._updateAlternate(c),this._updateDatepicker(c))))},_changeDatepicker:function(t,e,i){this._optionDatepicker(t,e,i)},_refreshDatepicker:function(t){var e=this._getInst(t);e&&this._updateDatepicker(e)},_setDateDatepicker:function(t,e){var i=this._getInst(t);i&&(this._setDate(i,e),this._updateDatepicker(i),this._updateAlternate(i))},_getDateDatepicker:function(t,e){var i=this._getInst(t);return i&&!i.inline&&this._setDateFromField(i,e),i?this._getDate(i):null},_doKeyDown:function(e){var i,n,o,s=t.datepicker._getInst(e.target),r=!0,a=s.dpDiv.is(".ui-datepicker-rtl");if(s._keyEvent=!0,t.datepicker._datepickerShowing)switch(e.keyCode){case 9:t.datepicker._hideDatepicker(),r=!1;break;case 13:return o=t("td."+t.datepicker._dayOverClass+":not(."+t.datepicker._currentClass+")",s.dpDiv),o[0]&&t.datepicker._selectDay(e.target,s.selectedMonth,s.selectedYear,o[0]),i=t.datepicker._get(s,"onSelect"),i?(n=t.datepicker._formatDate(s),i.apply(s.input?s.input[0]:null,[n,s])):t.datepicker._hideDatepicker(),!1;case 27:t.datepicker._hideDatepicker();break;case 33:t.datepicker._adjustDate(e.target,e.ctrlKey?-t.datepicker._get(s,"stepBigMonths"):-t.datepicker._get(s,"stepMonths"),"M");break;case 34:t.datepicker._adjustDate(e.target,e.ctrlKey?+t.datepicker._get(s,"stepBigMonths"):+t.datepicker._get(s,"stepMonths"),"M");break;case 35:(e.ctrlKey||e.metaKey)&&t.datepicker._clearDate(e.target),r=e.ctrlKey||e.metaKey;break;case 36:(e.ctrlKey||e.metaKey)&&t.datepicker._gotoToday(e.target),r=e.ctrlKey||e.metaKey;break;case 37:(e.ctrlKey||e.metaKey)&&t.datepicker._adjustDate(e.target,a?1:-1,"D"),r=e.ctrlKey||e.metaKey,e.originalEvent.altKey&&t.datepicker._adjustDate(e.target,e.ctrlKey?-t.datepicker._get(s,"stepBigMonths"):-t.datepicker._get(s,"stepMonths"),"M");break;case 38:(e.ctrlKey||e.metaKey)&&t.datepicker._adjustDate(e.target,-7,"D"),r=e.ctrlKey||e.metaKey;break;case 39:(e.ctrlKey||e.metaKey)&&t.datepicker._adjustDate(e.target,a?-1:1,"D"),r=e.ctrlKey||e.metaKey,e.originalEvent.altKey&&t.datepicker._adjustDate(e.target,e.ctrlKey?+t.datepicker._get(s,"stepBigMonths"):+t.datepicker._get(s,"stepMonths"),"M");break;case 40:(e.ctrlKey||e.metaKey)&&t.datepicker._adjustDate(e.target,7,"D"),r=e.ctrlKey||e.metaKey;break;default:r=!1}else 36===e.keyCode&&e.ctrlKey?t.datepicker._showDatepicker(this):r=!1;r&&(e.preventDefault(),e.stopPropagation())},_doKeyPress:function(e){var i,n,o=t.datepicker._getInst(e.target);if(t.datepicker._get(o,"constrainInput"))return i=t.datepicker._possibleChars(t.datepicker._get(o,"dateFormat")),n=String.fromCharCode(null==e.charCode?e.keyCode:e.charCode),e.ctrlKey||e.metaKey||n<" "||!i||i.indexOf(n)>-1},_doKeyUp:function(e){var i,n=t.datepicker._getInst(e.target);if(n.input.val()!==n.lastVal)try{i=t.datepicker.parseDate(t.datepicker._get(n,"dateFormat"),n.input?n.input.val():null,t.datepicker._getFormatConfig(n)),i&&(t.datepicker._setDateFromField(n),t.datepicker._updateAlternate(n),t.datepicker._updateDatepicker(n))}catch(o){}return!0},_showDatepicker:function(i){if(i=i.target||i,"input"!==i.nodeName.toLowerCase()&&(i=t("input",i.parentNode)[0]),!t.datepicker._isDisabledDatepicker(i)&&t.datepicker._lastInput!==i){var n,o,r,a,l,c,u;n=t.datepicker._getInst(i),t.datepicker._curInst&&t.datepicker._curInst!==n&&(t.datepicker._curInst.dpDiv.stop(!0,!0),n&&t.datepicker._datepickerShowing&&t.datepicker._hideDatepicker(t.datepicker._curInst.input[0])),o=t.datepicker._get(n,"beforeShow"),r=o?o.apply(i,[i,n]):{},r!==!1&&(s(n.settings,r),n.lastVal=null,t.datepicker._lastInput=i,t.datepicker._setDateFromField(n),t.datepicker._inDialog&&(i.value=""),t.datepicker._pos||(t.datepicker._pos=t.datepicker._findPos(i),t.datepicker._pos[1]+=i.offsetHeight),a=!1,t(i).parents().each(function(){return a|="fixed"===t(this).css("position"),!a}),l={left:t.datepicker._pos[0],top:t.datepicker._pos[1]},t.datepicker._pos=null,n.dpDiv.empty(),n.dpDiv.css({position:"absolute",display:"block",top:"-1000px"}),t.datepicker._updateDatepicker(n),l=t.datepicker._checkOffset(n,l,a),n.dpDiv.css({position:t.datepicker._inDialog&&t.blockUI?"static":a?"fixed":"absolute",display:"none",left:l.left+"px",top:l.top+"px"}),n.inline||(c=t.datepicker._get(n,"showAnim"),u=t.datepicker._get(n,"duration"),n.dpDiv.css("z-index",e(t(i))+1),t.datepicker._datepickerShowing=!0,t.effects&&t.effects.effect[c]?n.dpDiv.show(c,t.datepicker._get(n,"showOptions"),u):n.dpDiv[c||"show"](c?u:null),t.datepicker._shouldFocusInput(n)&&n.input.focus(),t.datepicker._curInst=n))}},_updateDatepicker:function(e){this.maxRows=4,r=e,e.dpDiv.empty().append(this._generateHTML(e)),this._attachHandlers(e);var i,n=this._getNumberOfMonths(e),s=n[1],a=17,l=e.dpDiv.find("."+this._dayOverClass+" a");l.length>0&&o.apply(l.get(0)),e.dpDiv.removeClass("ui-datepicker-multi-2 ui-datepicker-multi-3 ui-datepicker-multi-4").width(""),s>1&&e.dpDiv.addClass("ui-datepicker-multi-"+s).css("width",a*s+"em"),e.dpDiv[(1!==n[0]||1!==n[1]?"add":"remove")+"Class"]("ui-datepicker-multi"),e.dpDiv[(this._get(e,"isRTL")?"add":"remove")+"Class"]("ui-datepicker-rtl"),e===t.datepicker._curInst&&t.datepicker._datepickerShowing&&t.datepicker._shouldFocusInput(e)&&e.input.focus(),e.yearshtml&&(i=e.yearshtml,setTimeout(function(){i===e.yearshtml&&e.yearshtml&&e.dpDiv.find("select.ui-datepicker-year:first").replaceWith(e.yearshtml),i=e.yearshtml=null},0))},_shouldFocusInput:function(t){return t.input&&t.input.is(":visible")&&!t.input.is(":disabled")&&!t.input.is(":focus")},_checkOffset:function(e,i,n){var o=e.dpDiv.outerWidth(),s=e.dpDiv.outerHeight(),r=e.input?e.input.outerWidth():0,a=e.input?e.input.outerHeight():0,l=document.documentElement.clientWidth+(n?0:t(document).scrollLeft()),c=document.documentElement.clientHeight+(n?0:t(document).scrollTop());return i.left-=this._get(e,"isRTL")?o-r:0,i.left-=n&&i.left===e.input.offset().left?t(document).scrollLeft():0,i.top-=n&&i.top===e.input.offset().top+a?t(document).scrollTop():0,i.left-=Math.min(i.left,i.left+o>l&&l>o?Math.abs(i.left+o-l):0),i.top-=Math.min(i.top,i.top+s>c&&c>s?Math.abs(s+a):0),i},_findPos:function(e){for(var i,n=this._getInst(e),o=this._get(n,"isRTL");e&&("hidden"===e.type||1!==e.nodeType||t.expr.filters.hidden(e));)e=e[o?"previousSibling":"nextSibling"];return i=t(e).offset(),[i.left,i.top]},_hideDatepicker:function(e){var i,n,o,s,r=this._curInst;!r||e&&r!==t.data(e,"datepicker")||this._datepickerShowing&&(i=this._get(r,"showAnim"),n=this._get(r,"duration"),o=function(){t.datepicker._tidyDialog(r)},t.effects&&(t.effects.effect[i]||t.effects[i])?r.dpDiv.hide(i,t.datepicker._get(r,"showOptions"),n,o):r.dpDiv["slideDown"===i?"slideUp":"fadeIn"===i?"fadeOut":"hide"](i?n:null,o),i||o(),this._datepickerShowing=!1,s=this._get(r,"onClose"),s&&s.apply(r.input?r.input[0]:null,[r.input?r.input.val():"",r]),this._lastInput=null,this._inDialog&&(this._dialogInput.css({position:"absolute",left:"0",top:"-100px"}),t.blockUI&&(t.unblockUI(),t("body").append(this.dpDiv))),this._inDialog=!1)},_tidyDialog:function(t){t.dpDiv.removeClass(this._dialogClass).unbind(".ui-datepicker-calendar")},_checkExternalClick:function(e){if(t.datepicker._curInst){var i=t(e.target),n=t.datepicker._getInst(i[0]);(i[0].id===t.datepicker._mainDivId||0!==i.parents("#"+t.datepicker._mainDivId).length||i.hasClass(t.datepicker.markerClassName)||i.closest("."+t.datepicker._triggerClass).length||!t.datepicker._datepickerShowing||t.datepicker._inDialog&&t.blockUI)&&(!i.hasClass(t.datepicker.markerClassName)||t.datepicker._curInst===n)||t.datepicker._hideDatepicker()}},_adjustDate:function(e,i,n){var o=t(e),s=this._getInst(o[0]);this._isDisabledDatepicker(o[0])||(this._adjustInstDate(s,i+("M"===n?this._get(s,"showCurrentAtPos"):0),n),this._updateDatepicker(s))},_gotoToday:function(e){var i,n=t(e),o=this._getInst(n[0]);this._get(o,"gotoCurrent")&&o.currentDay?(o.selectedDay=o.currentDay,o.drawMonth=o.selectedMonth=o.currentMonth,o.drawYear=o.selectedYear=o.currentYear):(i=new Date,o.selectedDay=i.getDate(),o.drawMonth=o.selectedMonth=i.getMonth(),o.drawYear=o.selectedYear=i.getFullYear()),this._notifyChange(o),this._adjustDate(n)},_selectMonthYear:function(e,i,n){var o=t(e),s=this._getInst(o[0]);s["selected"+("M"===n?"Month":"Year")]=s["draw"+("M"===n?"Month":"Year")]=parseInt(i.options[i.selectedIndex].value,10),this._notifyChange(s),this._adjustDate(o)},_selectDay:function(e,i,n,o){var s,r=t(e);t(o).hasClass(this._unselectableClass)||this._isDisabledDatepicker(r[0])||(s=this._getInst(r[0]),s.selectedDay=s.currentDay=t("a",o).html(),s.selectedMonth=s.currentMonth=i,s.selectedYear=s.currentYear=n,this._selectDate(e,this._formatDate(s,s.currentDay,s.currentMonth,s.currentYear)))},_clearDate:function(e){var i=t(e);this._selectDate(i,"")},_selectDate:function(e,i){var n,o=t(e),s=this._getInst(o[0]);i=null!=i?i:this._formatDate(s),s.input&&s.input.val(i),this._updateAlternate(s),n=this._get(s,"onSelect"),n?n.apply(s.input?s.input[0]:null,[i,s]):s.input&&s.input.trigger("change"),s.inline?this._updateDatepicker(s):(this._hideDatepicker(),this._lastInput=s.input[0],"object"!=typeof s.input[0]&&s.input.focus(),this._lastInput=null)},_updateAlternate:function(e){var i,n,o,s=this._get(e,"altField");s&&(i=this._get(e,"altFormat")||this._get(e,"dateFormat"),n=this._getDate(e),o=this.formatDate(i,n,this._getFormatConfig(e)),t(s).each(function(){t(this).val(o)}))},noWeekends:function(t){var e=t.getDay();return[e>0&&e<6,""]},iso8601Week:function(t){var e,i=new Date(t.getTime());return i.setDate(i.getDate()+4-(i.getDay()||7)),e=i.getTime(),i.setMonth(0),i.setDate(1),Math.floor(Math.round((e-i)/864e5)/7)+1},parseDate:function(e,i,n){if(null==e||null==i)throw"Invalid arguments";if(i="object"==typeof i?i.toString():i+"",""===i)return null;var o,s,r,a,l=0,c=(n?n.shortYearCutoff:null)||this._defaults.shortYearCutoff,u="string"!=typeof c?c:(new Date).getFullYear()%100+parseInt(c,10),d=(n?n.dayNamesShort:null)||this._defaults.dayNamesShort,h=(n?n.dayNames:null)||this._defaults.dayNames,p=(n?n.monthNamesShort:null)||this._defaults.monthNamesShort,f=(n?n.monthNames:null)||this._defaults.monthNames,g=-1,m=-1,v=-1,y=-1,b=!1,_=function(t){var i=o+1<e.length&&e.charAt(o+1)===t;return i&&o++,i},w=function(t){var e=_(t),n="@"===t?14:"!"===t?20:"y"===t&&e?4:"o"===t?3:2,o="y"===t?n:1,s=new RegExp("^\\d{"+o+","+n+"}"),r=i.substring(l).match(s);if(!r)throw"Missing number at position "+l;return l+=r[0].length,parseInt(r[0],10)},k=function(e,n,o){var s=-1,r=t.map(_(e)?o:n,function(t,e){return[[e,t]]}).sort(function(t,e){return-(t[1].length-e[1].length)});if(t.each(r,function(t,e){var n=e[1];if(i.substr(l,n.length).toLowerCase()===n.toLowerCase())return s=e[0],l+=n.length,!1}),s!==-1)return s+1;throw"Unknown name at position "+l},x=function(){if(i.charAt(l)!==e.charAt(o))throw"Unexpected literal at position "+l;l++};for(o=0;o<e.length;o++)if(b)"'"!==e.charAt(o)||_("'")?x():b=!1;else switch(e.charAt(o)){case"d":v=w("d");break;case"D":k("D",d,h);break;case"o":y=w("o");break;case"m":m=w("m");break;case"M":m=k("M",p,f);break;case"y":g=w("y");break;case"@":a=new Date(w("@")),g=a.getFullYear(),m=a.getMonth()+1,v=a.getDate();break;case"!":a=new Date((w("!")-this._ticksTo1970)/1e4),g=a.getFullYear(),m=a.getMonth()+1,v=a.getDate();break;case"'":_("'")?x():b=!0;break;default:x()}if(l<i.length&&(r=i.substr(l),!/^\s+/.test(r)))throw"Extra/unparsed characters found in date: "+r;if(g===-1?g=(new Date).getFullYear():g<100&&(g+=(new Date).getFullYear()-(new Date).getFullYear()%100+(g<=u?0:-100)),y>-1)for(m=1,v=y;;){if(s=this._getDaysInMonth(g,m-1),v<=s)break;m++,v-=s}if(a=this._daylightSavingAdjust(new Date(g,m-1,v)),a.getFullYear()!==g||a.getMonth()+1!==m||a.getDate()!==v)throw"Invalid date";return a},ATOM:"yy-mm-dd",COOKIE:"D, dd M yy",ISO_8601:"yy-mm-dd",RFC_822:"D, d M y",RFC_850:"DD, dd-M-y",RFC_1036:"D, d M y",RFC_1123:"D, d M yy",RFC_2822:"D, d M yy",RSS:"D, d M y",TICKS:"!",TIMESTAMP:"@",W3C:"yy-mm-dd",_ticksTo1970:24*(718685+Math.floor(492.5)-Math.floor(19.7)+Math.floor(4.925))*60*60*1e7,formatDate:function(t,e,i){if(!e)return"";var n,o=(i?i.dayNamesShort:null)||this._defaults.dayNamesShort,s=(i?i.dayNames:null)||this._defaults.dayNames,r=(i?i.monthNamesShort:null)||this._defaults.monthNamesShort,a=(i?i.monthNames:null)||this._defaults.monthNames,l=function(e){var i=n+1<t.length&&t.charAt(n+1)===e;return i&&n++,i},c=function(t,e,i){var n=""+e;if(l(t))for(;n.length<i;)n="0"+n;return n},u=function(t,e,i,n){return l(t)?n[e]:i[e]},d="",h=!1;if(e)for(n=0;n<t.length;n++)if(h)"'"!==t.charAt(n)||l("'")?d+=t.charAt(n):h=!1;else switch(t.charAt(n)){case"d":d+=c("d",e.getDate(),2);break;case"D":d+=u("D",e.getDay(),o,s);break;case"o":d+=c("o",Math.round((new Date(e.getFullYear(),e.getMonth(),e.getDate()).getTime()-new Date(e.getFullYear(),0,0).getTime())/864e5),3);break;case"m":d+=c("m",e.getMonth()+1,2);break;case"M":d+=u("M",e.getMonth(),r,a);break;case"y":d+=l("y")?e.getFullYear():(e.getYear()%100<10?"0":"")+e.getYear()%100;break;case"@":d+=e.getTime();break;case"!":d+=1e4*e.getTime()+this._ticksTo1970;break;case"'":l("'")?d+="'":h=!0;break;default:d+=t.charAt(n)}return d},_possibleChars:function(t){var e,i="",n=!1,o=function(i){var n=e+1<t.length&&t.charAt(e+1)===i;return n&&e++,n};for(e=0;e<t.length;e++)if(n)"'"!==t.charAt(e)||o("'")?i+=t.charAt(e):n=!1;else switch(t.charAt(e)){case"d":case"m":case"y":case"@":i+="0123456789";break;case"D":case"M":return null;case"'":o("'")?i+="'":n=!0;break;default:i+=t.charAt(e)}return i},_get:function(t,e){return void 0!==t.settings[e]?t.settings[e]:this._defaults[e]},_setDateFromField:function(t,e){if(t.input.val()!==t.lastVal){var i=this._get(t,"dateFormat"),n=t.lastVal=t.input?t.input.val():null,o=this._getDefaultDate(t),s=o,r=this._getFormatConfig(t);try{s=this.parseDate(i,n,r)||o}catch(a){n=e?"":n}t.selectedDay=s.getDate(),t.drawMonth=t.selectedMonth=s.getMonth(),t.drawYear=t.selectedYear=s.getFullYear(),t.currentDay=n?s.getDate():0,t.currentMonth=n?s.getMonth():0,t.currentYear=n?s.getFullYear():0,this._adjustInstDate(t)}},_getDefaultDate:function(t){return this._restrictMinMax(t,this._determineDate(t,this._get(t,"defaultDate"),new Date))},_determineDate:function(e,i,n){var o=function(t){var e=new Date;return e.setDate(e.getDate()+t),e},s=function(i){try{return t.datepicker.parseDate(t.datepicker._get(e,"dateFormat"),i,t.datepicker._getFormatConfig(e))}catch(n){}for(var o=(i.toLowerCase().match(/^c/)?t.datepicker._getDate(e):null)||new Date,s=o.getFullYear(),r=o.getMonth(),a=o.getDate(),l=/([+\-]?[0-9]+)\s*(d|D|w|W|m|M|y|Y)?/g,c=l.exec(i);c;){switch(c[2]||"d"){case"d":case"D":a+=parseInt(c[1],10);break;case"w":case"W":a+=7*parseInt(c[1],10);break;case"m":case"M":r+=parseInt(c[1],10),a=Math.min(a,t.datepicker._getDaysInMonth(s,r));break;case"y":case"Y":s+=parseInt(c[1],10),a=Math.min(a,t.datepicker._getDaysInMonth(s,r))}c=l.exec(i)}return new Date(s,r,a)},r=null==i||""===i?n:"string"==typeof i?s(i):"number"==typeof i?isNaN(i)?n:o(i):new Date(i.getTime());return r=r&&"Invalid Date"===r.toString()?n:r,r&&(r.setHours(0),r.setMinutes(0),r.setSeconds(0),r.setMilliseconds(0)),this._daylightSavingAdjust(r)},_daylightSavingAdjust:function(t){return t?(t.setHours(t.getHours()>12?t.getHours()+2:0),t):null},_setDate:function(t,e,i){var n=!e,o=t.selectedMonth,s=t.selectedYear,r=this._restrictMinMax(t,this._determineDate(t,e,new Date));t.selectedDay=t.currentDay=r.getDate(),t.drawMonth=t.selectedMonth=t.currentMonth=r.getMonth(),t.drawYear=t.selectedYear=t.currentYear=r.getFullYear(),o===t.selectedMonth&&s===t.selectedYear||i||this._notifyChange(t),this._adjustInstDate(t),t.input&&t.input.val(n?"":this._formatDate(t))},_getDate:function(t){var e=!t.currentYear||t.input&&""===t.input.val()?null:this._daylightSavingAdjust(new Date(t.currentYear,t.currentMonth,t.currentDay));return e},_attachHandlers:function(e){var i=this._get(e,"stepMonths"),n="#"+e.id.replace(/\\\\/g,"\\");e.dpDiv.find("[data-handler]").map(function(){var e={prev:function(){t.datepicker._adjustDate(n,-i,"M")},next:function(){t.datepicker._adjustDate(n,+i,"M")},hide:function(){t.datepicker._hideDatepicker();
 },today:function(){t.datepicker._gotoToday(n)},selectDay:function(){return t.datepicker._selectDay(n,+this.getAttribute("data-month"),+this.getAttribute("data-year"),this),!1},selectMonth:function(){return t.datepicker._selectMonthYear(n,this,"M"),!1},selectYear:function(){return t.datepicker._selectMonthYear(n,this,"Y"),!1}};t(this).bind(this.getAttribute("data-event"),e[this.getAttribute("data-handler")])})},_generateHTML:function(t){var e,i,n,o,s,r,a,l,c,u,d,h,p,f,g,m,v,y,b,_,w,k,x,C,D,T,S,I,P,j,N,A,$,E,M,H,L,z,O,q=new Date,R=this._daylightSavingAdjust(new Date(q.getFullYear(),q.getMonth(),q.getDate())),W=this._get(t,"isRTL"),F=this._get(t,"showButtonPanel"),Y=this._get(t,"hideIfNoPrevNext"),B=this._get(t,"navigationAsDateFormat"),X=this._getNumberOfMonths(t),U=this._get(t,"showCurrentAtPos"),K=this._get(t,"stepMonths"),V=1!==X[0]||1!==X[1],Q=this._daylightSavingAdjust(t.currentDay?new Date(t.currentYear,t.currentMonth,t.currentDay):new Date(9999,9,9)),G=this._getMinMaxDate(t,"min"),Z=this._getMinMaxDate(t,"max"),J=t.drawMonth-U,tt=t.drawYear;if(J<0&&(J+=12,tt--),Z)for(e=this._daylightSavingAdjust(new Date(Z.getFullYear(),Z.getMonth()-X[0]*X[1]+1,Z.getDate())),e=G&&e<G?G:e;this._daylightSavingAdjust(new Date(tt,J,1))>e;)J--,J<0&&(J=11,tt--);for(t.drawMonth=J,t.drawYear=tt,i=this._get(t,"prevText"),i=B?this.formatDate(i,this._daylightSavingAdjust(new Date(tt,J-K,1)),this._getFormatConfig(t)):i,n=this._canAdjustMonth(t,-1,tt,J)?"<a class='ui-datepicker-prev ui-corner-all' data-handler='prev' data-event='click' title='"+i+"'><span class='ui-icon ui-icon-circle-triangle-"+(W?"e":"w")+"'>"+i+"</span></a>":Y?"":"<a class='ui-datepicker-prev ui-corner-all ui-state-disabled' title='"+i+"'><span class='ui-icon ui-icon-circle-triangle-"+(W?"e":"w")+"'>"+i+"</span></a>",o=this._get(t,"nextText"),o=B?this.formatDate(o,this._daylightSavingAdjust(new Date(tt,J+K,1)),this._getFormatConfig(t)):o,s=this._canAdjustMonth(t,1,tt,J)?"<a class='ui-datepicker-next ui-corner-all' data-handler='next' data-event='click' title='"+o+"'><span class='ui-icon ui-icon-circle-triangle-"+(W?"w":"e")+"'>"+o+"</span></a>":Y?"":"<a class='ui-datepicker-next ui-corner-all ui-state-disabled' title='"+o+"'><span class='ui-icon ui-icon-circle-triangle-"+(W?"w":"e")+"'>"+o+"</span></a>",r=this._get(t,"currentText"),a=this._get(t,"gotoCurrent")&&t.currentDay?Q:R,r=B?this.formatDate(r,a,this._getFormatConfig(t)):r,l=t.inline?"":"<button type='button' class='ui-datepicker-close ui-state-default ui-priority-primary ui-corner-all' data-handler='hide' data-event='click'>"+this._get(t,"closeText")+"</button>",c=F?"<div class='ui-datepicker-buttonpane ui-widget-content'>"+(W?l:"")+(this._isInRange(t,a)?"<button type='button' class='ui-datepicker-current ui-state-default ui-priority-secondary ui-corner-all' data-handler='today' data-event='click'>"+r+"</button>":"")+(W?"":l)+"</div>":"",u=parseInt(this._get(t,"firstDay"),10),u=isNaN(u)?0:u,d=this._get(t,"showWeek"),h=this._get(t,"dayNames"),p=this._get(t,"dayNamesMin"),f=this._get(t,"monthNames"),g=this._get(t,"monthNamesShort"),m=this._get(t,"beforeShowDay"),v=this._get(t,"showOtherMonths"),y=this._get(t,"selectOtherMonths"),b=this._getDefaultDate(t),_="",k=0;k<X[0];k++){for(x="",this.maxRows=4,C=0;C<X[1];C++){if(D=this._daylightSavingAdjust(new Date(tt,J,t.selectedDay)),T=" ui-corner-all",S="",V){if(S+="<div class='ui-datepicker-group",X[1]>1)switch(C){case 0:S+=" ui-datepicker-group-first",T=" ui-corner-"+(W?"right":"left");break;case X[1]-1:S+=" ui-datepicker-group-last",T=" ui-corner-"+(W?"left":"right");break;default:S+=" ui-datepicker-group-middle",T=""}S+="'>"}for(S+="<div class='ui-datepicker-header ui-widget-header ui-helper-clearfix"+T+"'>"+(/all|left/.test(T)&&0===k?W?s:n:"")+(/all|right/.test(T)&&0===k?W?n:s:"")+this._generateMonthYearHeader(t,J,tt,G,Z,k>0||C>0,f,g)+"</div><table class='ui-datepicker-calendar'><thead><tr>",I=d?"<th class='ui-datepicker-week-col'>"+this._get(t,"weekHeader")+"</th>":"",w=0;w<7;w++)P=(w+u)%7,I+="<th scope='col'"+((w+u+6)%7>=5?" class='ui-datepicker-week-end'":"")+"><span title='"+h[P]+"'>"+p[P]+"</span></th>";for(S+=I+"</tr></thead><tbody>",j=this._getDaysInMonth(tt,J),tt===t.selectedYear&&J===t.selectedMonth&&(t.selectedDay=Math.min(t.selectedDay,j)),N=(this._getFirstDayOfMonth(tt,J)-u+7)%7,A=Math.ceil((N+j)/7),$=V&&this.maxRows>A?this.maxRows:A,this.maxRows=$,E=this._daylightSavingAdjust(new Date(tt,J,1-N)),M=0;M<$;M++){for(S+="<tr>",H=d?"<td class='ui-datepicker-week-col'>"+this._get(t,"calculateWeek")(E)+"</td>":"",w=0;w<7;w++)L=m?m.apply(t.input?t.input[0]:null,[E]):[!0,""],z=E.getMonth()!==J,O=z&&!y||!L[0]||G&&E<G||Z&&E>Z,H+="<td class='"+((w+u+6)%7>=5?" ui-datepicker-week-end":"")+(z?" ui-datepicker-other-month":"")+(E.getTime()===D.getTime()&&J===t.selectedMonth&&t._keyEvent||b.getTime()===E.getTime()&&b.getTime()===D.getTime()?" "+this._dayOverClass:"")+(O?" "+this._unselectableClass+" ui-state-disabled":"")+(z&&!v?"":" "+L[1]+(E.getTime()===Q.getTime()?" "+this._currentClass:"")+(E.getTime()===R.getTime()?" ui-datepicker-today":""))+"'"+(z&&!v||!L[2]?"":" title='"+L[2].replace(/'/g,"&#39;")+"'")+(O?"":" data-handler='selectDay' data-event='click' data-month='"+E.getMonth()+"' data-year='"+E.getFullYear()+"'")+">"+(z&&!v?"&#xa0;":O?"<span class='ui-state-default'>"+E.getDate()+"</span>":"<a class='ui-state-default"+(E.getTime()===R.getTime()?" ui-state-highlight":"")+(E.getTime()===Q.getTime()?" ui-state-active":"")+(z?" ui-priority-secondary":"")+"' href='#'>"+E.getDate()+"</a>")+"</td>",E.setDate(E.getDate()+1),E=this._daylightSavingAdjust(E);S+=H+"</tr>"}J++,J>11&&(J=0,tt++),S+="</tbody></table>"+(V?"</div>"+(X[0]>0&&C===X[1]-1?"<div class='ui-datepicker-row-break'></div>":""):""),x+=S}_+=x}return _+=c,t._keyEvent=!1,_},_generateMonthYearHeader:function(t,e,i,n,o,s,r,a){var l,c,u,d,h,p,f,g,m=this._get(t,"changeMonth"),v=this._get(t,"changeYear"),y=this._get(t,"showMonthAfterYear"),b="<div class='ui-datepicker-title'>",_="";if(s||!m)_+="<span class='ui-datepicker-month'>"+r[e]+"</span>";else{for(l=n&&n.getFullYear()===i,c=o&&o.getFullYear()===i,_+="<select class='ui-datepicker-month' data-handler='selectMonth' data-event='change'>",u=0;u<12;u++)(!l||u>=n.getMonth())&&(!c||u<=o.getMonth())&&(_+="<option value='"+u+"'"+(u===e?" selected='selected'":"")+">"+a[u]+"</option>");_+="</select>"}if(y||(b+=_+(!s&&m&&v?"":"&#xa0;")),!t.yearshtml)if(t.yearshtml="",s||!v)b+="<span class='ui-datepicker-year'>"+i+"</span>";else{for(d=this._get(t,"yearRange").split(":"),h=(new Date).getFullYear(),p=function(t){var e=t.match(/c[+\-].*/)?i+parseInt(t.substring(1),10):t.match(/[+\-].*/)?h+parseInt(t,10):parseInt(t,10);return isNaN(e)?h:e},f=p(d[0]),g=Math.max(f,p(d[1]||"")),f=n?Math.max(f,n.getFullYear()):f,g=o?Math.min(g,o.getFullYear()):g,t.yearshtml+="<select class='ui-datepicker-year' data-handler='selectYear' data-event='change'>";f<=g;f++)t.yearshtml+="<option value='"+f+"'"+(f===i?" selected='selected'":"")+">"+f+"</option>";t.yearshtml+="</select>",b+=t.yearshtml,t.yearshtml=null}return b+=this._get(t,"yearSuffix"),y&&(b+=(!s&&m&&v?"":"&#xa0;")+_),b+="</div>"},_adjustInstDate:function(t,e,i){var n=t.drawYear+("Y"===i?e:0),o=t.drawMonth+("M"===i?e:0),s=Math.min(t.selectedDay,this._getDaysInMonth(n,o))+("D"===i?e:0),r=this._restrictMinMax(t,this._daylightSavingAdjust(new Date(n,o,s)));t.selectedDay=r.getDate(),t.drawMonth=t.selectedMonth=r.getMonth(),t.drawYear=t.selectedYear=r.getFullYear(),"M"!==i&&"Y"!==i||this._notifyChange(t)},_restrictMinMax:function(t,e){var i=this._getMinMaxDate(t,"min"),n=this._getMinMaxDate(t,"max"),o=i&&e<i?i:e;return n&&o>n?n:o},_notifyChange:function(t){var e=this._get(t,"onChangeMonthYear");e&&e.apply(t.input?t.input[0]:null,[t.selectedYear,t.selectedMonth+1,t])},_getNumberOfMonths:function(t){var e=this._get(t,"numberOfMonths");return null==e?[1,1]:"number"==typeof e?[1,e]:e},_getMinMaxDate:function(t,e){return this._determineDate(t,this._get(t,e+"Date"),null)},_getDaysInMonth:function(t,e){return 32-this._daylightSavingAdjust(new Date(t,e,32)).getDate()},_getFirstDayOfMonth:function(t,e){return new Date(t,e,1).getDay()},_canAdjustMonth:function(t,e,i,n){var o=this._getNumberOfMonths(t),s=this._daylightSavingAdjust(new Date(i,n+(e<0?e:o[0]*o[1]),1));return e<0&&s.setDate(this._getDaysInMonth(s.getFullYear(),s.getMonth())),this._isInRange(t,s)},_isInRange:function(t,e){var i,n,o=this._getMinMaxDate(t,"min"),s=this._getMinMaxDate(t,"max"),r=null,a=null,l=this._get(t,"yearRange");return l&&(i=l.split(":"),n=(new Date).getFullYear(),r=parseInt(i[0],10),a=parseInt(i[1],10),i[0].match(/[+\-].*/)&&(r+=n),i[1].match(/[+\-].*/)&&(a+=n)),(!o||e.getTime()>=o.getTime())&&(!s||e.getTime()<=s.getTime())&&(!r||e.getFullYear()>=r)&&(!a||e.getFullYear()<=a)},_getFormatConfig:function(t){var e=this._get(t,"shortYearCutoff");return e="string"!=typeof e?e:(new Date).getFullYear()%100+parseInt(e,10),{shortYearCutoff:e,dayNamesShort:this._get(t,"dayNamesShort"),dayNames:this._get(t,"dayNames"),monthNamesShort:this._get(t,"monthNamesShort"),monthNames:this._get(t,"monthNames")}},_formatDate:function(t,e,i,n){e||(t.currentDay=t.selectedDay,t.currentMonth=t.selectedMonth,t.currentYear=t.selectedYear);var o=e?"object"==typeof e?e:this._daylightSavingAdjust(new Date(n,i,e)):this._daylightSavingAdjust(new Date(t.currentYear,t.currentMonth,t.currentDay));return this.formatDate(this._get(t,"dateFormat"),o,this._getFormatConfig(t))}}),t.fn.datepicker=function(e){if(!this.length)return this;t.datepicker.initialized||(t(document).mousedown(t.datepicker._checkExternalClick),t.datepicker.initialized=!0),0===t("#"+t.datepicker._mainDivId).length&&t("body").append(t.datepicker.dpDiv);var i=Array.prototype.slice.call(arguments,1);return"string"!=typeof e||"isDisabled"!==e&&"getDate"!==e&&"widget"!==e?"option"===e&&2===arguments.length&&"string"==typeof arguments[1]?t.datepicker["_"+e+"Datepicker"].apply(t.datepicker,[this[0]].concat(i)):this.each(function(){"string"==typeof e?t.datepicker["_"+e+"Datepicker"].apply(t.datepicker,[this].concat(i)):t.datepicker._attachDatepicker(this,e)}):t.datepicker["_"+e+"Datepicker"].apply(t.datepicker,[this[0]].concat(i))},t.datepicker=new i,t.datepicker.initialized=!1,t.datepicker.uuid=(new Date).getTime(),t.datepicker.version="1.11.4",t.datepicker})},{}],58:[function(t,e,i){!function(t){"function"==typeof define&&define.amd?define(["jquery","./core","./widget","./button","./draggable","./mouse","./position","./resizable"],t):t(jQuery)}(function(t){return t.widget("ui.dialog",{version:"1.11.4",options:{appendTo:"body",autoOpen:!0,buttons:[],closeOnEscape:!0,closeText:"Close",dialogClass:"",draggable:!0,hide:null,height:"auto",maxHeight:null,maxWidth:null,minHeight:150,minWidth:150,modal:!1,position:{my:"center",at:"center",of:window,collision:"fit",using:function(e){var i=t(this).css(e).offset().top;i<0&&t(this).css("top",e.top-i)}},resizable:!0,show:null,title:null,width:300,beforeClose:null,close:null,drag:null,dragStart:null,dragStop:null,focus:null,open:null,resize:null,resizeStart:null,resizeStop:null},sizeRelatedOptions:{buttons:!0,height:!0,maxHeight:!0,maxWidth:!0,minHeight:!0,minWidth:!0,width:!0},resizableRelatedOptions:{maxHeight:!0,maxWidth:!0,minHeight:!0,minWidth:!0},_create:function(){this.originalCss={display:this.element[0].style.display,width:this.element[0].style.width,minHeight:this.element[0].style.minHeight,maxHeight:this.element[0].style.maxHeight,height:this.element[0].style.height},this.originalPosition={parent:this.element.parent(),index:this.element.parent().children().index(this.element)},this.originalTitle=this.element.attr("title"),this.options.title=this.options.title||this.originalTitle,this._createWrapper(),this.element.show().removeAttr("title").addClass("ui-dialog-content ui-widget-content").appendTo(this.uiDialog),this._createTitlebar(),this._createButtonPane(),this.options.draggable&&t.fn.draggable&&this._makeDraggable(),this.options.resizable&&t.fn.resizable&&this._makeResizable(),this._isOpen=!1,this._trackFocus()},_init:function(){this.options.autoOpen&&this.open()},_appendTo:function(){var e=this.options.appendTo;return e&&(e.jquery||e.nodeType)?t(e):this.document.find(e||"body").eq(0)},_destroy:function(){var t,e=this.originalPosition;this._untrackInstance(),this._destroyOverlay(),this.element.removeUniqueId().removeClass("ui-dialog-content ui-widget-content").css(this.originalCss).detach(),this.uiDialog.stop(!0,!0).remove(),this.originalTitle&&this.element.attr("title",this.originalTitle),t=e.parent.children().eq(e.index),t.length&&t[0]!==this.element[0]?t.before(this.element):e.parent.append(this.element)},widget:function(){return this.uiDialog},disable:t.noop,enable:t.noop,close:function(e){var i,n=this;if(this._isOpen&&this._trigger("beforeClose",e)!==!1){if(this._isOpen=!1,this._focusedElement=null,this._destroyOverlay(),this._untrackInstance(),!this.opener.filter(":focusable").focus().length)try{i=this.document[0].activeElement,i&&"body"!==i.nodeName.toLowerCase()&&t(i).blur()}catch(o){}this._hide(this.uiDialog,this.options.hide,function(){n._trigger("close",e)})}},isOpen:function(){return this._isOpen},moveToTop:function(){this._moveToTop()},_moveToTop:function(e,i){var n=!1,o=this.uiDialog.siblings(".ui-front:visible").map(function(){return+t(this).css("z-index")}).get(),s=Math.max.apply(null,o);return s>=+this.uiDialog.css("z-index")&&(this.uiDialog.css("z-index",s+1),n=!0),n&&!i&&this._trigger("focus",e),n},open:function(){var e=this;return this._isOpen?void(this._moveToTop()&&this._focusTabbable()):(this._isOpen=!0,this.opener=t(this.document[0].activeElement),this._size(),this._position(),this._createOverlay(),this._moveToTop(null,!0),this.overlay&&this.overlay.css("z-index",this.uiDialog.css("z-index")-1),this._show(this.uiDialog,this.options.show,function(){e._focusTabbable(),e._trigger("focus")}),this._makeFocusTarget(),void this._trigger("open"))},_focusTabbable:function(){var t=this._focusedElement;t||(t=this.element.find("[autofocus]")),t.length||(t=this.element.find(":tabbable")),t.length||(t=this.uiDialogButtonPane.find(":tabbable")),t.length||(t=this.uiDialogTitlebarClose.filter(":tabbable")),t.length||(t=this.uiDialog),t.eq(0).focus()},_keepFocus:function(e){function i(){var e=this.document[0].activeElement,i=this.uiDialog[0]===e||t.contains(this.uiDialog[0],e);i||this._focusTabbable()}e.preventDefault(),i.call(this),this._delay(i)},_createWrapper:function(){this.uiDialog=t("<div>").addClass("ui-dialog ui-widget ui-widget-content ui-corner-all ui-front "+this.options.dialogClass).hide().attr({tabIndex:-1,role:"dialog"}).appendTo(this._appendTo()),this._on(this.uiDialog,{keydown:function(e){if(this.options.closeOnEscape&&!e.isDefaultPrevented()&&e.keyCode&&e.keyCode===t.ui.keyCode.ESCAPE)return e.preventDefault(),void this.close(e);if(e.keyCode===t.ui.keyCode.TAB&&!e.isDefaultPrevented()){var i=this.uiDialog.find(":tabbable"),n=i.filter(":first"),o=i.filter(":last");e.target!==o[0]&&e.target!==this.uiDialog[0]||e.shiftKey?e.target!==n[0]&&e.target!==this.uiDialog[0]||!e.shiftKey||(this._delay(function(){o.focus()}),e.preventDefault()):(this._delay(function(){n.focus()}),e.preventDefault())}},mousedown:function(t){this._moveToTop(t)&&this._focusTabbable()}}),this.element.find("[aria-describedby]").length||this.uiDialog.attr({"aria-describedby":this.element.uniqueId().attr("id")})},_createTitlebar:function(){var e;this.uiDialogTitlebar=t("<div>").addClass("ui-dialog-titlebar ui-widget-header ui-corner-all ui-helper-clearfix").prependTo(this.uiDialog),this._on(this.uiDialogTitlebar,{mousedown:function(e){t(e.target).closest(".ui-dialog-titlebar-close")||this.uiDialog.focus()}}),this.uiDialogTitlebarClose=t("<button type='button'></button>").button({label:this.options.closeText,icons:{primary:"ui-icon-closethick"},text:!1}).addClass("ui-dialog-titlebar-close").appendTo(this.uiDialogTitlebar),this._on(this.uiDialogTitlebarClose,{click:function(t){t.preventDefault(),this.close(t)}}),e=t("<span>").uniqueId().addClass("ui-dialog-title").prependTo(this.uiDialogTitlebar),this._title(e),this.uiDialog.attr({"aria-labelledby":e.attr("id")})},_title:function(t){this.options.title||t.html("&#160;"),t.text(this.options.title)},_createButtonPane:function(){this.uiDialogButtonPane=t("<div>").addClass("ui-dialog-buttonpane ui-widget-content ui-helper-clearfix"),this.uiButtonSet=t("<div>").addClass("ui-dialog-buttonset").appendTo(this.uiDialogButtonPane),this._createButtons()},_createButtons:function(){var e=this,i=this.options.buttons;return this.uiDialogButtonPane.remove(),this.uiButtonSet.empty(),t.isEmptyObject(i)||t.isArray(i)&&!i.length?void this.uiDialog.removeClass("ui-dialog-buttons"):(t.each(i,function(i,n){var o,s;n=t.isFunction(n)?{click:n,text:i}:n,n=t.extend({type:"button"},n),o=n.click,n.click=function(){o.apply(e.element[0],arguments)},s={icons:n.icons,text:n.showText},delete n.icons,delete n.showText,t("<button></button>",n).button(s).appendTo(e.uiButtonSet)}),this.uiDialog.addClass("ui-dialog-buttons"),void this.uiDialogButtonPane.appendTo(this.uiDialog))},_makeDraggable:function(){function e(t){return{position:t.position,offset:t.offset}}var i=this,n=this.options;this.uiDialog.draggable({cancel:".ui-dialog-content, .ui-dialog-titlebar-close",handle:".ui-dialog-titlebar",containment:"document",start:function(n,o){t(this).addClass("ui-dialog-dragging"),i._blockFrames(),i._trigger("dragStart",n,e(o))},drag:function(t,n){i._trigger("drag",t,e(n))},stop:function(o,s){var r=s.offset.left-i.document.scrollLeft(),a=s.offset.top-i.document.scrollTop();n.position={my:"left top",at:"left"+(r>=0?"+":"")+r+" top"+(a>=0?"+":"")+a,of:i.window},t(this).removeClass("ui-dialog-dragging"),i._unblockFrames(),i._trigger("dragStop",o,e(s))}})},_makeResizable:function(){function e(t){return{originalPosition:t.originalPosition,originalSize:t.originalSize,position:t.position,size:t.size}}var i=this,n=this.options,o=n.resizable,s=this.uiDialog.css("position"),r="string"==typeof o?o:"n,e,s,w,se,sw,ne,nw";this.uiDialog.resizable({cancel:".ui-dialog-content",containment:"document",alsoResize:this.element,maxWidth:n.maxWidth,maxHeight:n.maxHeight,minWidth:n.minWidth,minHeight:this._minHeight(),handles:r,start:function(n,o){t(this).addClass("ui-dialog-resizing"),i._blockFrames(),i._trigger("resizeStart",n,e(o))},resize:function(t,n){i._trigger("resize",t,e(n))},stop:function(o,s){var r=i.uiDialog.offset(),a=r.left-i.document.scrollLeft(),l=r.top-i.document.scrollTop();n.height=i.uiDialog.height(),n.width=i.uiDialog.width(),n.position={my:"left top",at:"left"+(a>=0?"+":"")+a+" top"+(l>=0?"+":"")+l,of:i.window},t(this).removeClass("ui-dialog-resizing"),i._unblockFrames(),i._trigger("resizeStop",o,e(s))}}).css("position",s)},_trackFocus:function(){this._on(this.widget(),{focusin:function(e){this._makeFocusTarget(),this._focusedElement=t(e.target)}})},_makeFocusTarget:function(){this._untrackInstance(),this._trackingInstances().unshift(this)},_untrackInstance:function(){var e=this._trackingInstances(),i=t.inArray(this,e);i!==-1&&e.splice(i,1)},_trackingInstances:function(){var t=this.document.data("ui-dialog-instances");return t||(t=[],this.document.data("ui-dialog-instances",t)),t},_minHeight:function(){var t=this.options;return"auto"===t.height?t.minHeight:Math.min(t.minHeight,t.height)},_position:function(){var t=this.uiDialog.is(":visible");t||this.uiDialog.show(),this.uiDialog.position(this.options.position),t||this.uiDialog.hide()},_setOptions:function(e){var i=this,n=!1,o={};t.each(e,function(t,e){i._setOption(t,e),t in i.sizeRelatedOptions&&(n=!0),t in i.resizableRelatedOptions&&(o[t]=e)}),n&&(this._size(),this._position()),this.uiDialog.is(":data(ui-resizable)")&&this.uiDialog.resizable("option",o)},_setOption:function(t,e){var i,n,o=this.uiDialog;"dialogClass"===t&&o.removeClass(this.options.dialogClass).addClass(e),"disabled"!==t&&(this._super(t,e),"appendTo"===t&&this.uiDialog.appendTo(this._appendTo()),"buttons"===t&&this._createButtons(),"closeText"===t&&this.uiDialogTitlebarClose.button({label:""+e}),"draggable"===t&&(i=o.is(":data(ui-draggable)"),i&&!e&&o.draggable("destroy"),!i&&e&&this._makeDraggable()),"position"===t&&this._position(),"resizable"===t&&(n=o.is(":data(ui-resizable)"),n&&!e&&o.resizable("destroy"),n&&"string"==typeof e&&o.resizable("option","handles",e),n||e===!1||this._makeResizable()),"title"===t&&this._title(this.uiDialogTitlebar.find(".ui-dialog-title")))},_size:function(){var t,e,i,n=this.options;this.element.show().css({width:"auto",minHeight:0,maxHeight:"none",height:0}),n.minWidth>n.width&&(n.width=n.minWidth),t=this.uiDialog.css({height:"auto",width:n.width}).outerHeight(),e=Math.max(0,n.minHeight-t),i="number"==typeof n.maxHeight?Math.max(0,n.maxHeight-t):"none","auto"===n.height?this.element.css({minHeight:e,maxHeight:i,height:"auto"}):this.element.height(Math.max(0,n.height-t)),this.uiDialog.is(":data(ui-resizable)")&&this.uiDialog.resizable("option","minHeight",this._minHeight())},_blockFrames:function(){this.iframeBlocks=this.document.find("iframe").map(function(){var e=t(this);return t("<div>").css({position:"absolute",width:e.outerWidth(),height:e.outerHeight()}).appendTo(e.parent()).offset(e.offset())[0]})},_unblockFrames:function(){this.iframeBlocks&&(this.iframeBlocks.remove(),delete this.iframeBlocks)},_allowInteraction:function(e){return!!t(e.target).closest(".ui-dialog").length||!!t(e.target).closest(".ui-datepicker").length},_createOverlay:function(){if(this.options.modal){var e=!0;this._delay(function(){e=!1}),this.document.data("ui-dialog-overlays")||this._on(this.document,{focusin:function(t){e||this._allowInteraction(t)||(t.preventDefault(),this._trackingInstances()[0]._focusTabbable())}}),this.overlay=t("<div>").addClass("ui-widget-overlay ui-front").appendTo(this._appendTo()),this._on(this.overlay,{mousedown:"_keepFocus"}),this.document.data("ui-dialog-overlays",(this.document.data("ui-dialog-overlays")||0)+1)}},_destroyOverlay:function(){if(this.options.modal&&this.overlay){var t=this.document.data("ui-dialog-overlays")-1;t?this.document.data("ui-dialog-overlays",t):this.document.unbind("focusin").removeData("ui-dialog-overlays"),this.overlay.remove(),this.overlay=null}}})})},{}],59:[function(t,e,i){!function(t){"function"==typeof define&&define.amd?define(["jquery","./core","./mouse","./widget"],t):t(jQuery)}(function(t){return t.widget("ui.draggable",t.ui.mouse,{version:"1.11.4",widgetEventPrefix:"drag",options:{addClasses:!0,appendTo:"parent",axis:!1,connectToSortable:!1,containment:!1,cursor:"auto",cursorAt:!1,grid:!1,handle:!1,helper:"original",iframeFix:!1,opacity:!1,refreshPositions:!1,revert:!1,revertDuration:500,scope:"default",scroll:!0,scrollSensitivity:20,scrollSpeed:20,snap:!1,snapMode:"both",snapTolerance:20,stack:!1,zIndex:!1,drag:null,start:null,stop:null},_create:function(){"original"===this.options.helper&&this._setPositionRelative(),this.options.addClasses&&this.element.addClass("ui-draggable"),this.options.disabled&&this.element.addClass("ui-draggable-disabled"),this._setHandleClassName(),this._mouseInit()},_setOption:function(t,e){this._super(t,e),"handle"===t&&(this._removeHandleClassName(),this._setHandleClassName())},_destroy:function(){return(this.helper||this.element).is(".ui-draggable-dragging")?void(this.destroyOnClear=!0):(this.element.removeClass("ui-draggable ui-draggable-dragging ui-draggable-disabled"),this._removeHandleClassName(),void this._mouseDestroy())},_mouseCapture:function(e){var i=this.options;return this._blurActiveElement(e),!(this.helper||i.disabled||t(e.target).closest(".ui-resizable-handle").length>0)&&(this.handle=this._getHandle(e),!!this.handle&&(this._blockFrames(i.iframeFix===!0?"iframe":i.iframeFix),!0))},_blockFrames:function(e){this.iframeBlocks=this.document.find(e).map(function(){var e=t(this);return t("<div>").css("position","absolute").appendTo(e.parent()).outerWidth(e.outerWidth()).outerHeight(e.outerHeight()).offset(e.offset())[0]})},_unblockFrames:function(){this.iframeBlocks&&(this.iframeBlocks.remove(),delete this.iframeBlocks)},_blurActiveElement:function(e){var i=this.document[0];if(this.handleElement.is(e.target))try{i.activeElement&&"body"!==i.activeElement.nodeName.toLowerCase()&&t(i.activeElement).blur()}catch(n){}},_mouseStart:function(e){var i=this.options;return this.helper=this._createHelper(e),this.helper.addClass("ui-draggable-dragging"),this._cacheHelperProportions(),t.ui.ddmanager&&(t.ui.ddmanager.current=this),this._cacheMargins(),this.cssPosition=this.helper.css("position"),this.scrollParent=this.helper.scrollParent(!0),this.offsetParent=this.helper.offsetParent(),this.hasFixedAncestor=this.helper.parents().filter(function(){return"fixed"===t(this).css("position")}).length>0,this.positionAbs=this.element.offset(),this._refreshOffsets(e),this.originalPosition=this.position=this._generatePosition(e,!1),this.originalPageX=e.pageX,this.originalPageY=e.pageY,i.cursorAt&&this._adjustOffsetFromHelper(i.cursorAt),this._setContainment(),this._trigger("start",e)===!1?(this._clear(),!1):(this._cacheHelperProportions(),t.ui.ddmanager&&!i.dropBehaviour&&t.ui.ddmanager.prepareOffsets(this,e),this._normalizeRightBottom(),this._mouseDrag(e,!0),t.ui.ddmanager&&t.ui.ddmanager.dragStart(this,e),!0)},_refreshOffsets:function(t){this.offset={top:this.positionAbs.top-this.margins.top,left:this.positionAbs.left-this.margins.left,scroll:!1,parent:this._getParentOffset(),relative:this._getRelativeOffset()},this.offset.click={left:t.pageX-this.offset.left,top:t.pageY-this.offset.top}},_mouseDrag:function(e,i){if(this.hasFixedAncestor&&(this.offset.parent=this._getParentOffset()),this.position=this._generatePosition(e,!0),this.positionAbs=this._convertPositionTo("absolute"),!i){var n=this._uiHash();if(this._trigger("drag",e,n)===!1)return this._mouseUp({}),!1;this.position=n.position}return this.helper[0].style.left=this.position.left+"px",this.helper[0].style.top=this.position.top+"px",t.ui.ddmanager&&t.ui.ddmanager.drag(this,e),!1},_mouseStop:function(e){var i=this,n=!1;return t.ui.ddmanager&&!this.options.dropBehaviour&&(n=t.ui.ddmanager.drop(this,e)),this.dropped&&(n=this.dropped,this.dropped=!1),"invalid"===this.options.revert&&!n||"valid"===this.options.revert&&n||this.options.revert===!0||t.isFunction(this.options.revert)&&this.options.revert.call(this.element,n)?t(this.helper).animate(this.originalPosition,parseInt(this.options.revertDuration,10),function(){i._trigger("stop",e)!==!1&&i._clear()}):this._trigger("stop",e)!==!1&&this._clear(),!1},_mouseUp:function(e){return this._unblockFrames(),t.ui.ddmanager&&t.ui.ddmanager.dragStop(this,e),this.handleElement.is(e.target)&&this.element.focus(),t.ui.mouse.prototype._mouseUp.call(this,e)},cancel:function(){return this.helper.is(".ui-draggable-dragging")?this._mouseUp({}):this._clear(),this},_getHandle:function(e){return!this.options.handle||!!t(e.target).closest(this.element.find(this.options.handle)).length},_setHandleClassName:function(){this.handleElement=this.options.handle?this.element.find(this.options.handle):this.element,this.handleElement.addClass("ui-draggable-handle")},_removeHandleClassName:function(){this.handleElement.removeClass("ui-draggable-handle")},_createHelper:function(e){var i=this.options,n=t.isFunction(i.helper),o=n?t(i.helper.apply(this.element[0],[e])):"clone"===i.helper?this.element.clone().removeAttr("id"):this.element;return o.parents("body").length||o.appendTo("parent"===i.appendTo?this.element[0].parentNode:i.appendTo),n&&o[0]===this.element[0]&&this._setPositionRelative(),o[0]===this.element[0]||/(fixed|absolute)/.test(o.css("position"))||o.css("position","absolute"),o},_setPositionRelative:function(){/^(?:r|a|f)/.test(this.element.css("position"))||(this.element[0].style.position="relative")},_adjustOffsetFromHelper:function(e){"string"==typeof e&&(e=e.split(" ")),t.isArray(e)&&(e={left:+e[0],top:+e[1]||0}),"left"in e&&(this.offset.click.left=e.left+this.margins.left),"right"in e&&(this.offset.click.left=this.helperProportions.width-e.right+this.margins.left),"top"in e&&(this.offset.click.top=e.top+this.margins.top),"bottom"in e&&(this.offset.click.top=this.helperProportions.height-e.bottom+this.margins.top)},_isRootNode:function(t){return/(html|body)/i.test(t.tagName)||t===this.document[0]},_getParentOffset:function(){var e=this.offsetParent.offset(),i=this.document[0];return"absolute"===this.cssPosition&&this.scrollParent[0]!==i&&t.contains(this.scrollParent[0],this.offsetParent[0])&&(e.left+=this.scrollParent.scrollLeft(),e.top+=this.scrollParent.scrollTop()),this._isRootNode(this.offsetParent[0])&&(e={top:0,left:0}),{top:e.top+(parseInt(this.offsetParent.css("borderTopWidth"),10)||0),left:e.left+(parseInt(this.offsetParent.css("borderLeftWidth"),10)||0)}},_getRelativeOffset:function(){if("relative"!==this.cssPosition)return{top:0,left:0};var t=this.element.position(),e=this._isRootNode(this.scrollParent[0]);return{top:t.top-(parseInt(this.helper.css("top"),10)||0)+(e?0:this.scrollParent.scrollTop()),left:t.left-(parseInt(this.helper.css("left"),10)||0)+(e?0:this.scrollParent.scrollLeft())}},_cacheMargins:function(){this.margins={left:parseInt(this.element.css("marginLeft"),10)||0,top:parseInt(this.element.css("marginTop"),10)||0,right:parseInt(this.element.css("marginRight"),10)||0,bottom:parseInt(this.element.css("marginBottom"),10)||0}},_cacheHelperProportions:function(){this.helperProportions={width:this.helper.outerWidth(),height:this.helper.outerHeight()}},_setContainment:function(){var e,i,n,o=this.options,s=this.document[0];return this.relativeContainer=null,o.containment?"window"===o.containment?void(this.containment=[t(window).scrollLeft()-this.offset.relative.left-this.offset.parent.left,t(window).scrollTop()-this.offset.relative.top-this.offset.parent.top,t(window).scrollLeft()+t(window).width()-this.helperProportions.width-this.margins.left,t(window).scrollTop()+(t(window).height()||s.body.parentNode.scrollHeight)-this.helperProportions.height-this.margins.top]):"document"===o.containment?void(this.containment=[0,0,t(s).width()-this.helperProportions.width-this.margins.left,(t(s).height()||s.body.parentNode.scrollHeight)-this.helperProportions.height-this.margins.top]):o.containment.constructor===Array?void(this.containment=o.containment):("parent"===o.containment&&(o.containment=this.helper[0].parentNode),i=t(o.containment),n=i[0],void(n&&(e=/(scroll|auto)/.test(i.css("overflow")),this.containment=[(parseInt(i.css("borderLeftWidth"),10)||0)+(parseInt(i.css("paddingLeft"),10)||0),(parseInt(i.css("borderTopWidth"),10)||0)+(parseInt(i.css("paddingTop"),10)||0),(e?Math.max(n.scrollWidth,n.offsetWidth):n.offsetWidth)-(parseInt(i.css("borderRightWidth"),10)||0)-(parseInt(i.css("paddingRight"),10)||0)-this.helperProportions.width-this.margins.left-this.margins.right,(e?Math.max(n.scrollHeight,n.offsetHeight):n.offsetHeight)-(parseInt(i.css("borderBottomWidth"),10)||0)-(parseInt(i.css("paddingBottom"),10)||0)-this.helperProportions.height-this.margins.top-this.margins.bottom],this.relativeContainer=i))):void(this.containment=null)},_convertPositionTo:function(t,e){e||(e=this.position);var i="absolute"===t?1:-1,n=this._isRootNode(this.scrollParent[0]);return{top:e.top+this.offset.relative.top*i+this.offset.parent.top*i-("fixed"===this.cssPosition?-this.offset.scroll.top:n?0:this.offset.scroll.top)*i,left:e.left+this.offset.relative.left*i+this.offset.parent.left*i-("fixed"===this.cssPosition?-this.offset.scroll.left:n?0:this.offset.scroll.left)*i}},_generatePosition:function(t,e){var i,n,o,s,r=this.options,a=this._isRootNode(this.scrollParent[0]),l=t.pageX,c=t.pageY;return a&&this.offset.scroll||(this.offset.scroll={top:this.scrollParent.scrollTop(),left:this.scrollParent.scrollLeft()}),e&&(this.containment&&(this.relativeContainer?(n=this.relativeContainer.offset(),i=[this.containment[0]+n.left,this.containment[1]+n.top,this.containment[2]+n.left,this.containment[3]+n.top]):i=this.containment,
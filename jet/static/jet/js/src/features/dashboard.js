@@ -89,9 +89,8 @@ Dashboard.prototype = {
             e.preventDefault();
         });
     },
-    updateDashboardModules: function($dashboard) {
-        var $form = $dashboard.find('#update-dashboard-modules-form');
-        var modules = [];
+    getDashboardModulesPositions: function($dashboard) {
+        var positions = {};
 
         $dashboard.find('.dashboard-column').each(function () {
             var $column = $(this);
@@ -99,29 +98,66 @@ Dashboard.prototype = {
 
             $column.find('.dashboard-item').each(function () {
                 var $item = $(this);
-                var order = $item.index();
-                var id = $item.data('module-id');
 
-                modules.push({
-                    id: id,
+                positions[$item.data('module-id')] = {
                     column: column,
-                    order: order
-                });
+                    order: $item.index()
+                };
+            });
+        });
+
+        return positions;
+    },
+    updateDashboardModules: function($dashboard) {
+        var $form = $dashboard.find('#update-dashboard-modules-form');
+        var positions = this.getDashboardModulesPositions($dashboard);
+        var savedPositions = this.savedPositions || {};
+        var modules = [];
+
+        $.each(positions, function (id, position) {
+            var saved = savedPositions[id];
+
+            if (saved && saved.column == position.column && saved.order == position.order) {
+                return;
+            }
+
+            modules.push({
+                id: id,
+                column: position.column,
+                order: position.order
             });
         });
 
+        this.savedPositions = positions;
+
+        if (modules.length == 0) {
+            return;
+        }
+
         $form.find('[name="modules"]').val(JSON.stringify(modules));
 
         $.ajax({
             url: $form.attr('action'),
             method: $form.attr('method'),
             dataType: 'json',
-            data: $form.serialize()
+            data: $form.serialize(),
+            success: this.reloadIfMaterialized
         });
     },
     initModulesDragAndDrop: function($dashboard) {
         var self = this;
 
+        this.savedPositions = {};
+
+        $dashboard.find('.dashboard-item').each(function () {
+            var $item = $(this);
+
+            self.savedPositions[$item.data('module-id')] = {
+                column: $item.data('module-column'),
+                order: $item.data('module-order')
+            };
+        });
+
         $dashboard.find('.dashboard-column').droppable({
             activeClass: 'active',
             hoverClass: 'hovered',
@@ -140,8 +176,61 @@ Dashboard.prototype = {
             }
         });
     },
+    reloadIfMaterialized: function(result) {
+        // shared template dashboard was copied to user, widgets ids on the page are outdated
+        if (result.reload) {
+            location.reload();
+        }
+    },
+    flushCollapsedModules: function($form, beacon) {
+        var pending = this.pendingCollapsed;
+
+        clearTimeout(this.collapsedTimeout);
+
+        if ($.isEmptyObject(pending)) {
+            return;
+        }
+
+        this.pendingCollapsed = {};
+        $form.find('[name="modules"]').val(JSON.stringify(pending));
+
+        if (beacon && navigator.sendBeacon) {
+            // request is delivered even when page is being unloaded
+            navigator.sendBeacon($form.attr('action'), new FormData($form.get(0)));
+            return;
+        }
+
+        $.ajax({
+            url: $form.attr('action'),
+            method: $form.attr('method'),
+            dataType: 'json',
+            data: $form.serialize(),
+            success: this.reloadIfMaterialized
+        });
+    },
+    initCollapsedModulesFlush: function($form) {
+        var self = this;
+
+        this.pendingCollapsed = {};
+
+        $(window).on('pagehide', function () {
+            self.flushCollapsedModules($form, true);
+        });
+
+        $(document).on('visibilitychange', function () {
+            if (document.visibilityState == 'hidden') {
+                self.flushCollapsedModules($form, true);
+            }
+        });
+    },
     initCollapsibleModules: function($dashboard) {
-        var $form = $dashboard.find('#update-dashboard-module-collapse-form');
+        var self = this;
+        var $form = $dashboard.find('#update-dashboard-modules-collapse-form');
+        var $moduleForm = $dashboard.find('#update-dashboard-module-collapse-form');
+
+        if ($form.length != 0) {
+            this.initCollapsedModulesFlush($form);
+        }
 
         $dashboard.find('.dashboard-item.collapsible').each(function () {
             var $item = $(this);
@@ -161,20 +250,32 @@ Dashboard.prototype = {
                         $item.removeClass('collapsed')
                     }
 
-                    $form.find('[name="id"]').val(moduleId);
-                    $form.find('[name="collapsed"]').val(collapsed ? 'true' : 'false');
+                    if ($form.length != 0) {
+                        // clicks are collected and saved with a single request once user stops toggling
+                        self.pendingCollapsed[moduleId] = collapsed;
+                        clearTimeout(self.collapsedTimeout);
+                        self.collapsedTimeout = setTimeout(function () {
+                            self.flushCollapsedModules($form, false);
+                        }, 1000);
+                        return;
+                    }
+
+                    $moduleForm.find('[name="id"]').val(moduleId);
+                    $moduleForm.find('[name="collapsed"]').val(collapsed ? 'true' : 'false');
 
                     $.ajax({
-                        url: $form.attr('action'),
-                        method: $form.attr('method'),
+                        url: $moduleForm.attr('action'),
+                        method: $moduleForm.attr('method'),
                         dataType: 'json',
-                        data: $form.serialize()
+                        data: $moduleForm.serialize(),
+                        success: self.reloadIfMaterialized
                     });
                 });
             });
         });
     },
     initDeletableModules: function($dashboard) {
+        var self = this;
         var $form = $dashboard.find('#remove-dashboard-module-form');
 
         $dashboard.find('.dashboard-item.deletable').each(function () {
@@ -195,7 +296,8 @@ Dashboard.prototype = {
                             url: $form.attr('action'),
                             method: $form.attr('method'),
                             dataType: 'json',
-                            data: $form.serialize()
+                            data: $form.serialize(),
+                            success: self.reloadIfMaterialized
                         });
                     });
                 };
@@ -217,38 +319,190 @@ Dashboard.prototype = {
             });
         });
     },
+    setAjaxModuleContent: function($item, html) {
+        var $content = $item.find('.dashboard-item-content');
+
+        if (html == null) {
+            $content.empty();
+            return;
+        }
+
+        var oldHeight = $content.height();
+        $content.html(html);
+        var newHeight = $content.height();
+
+        $content.height(oldHeight);
+        $content.animate({
+            height: newHeight
+        }, 250, 'swing', function() {
+            $content.height('auto');
+        });
+    },
+    loadAjaxModule: function($item) {
+        var self = this;
+
+        $.ajax({
+            url: $item.data('ajax-url'),
+            dataType: 'json',
+            success: function (result) {
+                self.setAjaxModuleContent($item, result.error ? null : result.html);
+            },
+            error: function () {
+                self.setAjaxModuleContent($item, null);
+            }
+        });
+    },
     initAjaxModules: function($dashboard) {
-        $dashboard.find('.dashboard-item.ajax').each(function () {
-            var $item = $(this);
-            var $content = $item.find('.dashboard-item-content');
-            var url = $item.data('ajax-url');
+        var self = this;
+        var $form = $dashboard.find('#load-dashboard-modules-form');
+        var $items = $dashboard.find('.dashboard-item.ajax');
+
+        if ($items.length == 0) {
+            return;
+        }
+
+        if ($form.length == 0) {
+            $items.each(function () {
+                self.loadAjaxModule($(this));
+            });
+            return;
+        }
+
+        // all ajax modules are loaded with a single request
+        $.ajax({
+            url: $form.attr('action'),
+            method: $form.attr('method'),
+            dataType: 'json',
+            traditional: true,
+            data: {
+                app_label: $form.find('[name="app_label"]').val(),
+                id: $items.map(function () {
+                    return $(this).data('module-id');
+                }).get()
+            },
+            success: function (result) {
+                var pending = result.error ? [] : result.pending || [];
+
+                $items.each(function () {
+                    var $item = $(this);
+                    var id = $item.data('module-id');
+
+                    // modules not rendered within batch timeout are loaded separately
+                    if (pending.indexOf(id) != -1) {
+                        self.loadAjaxModule($item);
+                        return;
+                    }
+
+                    self.setAjaxModuleContent($item, result.error ? null : result.modules[id]);
+                });
+            },
+            error: function () {
+                $items.each(function () {
+                    self.setAjaxModuleContent($(this), null);
+                });
+            }
+        });
+    },
+    reloadModule: function($item, version) {
+        var $content = $item.find('.dashboard-item-content');
+
+        $.ajax({
+            url: $item.data('load-url'),
+            dataType: 'json',
+            success: function (result) {
+                if (result.error) {
+                    return;
+                }
+
+                $content.html(result.html);
+                // content may be cached again with a newer version than the polled one
+                $item.attr('data-version', result.version != null ? result.version : version);
+            }
+        });
+    },
+    initModulesPolling: function($dashboard) {
+        var self = this;
+        var $form = $dashboard.find('#dashboard-modules-versions-form');
+        var interval = parseInt($form.data('interval'));
+
+        if ($form.length == 0 || !interval) {
+            return;
+        }
 
+        var poll = function () {
             $.ajax({
-                url: url,
+                url: $form.attr('action'),
+                method: $form.attr('method'),
                 dataType: 'json',
+                data: $form.serialize(),
                 success: function (result) {
                     if (result.error) {
-                        $content.empty();
                         return;
                     }
 
-                    var oldHeight = $content.height();
-                    $content.html(result.html);
-                    var newHeight = $content.height();
+                    $dashboard.find('.dashboard-item[data-load-url]').each(function () {
+                        var $item = $(this);
+                        var version = result.versions[$item.data('module-id')];
 
-                    $content.height(oldHeight);
-                    $content.animate({
-                        height: newHeight
-                    }, 250, 'swing', function() {
-                        $content.height('auto');
+                        if (version != null && String(version) != $item.attr('data-version')) {
+                            self.reloadModule($item, version);
+                        }
                     });
                 },
-                error: function () {
-                    $content.empty();
+                complete: function () {
+                    setTimeout(poll, interval * 1000);
                 }
             });
+        };
+
+        setTimeout(poll, interval * 1000);
+    },
+    loadNextPage: function($list) {
+        var url = $list.data('next-url');
+
+        if (!url || $list.data('loading')) {
+            return;
+        }
+
+        $list.data('loading', true);
+
+        $.ajax({
+            url: url,
+            dataType: 'json',
+            success: function (result) {
+                if (result.error) {
+                    return;
+                }
+
+                $list.append(result.html);
+                $list.data('next-url', result.next_url);
+
+                if (!result.next_url) {
+                    $list.removeAttr('data-next-url');
+                }
+            },
+            complete: function () {
+                $list.data('loading', false);
+            }
         });
     },
+    initPaginatedModules: function($dashboard) {
+        var self = this;
+        var loadVisiblePages = function () {
+            var bottom = $(window).scrollTop() + $(window).height();
+
+            // lists inserted later by ajax modules are found too
+            $dashboard.find('ul[data-next-url]').each(function () {
+                var $list = $(this);
+
+                if ($list.is(':visible') && $list.offset().top + $list.outerHeight() <= bottom + 100) {
+                    self.loadNextPage($list);
+                }
+            });
+        };
+
+        $(window).on('scroll', loadVisiblePages);
+    },
     updateModuleChildrenFormsetLabels: function($inline) {
         $inline.find('.inline-related').each(function(i) {
             $(this).find('.inline_label').text('#' + (i + 1));
@@ -327,6 +581,8 @@ Dashboard.prototype = {
             this.initCollapsibleModules($dashboard);
             this.initDeletableModules($dashboard);
             this.initAjaxModules($dashboard);
+            this.initPaginatedModules($dashboard);
+            this.initModulesPolling($dashboard);
             this.initModuleChildrenFormsetUpdate($dashboard);
         } catch (e) {
             console.error(e, e.stack);
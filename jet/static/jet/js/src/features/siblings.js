@@ -8,9 +8,42 @@ Siblings.prototype = {
     moveSiblings: function($siblings) {
         $siblings.detach().insertBefore($('.object-tools'));
     },
+    isSlowConnection: function() {
+        var connection = navigator.connection || navigator.mozConnection || navigator.webkitConnection;
+
+        if (!connection) {
+            return false;
+        }
+
+        return connection.saveData == true || /(^|-)2g$/.test(connection.effectiveType || '');
+    },
+    prefetchNext: function($siblings) {
+        var url = $siblings.find('.changeform-navigation-button.right').attr('href');
+
+        if (!url || this.isSlowConnection()) {
+            return;
+        }
+
+        var prefetch = function() {
+            $('<link>')
+                .attr('rel', 'prefetch')
+                .attr('href', url)
+                .appendTo('head');
+        };
+
+        if (window.requestIdleCallback) {
+            window.requestIdleCallback(prefetch, { timeout: 2000 });
+        } else {
+            setTimeout(prefetch, 1000);
+        }
+    },
     run: function() {
         try {
             this.moveSiblings(this.$siblings);
+
+            if (this.$siblings.data('prefetch')) {
+                this.prefetchNext(this.$siblings);
+            }
         } catch (e) {
             console.error(e, e.stack);
         }
@@ -2,7 +2,6 @@ from __future__ import unicode_literals
 
 import json
 import os
-from urllib.parse import parse_qsl
 
 from django import template
 from django.contrib.admin.widgets import RelatedFieldWidgetWrapper
@@ -24,8 +23,8 @@ from jet.utils import (
     get_admin_site,
     get_menu_items,
     get_model_instance_label,
-    get_model_queryset,
     get_possible_language_codes,
+    get_sibling_pks_window,
 )
 
 register = template.Library()
@@ -158,6 +157,11 @@ def jet_change_form_sibling_links_enabled():
     return settings.JET_CHANGE_FORM_SIBLING_LINKS
 
 
+@assignment_tag
+def jet_change_form_sibling_links_prefetch_enabled():
+    return settings.JET_CHANGE_FORM_SIBLING_LINKS_PREFETCH
+
+
 def jet_sibling_object(context, next):
     original = context.get("original")
 
@@ -166,28 +170,22 @@ def jet_sibling_object(context, next):
 
     model = type(original)
     preserved_filters_plain = context.get("preserved_filters", "")
-    preserved_filters = dict(parse_qsl(preserved_filters_plain))
     admin_site = get_admin_site(context)
 
     if admin_site is None:
         return
 
     request = context.get("request")
-    queryset = get_model_queryset(admin_site, model, request, preserved_filters=preserved_filters)
+    window = get_sibling_pks_window(admin_site, model, request, original.pk, preserved_filters_plain)
 
-    if queryset is None:
+    if window is None:
         return
 
     sibling_object = None
-    object_pks = list(queryset.values_list("pk", flat=True))
-
-    try:
-        index = object_pks.index(original.pk)
-        sibling_index = index + 1 if next else index - 1
-        exists = sibling_index < len(object_pks) if next else sibling_index >= 0
-        sibling_object = queryset.get(pk=object_pks[sibling_index]) if exists else None
-    except ValueError:
-        pass
+    sibling_pk = window.get_sibling(original.pk, next)
+
+    if sibling_pk is not None:
+        sibling_object = admin_site._registry[model].get_queryset(request).filter(pk=sibling_pk).first()
 
     if sibling_object is None:
         return
@@ -1,11 +1,84 @@
+import asyncio
+import io
+import json
+import re
+import time
+from unittest import mock
+
+from asgiref.sync import async_to_sync
+from django.conf import settings
+from django.contrib.admin.models import ADDITION, CHANGE, LogEntry
 from django.contrib.auth.models import User
-from django.test import Client, TestCase
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection, transaction
+from django.test import Client, RequestFactory, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
+from jet.dashboard import settings as dashboard_settings
 from jet.dashboard.dashboard import Dashboard
-from jet.dashboard.models import UserDashboardModule
-from jet.dashboard.modules import LinkList, RecentActions
+from jet.dashboard.dashboard_modules.yandex_metrika import AccessTokenWidget
+from jet.dashboard.forms import UpdateDashboardModulesForm
+from jet.dashboard.models import RecentAction, UserDashboardLayout, UserDashboardModule
+from jet.dashboard.modules import AppList, DashboardModule, Feed, LinkList, ModelList, RecentActions
+from jet.dashboard.storage import LayoutStorage
+from jet.dashboard.utils import (
+    ModelPatternMatcher,
+    clear_class_registry,
+    get_current_dashboard,
+    get_executor,
+    resolve_class,
+    run_concurrently,
+)
+from jet.dashboard.views import aload_dashboard_modules_view
 from jet.tests.dashboard import TestIndexDashboard
+from jet.tests.models import TestModel
+
+
+class SleepModule(DashboardModule):
+    delay = 0
+
+    def init_with_context(self, context):
+        time.sleep(self.delay)
+        self.children = ['initialized']
+
+
+class AsyncSleepModule(DashboardModule):
+    delay = 0
+
+    async def ainit_with_context(self, context):
+        await asyncio.sleep(self.delay)
+        self.children = ['initialized']
+
+
+class StreamedModule(DashboardModule):
+    template = 'jet.dashboard/modules/link_list.html'
+    layout = 'stacked'
+    delay = 0.3
+
+    def init_with_context(self, context):
+        time.sleep(self.delay)
+        self.children = [{'title': 'streamed for %s' % context['request'].user.username, 'url': '/'}]
+
+
+class TimedOutModule(StreamedModule):
+    delay = 1
+
+
+class FailingModule(StreamedModule):
+    def init_with_context(self, context):
+        raise ValueError('failed')
+
+
+class CachedModule(DashboardModule):
+    template = 'jet.dashboard/modules/link_list.html'
+    cache_timeout = 60
+    init_count = 0
+
+    def init_with_context(self, context):
+        CachedModule.init_count += 1
 
 
 class DashboardTestCase(TestCase):
@@ -84,3 +157,552 @@ class DashboardTestCase(TestCase):
 
         self.assertIsInstance(dashboard, Dashboard)
         self.assertEqual(dashboard.app_label, app_label)
+
+    def test_resolve_class(self):
+        clear_class_registry()
+        self.assertIs(resolve_class('jet.dashboard.modules.LinkList'), LinkList)
+        self.assertIs(resolve_class('jet.dashboard.modules.LinkList'), LinkList)
+        self.assertIsNone(resolve_class('jet.dashboard.modules.Missing'))
+        self.assertIsNone(resolve_class('jet.missing_package.Missing'))
+        self.assertIs(get_current_dashboard('index'), TestIndexDashboard)
+
+    def test_model_pattern_matcher(self):
+        matcher = ModelPatternMatcher(['auth.*', 'tests.TestModel', 'sites.S?te'])
+        self.assertTrue(matcher.matches('auth', 'User'))
+        self.assertTrue(matcher.matches('tests', 'TestModel'))
+        self.assertFalse(matcher.matches('tests', 'SearchableTestModel'))
+        self.assertTrue(matcher.matches('sites', 'Site'))
+        self.assertFalse(matcher.matches('sites', 'Sites'))
+
+    def test_app_list_patterns(self):
+        context = {'request': self.Request(self.admin_user)}
+
+        module = AppList(models=['auth.*', 'tests.*'], exclude=['auth.Gr*', 'tests.TestModel'])
+        module.init_with_context(context)
+        models = {
+            (app['app_label'], model['object_name']) for app in module.children for model in app['models']
+        }
+        self.assertIn(('auth', 'User'), models)
+        self.assertNotIn(('auth', 'Group'), models)
+        self.assertNotIn(('tests', 'TestModel'), models)
+        self.assertEqual({app['app_label'] for app in module.children}, {'auth', 'tests'})
+
+        module = ModelList(models=['auth.User', 'tests.TestModel'])
+        module.init_with_context(context)
+        self.assertEqual(
+            sorted(model['object_name'] for model in module.children), ['TestModel', 'User']
+        )
+
+    def test_recent_actions(self):
+        test_model = TestModel.objects.create(field1='value', field2=1)
+        LogEntry.objects.create(
+            user=self.admin_user,
+            content_type=ContentType.objects.get_for_model(TestModel),
+            object_id=str(test_model.pk),
+            object_repr=str(test_model),
+            action_flag=ADDITION
+        )
+        LogEntry.objects.create(
+            user=self.admin_user,
+            content_type=ContentType.objects.get_for_model(User),
+            object_id=str(self.admin_user.pk),
+            object_repr='admin',
+            action_flag=CHANGE
+        )
+
+        module = RecentActions(include_list=['tests.testmodel'], exclude_list=['auth.*'])
+        with self.assertNumQueries(2):
+            module.init_with_context({'request': self.Request(self.admin_user)})
+            self.assertEqual(len(module.children), 1)
+            entry = module.children[0]
+            self.assertEqual(str(entry.user), 'admin')
+            self.assertEqual(entry.content_type.model, 'testmodel')
+            self.assertTrue(entry.get_admin_url())
+
+        # user model __str__ using fields other than username does not query each user
+        module = RecentActions(include_list=['tests.testmodel'], exclude_list=['auth.*'])
+        with mock.patch.object(User, '__str__', lambda user: user.email), self.assertNumQueries(1):
+            module.init_with_context({'request': self.Request(self.admin_user)})
+            self.assertEqual(str(module.children[0].user), 'admin@example.com')
+
+        # application wildcards are resolved from content types cache too
+        module = RecentActions(include_list=['tests.*'], exclude_list=['auth.*'])
+        module.get_content_type_ids(module.include_list)
+        with self.assertNumQueries(1):
+            module.init_with_context({'request': self.Request(self.admin_user)})
+        self.assertEqual([entry.object_repr for entry in module.children], [str(test_model)])
+
+        module = RecentActions(exclude_list=['tests.testmodel'])
+        module.init_with_context({'request': self.Request(self.admin_user)})
+        self.assertEqual([entry.object_repr for entry in module.children], ['admin'])
+
+    @mock.patch.object(dashboard_settings, 'JET_MODULE_RECENT_ACTIONS_STORE', True)
+    @mock.patch.object(dashboard_settings, 'JET_MODULE_RECENT_ACTIONS_STORE_SIZE', 2)
+    def test_recent_actions_store(self):
+        content_type = ContentType.objects.get_for_model(TestModel)
+
+        for i in range(3):
+            test_model = TestModel.objects.create(field1='value', field2=i)
+            LogEntry.objects.create(
+                user=self.admin_user,
+                content_type=content_type,
+                object_id=str(test_model.pk),
+                object_repr=str(test_model),
+                action_flag=ADDITION
+            )
+
+        self.assertEqual(
+            list(RecentAction.objects.values_list('object_repr', flat=True)), ['value2', 'value1']
+        )
+
+        module = RecentActions(include_list=['tests.*'], limit=5)
+        module.init_with_context({'request': self.Request(self.admin_user)})
+        self.assertEqual([entry.object_repr for entry in module.children], ['value2', 'value1'])
+        self.assertEqual(module.children[0].user_repr, 'admin')
+        self.assertEqual(module.children[0].content_type, content_type)
+        self.assertTrue(module.children[0].get_admin_url())
+
+        RecentAction.objects.all().delete()
+        call_command('jet_rebuild_recent_actions', size=1, stdout=io.StringIO())
+        self.assertEqual(list(RecentAction.objects.values_list('object_repr', flat=True)), ['value2'])
+
+    @mock.patch.object(dashboard_settings, 'JET_MODULE_RECENT_ACTIONS_STORE', True)
+    def test_recent_actions_store_bulk_logged(self):
+        pks = [TestModel.objects.create(field1='value', field2=i).pk for i in range(4)]
+
+        response = self.admin.post(reverse('admin:tests_testmodel_changelist'), {
+            'action': 'delete_selected',
+            '_selected_action': pks,
+            'post': 'yes',
+        })
+        self.assertEqual(response.status_code, 302)
+        self.assertFalse(TestModel.objects.exists())
+
+        log_entry_pks = set(LogEntry.objects.values_list('pk', flat=True))
+        self.assertEqual(len(log_entry_pks), 4)
+        self.assertEqual(set(RecentAction.objects.values_list('log_entry', flat=True)), log_entry_pks)
+        self.assertTrue(all(action.is_deletion() for action in RecentAction.objects.all()))
+
+    def test_create_initial_module_models(self):
+        user = User.objects.create_user('staff', 'staff@example.com', 'staff', is_staff=True)
+
+        with CaptureQueriesContext(connection) as queries:
+            dashboard = TestIndexDashboard({'request': self.Request(user)})
+
+        inserts = [query for query in queries.captured_queries if query['sql'].startswith('INSERT')]
+        self.assertEqual(len(inserts), 1)
+
+        self.assertEqual(len(dashboard.modules), 2)
+        self.assertTrue(all(module.model.pk for module in dashboard.modules))
+
+        module_models = dashboard.create_initial_module_models(user)
+
+        self.assertEqual(len(module_models), 2)
+        self.assertEqual(UserDashboardModule.objects.filter(user=user.pk, app_label=None).count(), 2)
+
+    def test_update_settings(self):
+        module = UserDashboardModule.objects.create(
+            title='',
+            module='jet.dashboard.modules.LinkList',
+            app_label=None,
+            user=self.admin_user.pk,
+            column=0,
+            order=0,
+            settings={'layout': 'inline', 'token': 'secret'}
+        )
+        UserDashboardModule.objects.filter(pk=module.pk).update(title='Updated')
+
+        module.update_settings({'layout': 'stacked', 'counter': {'id': 1}})
+        module.pop_settings(('token', 'missing'))
+
+        expected = {'layout': 'stacked', 'counter': {'id': 1}}
+        self.assertEqual(module.settings, expected)
+        module = UserDashboardModule.objects.get(pk=module.pk)
+        self.assertEqual(module.settings, expected)
+        self.assertEqual(module.title, 'Updated')
+
+    @mock.patch.object(dashboard_settings, 'JET_DASHBOARD_STORAGE', 'jet.dashboard.storage.LayoutStorage')
+    def test_layout_storage(self):
+        pks = [module.model.pk for module in self.dashboard.modules]
+
+        call_command('jet_migrate_dashboard_storage', to='layouts', stdout=io.StringIO())
+        self.assertFalse(UserDashboardModule.objects.exists())
+
+        with self.assertNumQueries(1):
+            module_models = LayoutStorage().get_modules(self.admin_user.pk, None)
+        self.assertEqual([module_model.pk for module_model in module_models], pks)
+
+        with self.assertNumQueries(1):
+            self.assertEqual(LayoutStorage().get_module(self.admin_user.pk, pks[1], None).pk, pks[1])
+        with self.assertRaises(UserDashboardModule.DoesNotExist):
+            LayoutStorage().get_module(self.admin_user.pk, pks[1], 'tests')
+        with self.assertNumQueries(1):
+            self.assertEqual(len(LayoutStorage().get_modules_in(self.admin_user.pk, pks, None)), 2)
+
+        dashboard = TestIndexDashboard({'request': self.Request(self.admin_user)})
+        self.assertEqual([module.model.pk for module in dashboard.modules], pks)
+        self.assertTrue(isinstance(dashboard.modules[1], RecentActions))
+
+        self.admin.post(reverse('jet-dashboard:update_dashboard_module_collapse'), {'id': pks[0], 'collapsed': True})
+        self.admin.post(reverse('jet-dashboard:update_dashboard_modules'), {
+            'app_label': '',
+            'modules': json.dumps([{'id': pks[0], 'column': 1, 'order': 0}])
+        })
+        response = self.admin.post(reverse('jet-dashboard:remove_dashboard_module'), {'id': pks[1]})
+        self.assertFalse(json.loads(response.content.decode())['error'])
+
+        layout = UserDashboardLayout.objects.get(user=self.admin_user.pk, app_label='')
+        self.assertEqual(len(layout.modules), 1)
+        self.assertEqual(layout.modules[0]['id'], pks[0])
+        self.assertTrue(layout.modules[0]['collapsed'])
+        self.assertEqual(layout.modules[0]['column'], 1)
+
+        user = User.objects.create_user('staff', 'staff@example.com', 'staff', is_staff=True)
+        dashboard = TestIndexDashboard({'request': self.Request(user)})
+        self.assertEqual([module.model.pk for module in dashboard.modules], [1, 2])
+        self.assertFalse(UserDashboardModule.objects.exists())
+
+        call_command('jet_migrate_dashboard_storage', to='rows', batch_size=1, stdout=io.StringIO())
+        self.assertFalse(UserDashboardLayout.objects.exists())
+        self.assertEqual(UserDashboardModule.objects.filter(user=self.admin_user.pk, collapsed=True).count(), 1)
+        self.assertEqual(UserDashboardModule.objects.filter(user=user.pk).count(), 2)
+
+        call_command('jet_migrate_dashboard_storage', to='layouts', batch_size=1, stdout=io.StringIO())
+        self.assertEqual(UserDashboardLayout.objects.count(), 2)
+        self.assertEqual(len(UserDashboardLayout.objects.get(user=user.pk).modules), 2)
+
+    @mock.patch.object(dashboard_settings, 'JET_DASHBOARD_STORAGE', 'jet.dashboard.storage.LayoutStorage')
+    def test_migrate_dashboard_storage_keeps_moved_dashboards(self):
+        pks = [module.model.pk for module in self.dashboard.modules]
+
+        call_command('jet_migrate_dashboard_storage', to='layouts', stdout=io.StringIO())
+        self.admin.post(reverse('jet-dashboard:remove_dashboard_module'), {'id': pks[1]})
+
+        # widgets saved to rows storage after the first run, e.g. by a server still using it
+        UserDashboardModule.objects.create(
+            title='', module='jet.dashboard.modules.LinkList', app_label=None, user=self.admin_user.pk, column=0, order=0
+        )
+        out = io.StringIO()
+        call_command('jet_migrate_dashboard_storage', to='layouts', stdout=out)
+        self.assertIn('Skipped 1 dashboards', out.getvalue())
+        self.assertEqual([entry['id'] for entry in UserDashboardLayout.objects.get().modules], [pks[0]])
+        self.assertEqual(UserDashboardModule.objects.count(), 1)
+
+        call_command('jet_migrate_dashboard_storage', to='layouts', force=True, stdout=io.StringIO())
+        self.assertEqual(len(UserDashboardLayout.objects.get().modules), 1)
+        self.assertNotEqual(UserDashboardLayout.objects.get().modules[0]['id'], pks[0])
+        self.assertFalse(UserDashboardModule.objects.exists())
+
+    @mock.patch.object(dashboard_settings, 'JET_DASHBOARD_SHARED_TEMPLATES', True)
+    def test_shared_template(self):
+        user = User.objects.create_user('staff', 'staff@example.com', 'staff', is_staff=True)
+        client = Client()
+        client.login(username='staff', password='staff')
+
+        dashboard = TestIndexDashboard({'request': self.Request(user)})
+        self.assertEqual([module.model.pk for module in dashboard.modules], [-1, -2])
+        self.assertTrue(dashboard.modules[0].model.is_template)
+        self.assertFalse(UserDashboardModule.objects.filter(user=user.pk).exists())
+
+        response = client.get(reverse('jet-dashboard:load_dashboard_module', kwargs={'pk': -1}))
+        self.assertFalse(json.loads(response.content.decode())['error'])
+        response = client.get(reverse('jet-dashboard:dashboard_modules_versions'))
+        self.assertIn('-2', json.loads(response.content.decode())['versions'])
+        self.assertFalse(UserDashboardModule.objects.filter(user=user.pk).exists())
+
+        update_url = reverse('jet-dashboard:update_module', kwargs={'pk': -1}) + '?app_label='
+        response = client.get(update_url)
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(UserDashboardModule.objects.filter(user=user.pk).exists())
+
+        with transaction.atomic():
+            client.post(update_url, {'title': 'Changed', 'limit': 5})
+            self.assertEqual(
+                UserDashboardModule.objects.get(user=user.pk, module=dashboard.modules[0].model.module).title,
+                'Changed'
+            )
+            self.assertEqual(UserDashboardModule.objects.filter(user=user.pk).count(), len(dashboard.modules))
+            transaction.set_rollback(True)
+
+        form = UpdateDashboardModulesForm(self.Request(user), {
+            'app_label': '',
+            'modules': json.dumps([{'id': -1, 'column': 2, 'order': 7}])
+        })
+        self.assertTrue(form.is_valid())
+        self.assertFalse(UserDashboardModule.objects.filter(user=user.pk).exists())
+
+        with transaction.atomic():
+            form.save()
+            self.assertTrue(form.materialized)
+            self.assertEqual(
+                UserDashboardModule.objects.get(user=user.pk, order=7).module, dashboard.modules[0].model.module
+            )
+            transaction.set_rollback(True)
+
+        response = client.post(
+            reverse('jet-dashboard:update_dashboard_module_collapse'), {'id': -2, 'collapsed': True}
+        )
+        response = json.loads(response.content.decode())
+        self.assertFalse(response['error'])
+        self.assertTrue(response['reload'])
+
+        module_models = list(UserDashboardModule.objects.filter(user=user.pk))
+        self.assertEqual(
+            [module_model.module for module_model in module_models],
+            [module.model.module for module in dashboard.modules]
+        )
+        self.assertEqual([module_model.collapsed for module_model in module_models], [False, True])
+
+        response = client.post(reverse('jet-dashboard:remove_dashboard_module'), {'id': -1})
+        self.assertTrue(json.loads(response.content.decode())['error'])
+
+        response = client.get(reverse('jet-dashboard:update_module', kwargs={'pk': -1}))
+        self.assertEqual(response.status_code, 404)
+
+        response = self.admin.get(reverse('jet-dashboard:update_module', kwargs={'pk': -1}))
+        self.assertEqual(response.status_code, 404)
+
+    @mock.patch.object(dashboard_settings, 'JET_DASHBOARD_SHARED_TEMPLATES', True)
+    def test_shared_template_oauth_grant(self):
+        user = User.objects.create_user('staff', 'staff@example.com', 'staff', is_staff=True)
+        client = Client()
+        client.login(username='staff', password='staff')
+
+        widget = AccessTokenWidget()
+        widget.module = TestIndexDashboard({'request': self.Request(user)}).modules[1]
+        grant_url = reverse('jet-dashboard:yandex-metrika-grant', kwargs={'pk': -2}) + '?app_label='
+        self.assertIn(grant_url, widget.render('access_token', None))
+        self.assertFalse(UserDashboardModule.objects.filter(user=user.pk).exists())
+
+        response = client.get(grant_url)
+        module_model = UserDashboardModule.objects.get(user=user.pk, module=widget.module.model.module)
+        self.assertIn('state=%d&' % module_model.pk, response['Location'])
+
+        response = client.get(grant_url)
+        self.assertEqual(response.content.decode(), 'Module not found')
+
+    def test_run_concurrently_timed_out(self):
+        started = []
+
+        def call(key):
+            started.append(key)
+            time.sleep(0.3)
+            return key
+
+        calls = {key: lambda key=key: call(key) for key in range(3)}
+        self.assertEqual(run_concurrently(calls, 1, 0.1), {})
+
+        # calls queued behind the timed out one are cancelled instead of holding threads of the shared pool
+        time.sleep(0.4)
+        self.assertEqual(started, [0])
+        self.assertIs(get_executor(), get_executor())
+
+    def test_init_modules_with_context_concurrently(self):
+        fast_module = SleepModule(context=self.dashboard.context)
+        slow_module = SleepModule(context=self.dashboard.context, delay=1)
+        self.dashboard.modules = [fast_module, slow_module]
+        self.dashboard.modules_workers = 2
+        self.dashboard.modules_timeout = 0.5
+
+        self.dashboard.init_modules_with_context()
+
+        self.assertTrue(fast_module.context_initialized)
+        self.assertEqual(fast_module.children, ['initialized'])
+        self.assertFalse(fast_module.ajax_load)
+        self.assertFalse(slow_module.context_initialized)
+        self.assertTrue(slow_module.ajax_load)
+
+    def test_ainit_modules_with_context(self):
+        fast_module = AsyncSleepModule(context=self.dashboard.context)
+        sync_module = SleepModule(context=self.dashboard.context)
+        slow_module = AsyncSleepModule(context=self.dashboard.context, delay=1)
+        self.dashboard.modules = [fast_module, sync_module, slow_module]
+        self.dashboard.modules_timeout = 0.5
+
+        async_to_sync(self.dashboard.ainit_modules_with_context)()
+
+        self.assertEqual(fast_module.children, ['initialized'])
+        self.assertEqual(sync_module.children, ['initialized'])
+        self.assertTrue(sync_module.context_initialized)
+        self.assertFalse(slow_module.context_initialized)
+        self.assertTrue(slow_module.ajax_load)
+
+    def test_aload_dashboard_modules_view(self):
+        module_model = UserDashboardModule.objects.get(user=self.admin_user.pk, module='jet.dashboard.modules.LinkList')
+        request = RequestFactory().get(
+            reverse('jet-dashboard:load_dashboard_modules'), {'id': [module_model.pk, 0]}
+        )
+        request.user = self.admin_user
+
+        response = json.loads(async_to_sync(aload_dashboard_modules_view)(request).content.decode())
+
+        self.assertFalse(response['error'])
+        self.assertEqual(list(response['modules']), [str(module_model.pk)])
+
+        recent_actions = UserDashboardModule.objects.get(
+            user=self.admin_user.pk, module='jet.dashboard.modules.RecentActions'
+        )
+        request.GET = request.GET.copy()
+        request.GET.setlist('id', [module_model.pk, recent_actions.pk])
+
+        with mock.patch.object(RecentActions, 'init_with_context', side_effect=RuntimeError), \
+                self.assertLogs('jet.dashboard.views', 'ERROR'):
+            response = json.loads(async_to_sync(aload_dashboard_modules_view)(request).content.decode())
+
+        self.assertFalse(response['error'])
+        self.assertIsNotNone(response['modules'][str(module_model.pk)])
+        self.assertIsNone(response['modules'][str(recent_actions.pk)])
+
+        with mock.patch.object(RecentActions, 'init_with_context', side_effect=lambda context: time.sleep(0.3)), \
+                mock.patch.object(dashboard_settings, 'JET_DASHBOARD_MODULES_TIMEOUT', 0.1):
+            response = json.loads(async_to_sync(aload_dashboard_modules_view)(request).content.decode())
+
+        self.assertEqual(list(response['modules']), [str(module_model.pk)])
+        self.assertEqual(response['pending'], [recent_actions.pk])
+
+        request = RequestFactory().post(reverse('jet-dashboard:load_dashboard_modules'))
+        self.assertEqual(async_to_sync(aload_dashboard_modules_view)(request).status_code, 405)
+
+    @override_settings(MIDDLEWARE=settings.MIDDLEWARE + ('jet.dashboard.middleware.DashboardStreamingMiddleware',))
+    @mock.patch.object(Dashboard, 'modules_timeout', 0.6)
+    def test_streaming_dashboard(self):
+        UserDashboardModule.objects.filter(user=self.admin_user.pk).delete()
+        module_models = [
+            UserDashboardModule.objects.create(
+                title='',
+                module=module,
+                app_label=None,
+                user=self.admin_user.pk,
+                column=i,
+                order=0
+            ) for i, module in enumerate([
+                'jet.dashboard.modules.LinkList',
+                'jet.tests.test_dashboard.StreamedModule',
+                'jet.tests.test_dashboard.TimedOutModule',
+            ])
+        ]
+
+        response = self.admin.get(reverse('admin:index'))
+
+        self.assertTrue(response.streaming)
+        content = b''.join(response.streaming_content).decode()
+        end = content.index('</body>')
+        self.assertLess(content.index('data-module-id="%d"' % module_models[1].pk), end)
+        self.assertLess(content.index('id="dashboard-item-stream-%d"' % module_models[1].pk), end)
+        self.assertLess(content.index('id="dashboard-item-stream-%d"' % module_models[2].pk), end)
+        streamed = content[content.index('id="dashboard-item-stream-%d"' % module_models[1].pk):end]
+        self.assertIn('dashboard-item-content', streamed.split('</script>')[0])
+        self.assertIn('streamed for admin', streamed.split('</template>')[0])
+        timed_out = content[content.index('id="dashboard-item-stream-%d"' % module_models[2].pk):end]
+        self.assertIn('data-ajax-url', timed_out.split('</script>')[0])
+
+        response = self.admin.get(reverse('admin:password_change'))
+        self.assertFalse(response.streaming)
+
+    @override_settings(MIDDLEWARE=settings.MIDDLEWARE + ('jet.dashboard.middleware.DashboardStreamingMiddleware',))
+    def test_streaming_dashboard_failed_module(self):
+        module_model = UserDashboardModule.objects.filter(user=self.admin_user.pk).first()
+        module_model.module = 'jet.tests.test_dashboard.FailingModule'
+        module_model.save()
+
+        response = self.admin.get(reverse('admin:index'))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(
+            response, reverse('jet-dashboard:load_dashboard_module', kwargs={'pk': module_model.pk}) + '?app_label='
+        )
+
+    @mock.patch.object(dashboard_settings, 'JET_DASHBOARD_POLL_INTERVAL', 60)
+    def test_dashboard_data_version_rendered(self):
+        cache.clear()
+        CachedModule.init_count = 0
+        UserDashboardModule.objects.filter(user=self.admin_user.pk).update(module='jet.tests.test_dashboard.CachedModule')
+
+        response = self.admin.get(reverse('admin:index'))
+        page_versions = re.findall(r'data-module-id="(\d+)"[^>]* data-version="([^"]+)"', response.content.decode())
+        self.assertEqual(len(page_versions), 2)
+        self.assertEqual(CachedModule.init_count, 1)
+        self.assertNotIn('0', dict(page_versions).values())
+
+        response = self.admin.get(reverse('jet-dashboard:dashboard_modules_versions'))
+        self.assertEqual(dict(page_versions), json.loads(response.content.decode())['versions'])
+
+    def test_module_render_cache(self):
+        cache.clear()
+        CachedModule.init_count = 0
+        context = self.dashboard.context
+
+        content = CachedModule(context=context).render()
+        self.assertEqual(CachedModule(context=context).render(), content)
+        self.assertEqual(CachedModule.init_count, 1)
+
+        module = CachedModule(context=context)
+        cache_key = module.get_cache_key()
+        cache.set(cache_key, ('stale', time.time() - 1))
+        cache.add(cache_key + '.lock', True)
+        self.assertEqual(CachedModule(context=context).render(), 'stale')
+        self.assertEqual(CachedModule.init_count, 1)
+
+        cache.delete(cache_key + '.lock')
+        self.assertEqual(CachedModule(context=context).render(), content)
+        self.assertEqual(CachedModule.init_count, 2)
+
+    def test_module_data_version(self):
+        cache.clear()
+        context = self.dashboard.context
+
+        self.assertIsNone(LinkList(context=context).get_data_version())
+        self.assertEqual(CachedModule(context=context).get_data_version(), '0')
+
+        module = CachedModule(context=context)
+        module.render()
+        version = module.get_data_version()
+        self.assertNotEqual(version, '0')
+        self.assertEqual(CachedModule(context=context).get_data_version(), version)
+
+        # evicted content changes version, so that polling dashboards reload the widget
+        cache.delete(module.get_cache_key())
+        self.assertEqual(CachedModule(context=context).get_data_version(), '0')
+
+    def test_warm_caches_command(self):
+        cache.clear()
+        CachedModule.init_count = 0
+        UserDashboardModule.objects.create(
+            title='',
+            module='jet.tests.test_dashboard.CachedModule',
+            app_label=None,
+            user=self.admin_user.pk,
+            column=1,
+            order=0
+        )
+        out = io.StringIO()
+
+        call_command('jet_warm_caches', workers=1, stdout=out)
+
+        self.assertIn('admin / index: 1 widgets', out.getvalue())
+        self.assertEqual(CachedModule.init_count, 1)
+
+        self.admin.get(reverse('admin:index'))
+        self.assertEqual(CachedModule.init_count, 1)
+
+        User.objects.create_user('staff', 'staff@example.com', 'staff', is_staff=True)
+        out = io.StringIO()
+
+        with mock.patch.object(dashboard_settings, 'JET_DASHBOARD_SHARED_TEMPLATES', True), \
+                mock.patch.object(Feed, 'render', return_value=''):
+            call_command('jet_warm_caches', workers=1, stdout=out)
+
+        self.assertIn('staff / index: 1 widgets', out.getvalue())
+        self.assertFalse(UserDashboardModule.objects.filter(user__in=User.objects.filter(username='staff')).exists())
+
+    def test_module_cache_vary_permissions(self):
+        staff = User.objects.create_user('staff', 'staff@example.com', 'staff', is_staff=True)
+        other = User.objects.create_user('other', 'other@example.com', 'other', is_staff=True)
+
+        def get_cache_key(user):
+            module = CachedModule(context={'request': self.Request(user)})
+            module.cache_vary = ('permissions', 'settings')
+            return module.get_cache_key()
+
+        self.assertEqual(get_cache_key(staff), get_cache_key(other))
+        self.assertNotEqual(get_cache_key(staff), get_cache_key(self.admin_user))
@@ -0,0 +1,111 @@
+import datetime
+import io
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase
+
+from jet.dashboard import feeds, settings
+from jet.dashboard.feeds import get_feed_entries, parse_feed_entries
+
+FEED_URL = 'http://example.com/rss/'
+RSS_CONTENT = b'''<?xml version="1.0" encoding="utf-8"?>
+<rss version="2.0">
+    <channel>
+        <title>Example</title>
+        <item>
+            <title>First</title>
+            <link>http://example.com/first/</link>
+            <description>First description</description>
+            <pubDate>Mon, 05 Jan 2015 10:00:00 GMT</pubDate>
+        </item>
+        <item>
+            <title>Second</title>
+            <link>http://example.com/second/</link>
+        </item>
+    </channel>
+</rss>'''
+ATOM_CONTENT = b'''<?xml version="1.0" encoding="utf-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+    <title>Example</title>
+    <entry>
+        <title>First</title>
+        <link rel="alternate" href="http://example.com/first/"/>
+        <published>2015-01-05T23:00:00-02:00</published>
+    </entry>
+</feed>'''
+ENTRIES = [{'title': 'First', 'link': 'http://example.com/first/'}]
+
+
+class FeedsTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_parse_rss_entries(self):
+        entries = parse_feed_entries(io.BytesIO(RSS_CONTENT))
+
+        self.assertEqual(entries, [
+            {'title': 'First', 'link': 'http://example.com/first/', 'date': datetime.date(2015, 1, 5)},
+            {'title': 'Second', 'link': 'http://example.com/second/'},
+        ])
+
+    def test_parse_atom_entries(self):
+        entries = parse_feed_entries(io.BytesIO(ATOM_CONTENT))
+
+        self.assertEqual(entries, [
+            {'title': 'First', 'link': 'http://example.com/first/', 'date': datetime.date(2015, 1, 6)},
+        ])
+
+    def test_parse_entries_limit(self):
+        content = RSS_CONTENT.replace(b'</channel>', b'<item><title>Third</title></item>' * 100000 + b'</channel>')
+        stream = io.BytesIO(content)
+        entries = parse_feed_entries(stream, 1)
+
+        self.assertEqual(len(entries), 1)
+        self.assertLess(stream.tell(), len(content))
+
+    @mock.patch.object(settings, 'JET_MODULE_FEED_MAX_BYTES', 400)
+    def test_parse_entries_max_bytes(self):
+        entries = parse_feed_entries(io.BytesIO(RSS_CONTENT))
+
+        self.assertEqual(len(entries), 1)
+
+    def test_parse_malformed_entries(self):
+        content = RSS_CONTENT.replace(b'First description', b'First&nbsp;description')
+        entries = parse_feed_entries(io.BytesIO(content), 1)
+
+        self.assertEqual(entries, [
+            {'title': 'First', 'link': 'http://example.com/first/', 'date': datetime.date(2015, 1, 5)},
+        ])
+
+    def test_get_feed_entries(self):
+        with mock.patch.object(feeds, 'fetch_feed', return_value=(ENTRIES, '"etag"', None)) as fetch_feed:
+            self.assertEqual(get_feed_entries(FEED_URL, 5), ENTRIES)
+            self.assertEqual(get_feed_entries(FEED_URL, 3), ENTRIES)
+
+        fetch_feed.assert_called_once_with(FEED_URL, None, None, 5)
+
+    def test_get_feed_entries_more_than_stored(self):
+        with mock.patch.object(feeds, 'fetch_feed', return_value=(ENTRIES, '"etag"', None)) as fetch_feed:
+            get_feed_entries(FEED_URL, 5)
+            get_feed_entries(FEED_URL, 10)
+
+        fetch_feed.assert_called_with(FEED_URL, None, None, 10)
+
+    @mock.patch.object(settings, 'JET_MODULE_FEED_REFRESH_INTERVAL', 0)
+    def test_get_feed_entries_not_modified(self):
+        with mock.patch.object(feeds, 'fetch_feed', return_value=(ENTRIES, '"etag"', None)):
+            get_feed_entries(FEED_URL)
+
+        with mock.patch.object(feeds, 'fetch_feed', return_value=None) as fetch_feed:
+            self.assertEqual(get_feed_entries(FEED_URL), ENTRIES)
+
+        fetch_feed.assert_called_once_with(FEED_URL, '"etag"', None, None)
+
+    @mock.patch.object(settings, 'JET_MODULE_FEED_REFRESH_INTERVAL', 0)
+    def test_get_feed_entries_request_failed(self):
+        with mock.patch.object(feeds, 'fetch_feed', return_value=(ENTRIES, None, None)):
+            get_feed_entries(FEED_URL)
+
+        with mock.patch.object(feeds, 'fetch_feed', side_effect=OSError):
+            self.assertEqual(get_feed_entries(FEED_URL), ENTRIES)
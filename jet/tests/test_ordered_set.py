@@ -68,3 +68,11 @@ class OrderedSetTestCase(TestCase):
 
         self.assertEqual(elem, 'a')
         self.assertRaises(KeyError, set1.pop)
+
+    def test_pop_first(self):
+        set1 = OrderedSet('abc')
+        set1.add('a')
+
+        self.assertEqual(set1.pop(last=False), 'a')
+        self.assertEqual(list(set1), ['b', 'c'])
+        self.assertRaises(AttributeError, setattr, set1, 'other', None)
@@ -1,8 +1,12 @@
+from unittest import mock
+
 from django import forms
 from django.contrib.auth.models import User
+from django.core.cache import cache
 from django.test import RequestFactory, TestCase
 from django.urls import reverse
 
+from jet import settings
 from jet.templatetags.jet_tags import jet_next_object, jet_previous_object, jet_select2_lookups
 from jet.tests.models import SearchableTestModel, TestModel
 
@@ -103,3 +107,29 @@ class TagsTestCase(TestCase):
         expected_object = None
 
         self.assertEqual(previous_object, expected_object)
+
+    @mock.patch.object(settings, 'JET_CHANGE_FORM_SIBLING_LINKS_CACHE_TIMEOUT', 60)
+    def test_jet_sibling_object_cached(self):
+        cache.clear()
+        instance = self.models[0]
+        preserved_filters = '_changelist_filters=o%3D1'
+        url = reverse('admin:%s_%s_change' % (
+            TestModel._meta.app_label,
+            TestModel._meta.model_name
+        ), args=(instance.pk,)) + '?' + preserved_filters
+
+        request = RequestFactory().get(url)
+        request.user = self.user
+        context = {
+            'original': instance,
+            'preserved_filters': preserved_filters,
+            'request': request,
+        }
+
+        self.assertEqual(jet_next_object(context)['label'], str(self.models[1]))
+
+        with self.assertNumQueries(1):
+            self.assertEqual(jet_next_object(context)['label'], str(self.models[1]))
+
+        self.models[1].delete()
+        self.assertIsNone(jet_next_object(context))
@@ -1,16 +1,22 @@
 import json
 from datetime import date, datetime
+from unittest import mock
 
 from django.contrib.admin import AdminSite
+from django.core.cache import cache
 from django.http import JsonResponse
 from django.test import TestCase
 
+from jet import settings
+from jet.models import PinnedApplication
 from jet.tests.models import TestModel
 from jet.utils import (
     LazyDateTimeEncoder,
     get_admin_site,
     get_app_list,
     get_model_instance_label,
+    get_sibling_pks_version_key,
+    request_memoize,
 )
 
 
@@ -59,6 +65,42 @@ class UtilsTestCase(TestCase):
                 self.assertIsNotNone(app, model.get('object_name'))
                 self.assertIsNotNone(app, model.get('name'))
 
+    def test_get_app_list_memoized(self):
+        class User:
+            is_active = True
+            is_staff = True
+
+            def has_module_perms(self, app):
+                return True
+
+            def has_perm(self, object):
+                return True
+
+        class Request:
+            path = '/admin/'
+            user = User()
+
+        context = {'request': Request(), 'user': None}
+        app_list = get_app_list(context)
+        app_list[0]['models'].clear()
+
+        with self.assertNumQueries(0):
+            self.assertTrue(get_app_list(context)[0]['models'])
+        self.assertIs(get_admin_site(context), get_admin_site(context))
+
+    def test_request_memoize(self):
+        class Request:
+            pass
+
+        calls = []
+        request = Request()
+
+        self.assertEqual(request_memoize(request, 'key', calls.append, 1), None)
+        self.assertEqual(request_memoize(request, 'key', calls.append, 2), None)
+        request_memoize(Request(), 'key', calls.append, 3)
+        request_memoize(None, 'key', calls.append, 4)
+        self.assertEqual(calls, [1, 3, 4])
+
     def test_get_admin_site(self):
         admin_site = get_admin_site({})
         self.assertIsInstance(admin_site, AdminSite)
@@ -76,3 +118,11 @@ class UtilsTestCase(TestCase):
         encoder = LazyDateTimeEncoder()
         self.assertEqual(encoder.encode({'key': 1}), '{"key": 1}')
 
+
+    @mock.patch.object(settings, 'JET_CHANGE_FORM_SIBLING_LINKS_CACHE_TIMEOUT', 60)
+    def test_invalidate_sibling_pks_cache(self):
+        with mock.patch.object(cache, 'delete') as delete:
+            TestModel.objects.create(field1='value', field2=1)
+            PinnedApplication.objects.create(app_label='tests', user=1)
+
+        delete.assert_called_once_with(get_sibling_pks_version_key(TestModel))
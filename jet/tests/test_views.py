@@ -1,11 +1,18 @@
 import json
+import time
+from unittest import mock
 
+from django.conf import settings
+from django.contrib.admin.models import CHANGE, LogEntry
 from django.contrib.auth.models import User
-from django.test import Client, TestCase
+from django.contrib.contenttypes.models import ContentType
+from django.test import Client, TestCase, override_settings
 from django.urls import reverse
+from django.utils import timezone
 
+from jet.dashboard import settings as dashboard_settings
 from jet.dashboard.models import UserDashboardModule
-from jet.dashboard.modules import LinkList
+from jet.dashboard.modules import LinkList, RecentActions
 from jet.models import Bookmark
 
 
@@ -32,8 +39,8 @@ class ViewsTestCase(TestCase):
             user=self.admin_user.pk,
             column=0,
             order=0,
-            settings='{"layout": "inline"}',
-            children='[]'
+            settings={'layout': 'inline'},
+            children=[]
         )
 
         response = self.admin.get(reverse('jet-dashboard:update_module', kwargs={'pk': module.pk}))
@@ -62,7 +69,7 @@ class ViewsTestCase(TestCase):
         self.admin.post(reverse('jet-dashboard:update_module', kwargs={'pk': module.pk}), post)
         self.assertEqual(response.status_code, 200)
         module = UserDashboardModule.objects.get(pk=module.pk)
-        settings = json.loads(module.settings)
+        settings = module.settings
         self.assertEqual(module.title, new_title)
         self.assertEqual(settings['layout'], new_layout)
 
@@ -153,6 +160,28 @@ class ViewsTestCase(TestCase):
         module_0.delete()
         module_1.delete()
 
+    def test_update_dashboard_modules_view_foreign_module(self):
+        module = UserDashboardModule.objects.create(
+            title='',
+            module='jet.dashboard.modules.LinkList',
+            app_label=None,
+            user=self.admin_user.pk + 1,
+            column=0,
+            order=0
+        )
+        response = self.admin.post(reverse('jet-dashboard:update_dashboard_modules'), {
+            'app_label': '',
+            'modules': json.dumps([{'id': module.pk, 'column': 1, 'order': 1}])
+        })
+
+        self.assertEqual(response.status_code, 200)
+        response = json.loads(response.content.decode())
+        self.assertTrue(response['error'])
+
+        module = UserDashboardModule.objects.get(pk=module.pk)
+        self.assertEqual(module.column, 0)
+        self.assertEqual(module.order, 0)
+
     def test_add_user_dashboard_module_view(self):
         response = self.admin.post(reverse('jet-dashboard:add_user_dashboard_module'), {
             'app_label': '',
@@ -166,6 +195,14 @@ class ViewsTestCase(TestCase):
         self.assertNotEqual(response['id'], None)
         module = UserDashboardModule.objects.get(pk=response['id'])
         self.assertNotEqual(module, None)
+        self.assertEqual(UserDashboardModule.objects.filter(user=self.admin_user.pk).count(), 1)
+
+        response = self.admin.post(reverse('jet-dashboard:add_user_dashboard_module'), {
+            'app_label': '',
+            'type': 'children',
+            'module': 100
+        })
+        self.assertTrue(json.loads(response.content.decode())['error'])
 
     def test_add_user_app_dashboard_module_view(self):
         app_label = 'auth'
@@ -211,6 +248,48 @@ class ViewsTestCase(TestCase):
 
         module.delete()
 
+    def test_update_dashboard_modules_collapse_view(self):
+        modules = [
+            UserDashboardModule.objects.create(
+                title='',
+                module='jet.dashboard.modules.LinkList',
+                app_label=None,
+                user=self.admin_user.pk,
+                column=0,
+                order=i
+            ) for i in range(3)
+        ]
+        foreign_module = UserDashboardModule.objects.create(
+            title='',
+            module='jet.dashboard.modules.LinkList',
+            app_label=None,
+            user=self.admin_user.pk + 1,
+            column=0,
+            order=0
+        )
+
+        with self.assertNumQueries(4):
+            response = self.admin.post(reverse('jet-dashboard:update_dashboard_modules_collapse'), {
+                'app_label': '',
+                'modules': json.dumps({modules[0].pk: True, modules[1].pk: False, modules[2].pk: True})
+            })
+        self.assertEqual(response.status_code, 200)
+        response = json.loads(response.content.decode())
+        self.assertFalse(response['error'])
+        self.assertEqual(
+            list(UserDashboardModule.objects.filter(user=self.admin_user.pk).values_list('collapsed', flat=True)),
+            [True, False, True]
+        )
+
+        response = self.admin.post(reverse('jet-dashboard:update_dashboard_modules_collapse'), {
+            'app_label': '',
+            'modules': json.dumps({modules[0].pk: False, foreign_module.pk: True})
+        })
+        response = json.loads(response.content.decode())
+        self.assertTrue(response['error'])
+        self.assertTrue(UserDashboardModule.objects.get(pk=modules[0].pk).collapsed)
+        self.assertFalse(UserDashboardModule.objects.get(pk=foreign_module.pk).collapsed)
+
     def test_remove_dashboard_module_view(self):
         module = UserDashboardModule.objects.create(
             title='',
@@ -225,3 +304,154 @@ class ViewsTestCase(TestCase):
         response = json.loads(response.content.decode())
         self.assertFalse(response['error'])
         self.assertFalse(UserDashboardModule.objects.filter(pk=module.pk).exists())
+
+    def test_load_recent_actions_view(self):
+        module = UserDashboardModule.objects.create(
+            title='',
+            module='jet.dashboard.modules.RecentActions',
+            app_label=None,
+            user=self.admin_user.pk,
+            column=0,
+            order=0,
+            settings={'limit': 2}
+        )
+        action_time = timezone.now()
+
+        for object_repr in ('first', 'second', 'third'):
+            LogEntry.objects.create(
+                user=self.admin_user,
+                content_type=ContentType.objects.get_for_model(User),
+                object_id=str(self.admin_user.pk),
+                object_repr=object_repr,
+                action_flag=CHANGE,
+                action_time=action_time
+            )
+
+        response = self.admin.get(reverse('admin:index'))
+        self.assertContains(response, reverse('jet-dashboard:load_recent_actions', kwargs={'pk': module.pk}))
+
+        response = self.admin.get(reverse('jet-dashboard:load_recent_actions', kwargs={'pk': module.pk}))
+        response = json.loads(response.content.decode())
+        self.assertFalse(response['error'])
+        self.assertIn('third', response['html'])
+        self.assertIn('second', response['html'])
+        self.assertNotIn('first', response['html'])
+
+        response = json.loads(self.admin.get(response['next_url']).content.decode())
+        self.assertFalse(response['error'])
+        self.assertIn('first', response['html'])
+        self.assertNotIn('second', response['html'])
+        self.assertNotIn('next_url', response)
+
+        module.module = 'jet.dashboard.modules.LinkList'
+        module.save()
+        response = self.admin.get(reverse('jet-dashboard:load_recent_actions', kwargs={'pk': module.pk}))
+        self.assertTrue(json.loads(response.content.decode())['error'])
+
+    def test_dashboard_modules_versions_view(self):
+        module = UserDashboardModule.objects.create(
+            title='',
+            module='jet.dashboard.modules.RecentActions',
+            app_label=None,
+            user=self.admin_user.pk,
+            column=0,
+            order=0
+        )
+        link_list = UserDashboardModule.objects.create(
+            title='',
+            module='jet.dashboard.modules.LinkList',
+            app_label=None,
+            user=self.admin_user.pk,
+            column=0,
+            order=1
+        )
+        url = reverse('jet-dashboard:dashboard_modules_versions')
+
+        response = self.admin.get(reverse('admin:index'))
+        self.assertNotContains(response, 'data-version=')
+
+        with mock.patch.object(dashboard_settings, 'JET_DASHBOARD_POLL_INTERVAL', 60):
+            response = self.admin.get(reverse('admin:index'))
+        self.assertContains(response, 'data-version="0"')
+
+        versions = json.loads(self.admin.get(url).content.decode())['versions']
+        self.assertEqual(versions, {str(module.pk): '0', str(link_list.pk): None})
+
+        log_entry = LogEntry.objects.create(
+            user=self.admin_user,
+            content_type=ContentType.objects.get_for_model(User),
+            object_id=str(self.admin_user.pk),
+            object_repr='admin',
+            action_flag=CHANGE
+        )
+
+        versions = json.loads(self.admin.get(url).content.decode())['versions']
+        self.assertEqual(versions[str(module.pk)], str(log_entry.pk))
+
+    def test_load_dashboard_modules_view(self):
+        link_list = UserDashboardModule.objects.create(
+            title='',
+            module='jet.dashboard.modules.LinkList',
+            app_label=None,
+            user=self.admin_user.pk,
+            column=0,
+            order=0
+        )
+        recent_actions = UserDashboardModule.objects.create(
+            title='',
+            module='jet.dashboard.modules.RecentActions',
+            app_label=None,
+            user=self.admin_user.pk,
+            column=0,
+            order=1
+        )
+        other_user = User.objects.create_user('other', 'other@example.com', 'other', is_staff=True)
+        foreign = UserDashboardModule.objects.create(
+            title='',
+            module='jet.dashboard.modules.LinkList',
+            app_label=None,
+            user=other_user.pk,
+            column=0,
+            order=0
+        )
+        url = reverse('jet-dashboard:load_dashboard_modules')
+
+        response = self.admin.get(url, {'id': [link_list.pk, recent_actions.pk, foreign.pk]})
+        response = json.loads(response.content.decode())
+        self.assertFalse(response['error'])
+        self.assertEqual(set(response['modules']), {str(link_list.pk), str(recent_actions.pk)})
+        self.assertIn('None available', response['modules'][str(recent_actions.pk)])
+
+        with mock.patch.object(dashboard_settings, 'JET_DASHBOARD_MODULES_WORKERS', 2):
+            response = json.loads(self.admin.get(url, {'id': [link_list.pk, foreign.pk]}).content.decode())
+        self.assertEqual(set(response['modules']), {str(link_list.pk)})
+
+        with mock.patch.object(RecentActions, 'init_with_context', side_effect=RuntimeError):
+            for workers in (0, 2):
+                with mock.patch.object(dashboard_settings, 'JET_DASHBOARD_MODULES_WORKERS', workers), \
+                        self.assertLogs('jet.dashboard.views', 'ERROR'):
+                    response = self.admin.get(url, {'id': [link_list.pk, recent_actions.pk]})
+                response = json.loads(response.content.decode())
+                self.assertFalse(response['error'])
+                self.assertIsNotNone(response['modules'][str(link_list.pk)])
+                self.assertIsNone(response['modules'][str(recent_actions.pk)])
+                self.assertEqual(response['pending'], [])
+
+        with mock.patch.object(RecentActions, 'init_with_context', side_effect=lambda context: time.sleep(0.3)), \
+                mock.patch.object(dashboard_settings, 'JET_DASHBOARD_MODULES_WORKERS', 2), \
+                mock.patch.object(dashboard_settings, 'JET_DASHBOARD_MODULES_TIMEOUT', 0.1):
+            response = json.loads(self.admin.get(url, {'id': [link_list.pk, recent_actions.pk]}).content.decode())
+        self.assertEqual(set(response['modules']), {str(link_list.pk)})
+        self.assertEqual(response['pending'], [recent_actions.pk])
+
+    @override_settings(MIDDLEWARE=settings.MIDDLEWARE + ('jet.middleware.SiblingLinksPrefetchMiddleware',))
+    def test_sibling_links_prefetch_middleware(self):
+        url = reverse('admin:index')
+
+        response = self.admin.get(url)
+        self.assertIn('no-store', response['Cache-Control'])
+
+        response = self.admin.get(url, HTTP_SEC_PURPOSE='prefetch')
+        self.assertNotIn('no-store', response['Cache-Control'])
+        self.assertIn('max-age=30', response['Cache-Control'])
+        self.assertNotIn('Expires', response)
@@ -2,6 +2,8 @@ from django.conf.urls import include
 from django.contrib import admin
 from django.urls import path, re_path
 
+from jet.dashboard.dashboard_modules import yandex_metrika_views  # noqa: F401
+
 admin.autodiscover()
 
 urlpatterns = [
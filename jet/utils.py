@@ -1,11 +1,16 @@
 import datetime
+import hashlib
 import json
+import uuid
 from collections import OrderedDict
+from urllib.parse import parse_qsl
 
 from django.apps.registry import apps
 from django.contrib import admin, messages
 from django.contrib.admin import AdminSite
 from django.contrib.admin.options import IncorrectLookupParameters
+from django.contrib.admin.sites import all_sites
+from django.core.cache import cache
 from django.template import Context
 from django.urls import NoReverseMatch, resolve, reverse
 from django.utils import translation
@@ -18,10 +23,52 @@ from jet import settings
 from jet.models import PinnedApplication
 
 
+def get_request_memo(request):
+    """
+    Returns ``dict`` bound to the request object. It lives as long as the request does, so values
+    which stay the same during the request can be computed only once.
+    """
+    memo = getattr(request, "_jet_memo", None)
+
+    if memo is None:
+        memo = {}
+        request._jet_memo = memo
+
+    return memo
+
+
+def request_memoize(request, key, func, *args, **kwargs):
+    """
+    Returns ``func(*args, **kwargs)`` result stored in request memo under ``key``,
+    calling ``func`` only the first time during the request.
+    """
+    if request is None:
+        return func(*args, **kwargs)
+
+    memo = get_request_memo(request)
+
+    if key not in memo:
+        memo[key] = func(*args, **kwargs)
+
+    return memo[key]
+
+
+def clear_request_memo(request):
+    request.__dict__.pop("_jet_memo", None)
+
+
 def get_app_list(context, order=True):
     admin_site = get_admin_site(context)
     request = context["request"]
+    app_list = request_memoize(
+        request, ("jet.app_list", admin_site.name, order), build_app_list, admin_site, request, order
+    )
 
+    # Callers filter apps and models in place, so each gets its own copy
+    return [dict(app, models=[dict(model) for model in app["models"]]) for app in app_list]
+
+
+def build_app_list(admin_site, request, order=True):
     app_dict = {}
     for model, model_admin in admin_site._registry.items():
         app_label = model._meta.app_label
@@ -84,8 +131,17 @@ def get_app_list(context, order=True):
 
 
 def get_admin_site(context):
+    request = context.get("request")
+
+    if request is None:
+        return resolve_admin_site(request)
+
+    return request_memoize(request, "jet.admin_site", resolve_admin_site, request)
+
+
+def resolve_admin_site(request):
     try:
-        current_resolver = resolve(context.get("request").path)
+        current_resolver = resolve(request.path)
         index_resolver = resolve(reverse("%s:index" % current_resolver.namespaces[0]))
 
         if hasattr(index_resolver.func, "admin_site"):
@@ -211,6 +267,106 @@ def get_model_queryset(admin_site, model, request, preserved_filters=None):
     return queryset
 
 
+class SiblingPksWindow:
+    """
+    Slice of the ordered changelist pks around a particular object, ``start`` is the position of the first pk
+    inside the whole changelist of ``total`` objects.
+    """
+
+    def __init__(self, pks, start=0, total=None):
+        self.pks = pks
+        self.start = start
+        self.total = len(pks) if total is None else total
+
+    def covers(self, pk):
+        try:
+            index = self.pks.index(pk)
+        except ValueError:
+            return False
+
+        has_previous = index > 0 or self.start == 0
+        has_next = index < len(self.pks) - 1 or self.start + len(self.pks) >= self.total
+
+        return has_previous and has_next
+
+    def get_sibling(self, pk, next):
+        try:
+            index = self.pks.index(pk)
+        except ValueError:
+            return None
+
+        sibling_index = index + 1 if next else index - 1
+
+        if 0 <= sibling_index < len(self.pks):
+            return self.pks[sibling_index]
+
+
+def get_sibling_pks_version_key(model):
+    return "jet.sibling_pks.version.%s" % model._meta.label_lower
+
+
+def get_sibling_pks_cache_key(admin_site, model, request, preserved_filters_plain):
+    version_key = get_sibling_pks_version_key(model)
+    version = cache.get(version_key)
+
+    if version is None:
+        cache.add(version_key, uuid.uuid4().hex, None)
+        version = cache.get(version_key)
+
+    filters_hash = hashlib.md5(preserved_filters_plain.encode("utf-8")).hexdigest()
+
+    return "jet.sibling_pks.%s.%s.%s.%s.%s" % (
+        admin_site.name,
+        model._meta.label_lower,
+        request.user.pk,
+        version,
+        filters_hash,
+    )
+
+
+def is_registered_in_admin(model):
+    return any(admin_site.is_registered(model) for admin_site in all_sites)
+
+
+def invalidate_sibling_pks_cache(sender, **kwargs):
+    # sibling links are only shown for models registered in admin, other models are not cached
+    if settings.JET_CHANGE_FORM_SIBLING_LINKS_CACHE_TIMEOUT and is_registered_in_admin(sender):
+        cache.delete(get_sibling_pks_version_key(sender))
+
+
+def get_sibling_pks_window(admin_site, model, request, pk, preserved_filters_plain=""):
+    cache_timeout = settings.JET_CHANGE_FORM_SIBLING_LINKS_CACHE_TIMEOUT
+    cache_key = None
+
+    if cache_timeout:
+        cache_key = get_sibling_pks_cache_key(admin_site, model, request, preserved_filters_plain)
+        cached = cache.get(cache_key)
+
+        if cached is not None:
+            window = SiblingPksWindow(*cached)
+
+            if window.covers(pk):
+                return window
+
+    preserved_filters = dict(parse_qsl(preserved_filters_plain))
+    queryset = get_model_queryset(admin_site, model, request, preserved_filters=preserved_filters)
+
+    if queryset is None:
+        return
+
+    object_pks = list(queryset.values_list("pk", flat=True))
+
+    if cache_key is None or pk not in object_pks:
+        return SiblingPksWindow(object_pks)
+
+    size = max(settings.JET_CHANGE_FORM_SIBLING_LINKS_CACHE_WINDOW, 3)
+    start = max(object_pks.index(pk) - size // 2, 0)
+    window = SiblingPksWindow(object_pks[start : start + size], start, len(object_pks))
+    cache.set(cache_key, (window.pks, window.start, window.total), cache_timeout)
+
+    return window
+
+
 def get_possible_language_codes():
     language_code = translation.get_language()
 
@@ -231,12 +387,21 @@ def get_possible_language_codes():
     return language_codes
 
 
-def get_original_menu_items(context):
-    if context.get("user") and user_is_authenticated(context["user"]):
-        pinned_apps = PinnedApplication.objects.filter(user=context["user"].pk).values_list("app_label", flat=True)
-    else:
-        pinned_apps = []
+def get_pinned_app_labels(context):
+    user = context.get("user")
+
+    if not user or not user_is_authenticated(user):
+        return frozenset()
 
+    return request_memoize(
+        context.get("request"),
+        ("jet.pinned_apps", user.pk),
+        lambda: frozenset(PinnedApplication.objects.filter(user=user.pk).values_list("app_label", flat=True)),
+    )
+
+
+def get_original_menu_items(context):
+    pinned_apps = get_pinned_app_labels(context)
     original_app_list = get_app_list(context)
 
     return (
@@ -280,7 +445,7 @@ def get_menu_item_url(url, original_app_list):
 
 
 def get_menu_items(context):
-    pinned_apps = PinnedApplication.objects.filter(user=context["user"].pk).values_list("app_label", flat=True)
+    pinned_apps = get_pinned_app_labels(context)
     original_app_list = OrderedDict(((app["app_label"], app) for app in get_original_menu_items(context)))
     custom_app_list = settings.JET_SIDE_MENU_ITEMS
     custom_app_list_deprecated = settings.JET_SIDE_MENU_CUSTOM_APPS